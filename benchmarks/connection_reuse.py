@@ -0,0 +1,126 @@
+"""Benchmark connection reuse against a local HTTPS fake of the Jotform API.
+
+Syncs forms and the questions of every form, comparing per-stream sessions with
+default connection pools against the transport shared by all streams of the tap.
+Reports the wall time and the number of TLS connections opened.
+
+Run with ``python -m benchmarks.connection_reuse``. Requires ``cryptography`` to
+create a self-signed certificate.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import io
+import ipaddress
+import ssl
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import override
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from tap_jotform.tap import TapJotform
+from tests.fake_jotform import FakeJotform, make_form, make_questions
+
+FORMS = 300
+CONCURRENCY = 16
+
+
+class PerStreamTap(TapJotform):
+    """Tap where each stream has its own default connection pool, as before."""
+
+    @override
+    @property
+    def http_adapter(self) -> BaseAdapter:
+        return HTTPAdapter()
+
+
+def write_certificate(directory: Path) -> tuple[Path, Path]:
+    """Write a self-signed certificate for 127.0.0.1 and return its paths."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = dt.datetime.now(tz=dt.UTC)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + dt.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [x509.IPAddress(ipaddress.ip_address("127.0.0.1"))],
+            ),
+            critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = directory / "cert.pem"
+    key_path = directory / "key.pem"
+    cert_path.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ),
+    )
+    return cert_path, key_path
+
+
+def measure(tap_class: type[TapJotform], api: FakeJotform, ca: Path) -> float:
+    """Sync forms and questions and return the elapsed seconds."""
+    tap = tap_class(
+        config={
+            "api_key": "benchmark",
+            "api_url": api.url,
+            "include_deprecated_streams": False,
+            "max_concurrent_requests": CONCURRENCY,
+        },
+        parse_env_config=False,
+    )
+    for stream in tap.streams.values():
+        stream.requests_session.verify = str(ca)  # type: ignore[attr-defined]
+
+    api.connections = 0
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        tap.sync_all()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    with tempfile.TemporaryDirectory() as directory:
+        cert_path, key_path = write_certificate(Path(directory))
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(cert_path, key_path)
+
+        api = FakeJotform(ssl_context=context)
+        api.forms = [make_form(i) for i in range(FORMS)]
+        api.questions = {form["id"]: make_questions(5) for form in api.forms}
+        api.start()
+        try:
+            for label, tap_class in (
+                ("before", PerStreamTap),
+                ("after ", TapJotform),
+            ):
+                elapsed = measure(tap_class, api, cert_path)
+                print(  # noqa: T201
+                    f"{label}: {elapsed:.2f}s, {api.connections} TLS connections",
+                )
+        finally:
+            api.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark writing RECORD messages of synthetic submissions.
+
+Compares the SDK output path, which conforms every record by walking the schema,
+encodes it with ``simplejson`` and flushes stdout after every message, with the
+fast output mode.
+
+Run with ``python -m benchmarks.output [RECORDS]``. Defaults to a million
+submissions.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+from tap_jotform.tap import TapJotform
+from tests.fake_jotform import make_submission
+
+if TYPE_CHECKING:
+    from tap_jotform.output import BufferedWriter
+
+RECORDS = 1_000_000
+ANSWERS = 20
+CHUNK = 10_000
+
+
+def measure(config: dict[str, Any], records: int) -> float:
+    """Return the records per second written to stdout."""
+    tap = TapJotform(
+        config={"api_key": "benchmark", **config},
+        parse_env_config=False,
+    )
+    stream = tap.streams["submissions"]
+    writer = cast("BufferedWriter", tap.message_writer)
+    elapsed = 0.0
+    with Path(os.devnull).open("w") as sink, redirect_stdout(sink):
+        for chunk in range(0, records, CHUNK):
+            rows = [
+                row
+                for index in range(chunk, min(chunk + CHUNK, records))
+                if (row := stream.post_process(make_submission(index, answers=ANSWERS)))
+            ]
+            start = time.perf_counter()
+            for row in rows:
+                stream._write_record_message(row)  # noqa: SLF001
+            writer.flush()
+            elapsed += time.perf_counter() - start
+    return records / elapsed
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else RECORDS
+    before = measure({}, records)
+    after = measure({"fast_output": {"enabled": True}}, records)
+    print(f"before: {before:,.0f} records/s")  # noqa: T201
+    print(f"after:  {after:,.0f} records/s ({after / before:.1f}x)")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark response parsing over synthetic submission pages.
+
+Compares the previous parsing path, which decoded every body twice and extracted
+records through JSONPath, with the current single decode.
+
+Run with ``python -m benchmarks.parse_response``.
+"""
+
+from __future__ import annotations
+
+import decimal
+import time
+from typing import TYPE_CHECKING, Any
+
+import requests
+from singer_sdk.helpers.jsonpath import extract_jsonpath
+
+from tap_jotform.tap import TapJotform
+from tests.fake_jotform import make_page, make_submission
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+PAGES = 20
+PAGE_SIZE = 100
+
+
+def make_response(body: bytes) -> requests.Response:
+    """Wrap a body in a response object."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body  # noqa: SLF001
+    return response
+
+
+def legacy_parse(response: requests.Response) -> Iterable[dict[str, Any]]:
+    """Parse a response the way the tap did before decoding bodies once."""
+    _ = response.json()["limit-left"]
+    return extract_jsonpath(
+        "$.content[*]",
+        input=response.json(parse_float=decimal.Decimal),
+    )
+
+
+def measure(
+    parse: Callable[[requests.Response], Iterable[dict[str, Any]]],
+    bodies: list[bytes],
+) -> float:
+    """Return the records per second parsed from the given bodies."""
+    count = 0
+    start = time.perf_counter()
+    for body in bodies:
+        count += sum(1 for _ in parse(make_response(body)))
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    bodies = [
+        make_page(
+            [
+                make_submission(page * PAGE_SIZE + i, answers=50)
+                for i in range(PAGE_SIZE)
+            ],
+        )
+        for page in range(PAGES)
+    ]
+    tap = TapJotform(config={"api_key": "benchmark"}, parse_env_config=False)
+    stream = tap.streams["submissions"]
+
+    before = measure(legacy_parse, bodies)
+    after = measure(stream.parse_response, bodies)
+    print(f"before: {before:,.0f} records/s")  # noqa: T201
+    print(f"after:  {after:,.0f} records/s ({after / before:.1f}x)")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
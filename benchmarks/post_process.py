@@ -0,0 +1,79 @@
+"""Benchmark post-processing of submissions over synthetic pages.
+
+Compares the previous per-answer transform with the current one, with the
+deprecated ``answer`` string selected and deselected.
+
+Run with ``python -m benchmarks.post_process``.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import time
+from typing import TYPE_CHECKING, Any, cast
+
+from tap_jotform.streams import DEPRECATED_ANSWER_BREADCRUMB, SubmissionsStream
+from tap_jotform.tap import TapJotform
+from tests.fake_jotform import make_submission
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+RECORDS = 5000
+ANSWERS = 50
+
+
+def legacy_post_process(row: dict[str, Any]) -> dict[str, Any]:
+    """Post-process a submission the way the tap did before transform plans."""
+    for field in SubmissionsStream.INTEGER_FIELDS:
+        value = row.get(field)
+        row[field] = int(value) if value else None
+    row["updated_at"] = row["updated_at"] or row["created_at"]
+
+    answers_list = []
+    answers: dict[str, dict[str, Any]] = row.pop("answers", {})
+    for qid, entry in answers.items():
+        answer = entry.get("answer")
+        entry["answer"] = json.dumps(answer) if answer is not None else None
+        entry["answer_object"] = answer
+        answers_list.append({"qid": qid, **entry})
+    row["answers"] = answers_list
+    return row
+
+
+def measure(
+    post_process: Callable[[dict[str, Any]], dict[str, Any] | None],
+    rows: list[dict[str, Any]],
+) -> float:
+    """Return the records per second post-processed."""
+    rows = copy.deepcopy(rows)
+    start = time.perf_counter()
+    for row in rows:
+        post_process(row)
+    return len(rows) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    rows = [make_submission(i, answers=ANSWERS) for i in range(RECORDS)]
+    tap = TapJotform(config={"api_key": "benchmark"}, parse_env_config=False)
+    stream = cast("SubmissionsStream", tap.streams["submissions"])
+
+    before = measure(legacy_post_process, rows)
+    after = measure(stream.post_process, rows)
+
+    stream.mask[DEPRECATED_ANSWER_BREADCRUMB] = False
+    del stream.answers_transform
+    deselected = measure(stream.post_process, rows)
+
+    print(f"before:              {before:,.0f} records/s")  # noqa: T201
+    print(f"after:               {after:,.0f} records/s ({after / before:.1f}x)")  # noqa: T201
+    print(  # noqa: T201
+        f"`answer` deselected: {deselected:,.0f} records/s "
+        f"({deselected / before:.1f}x)",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Record responses of the live Jotform API to a fixture file.
+
+The fixture holds the ``content`` of ``/user/forms``, ``/user/submissions`` and
+the ``/form/{id}/questions`` of every form, and can be served by the fake API,
+e.g. with ``python -m benchmarks.run --fixtures fixtures.json``. Records may hold
+personal data, so fixtures should not be committed unless they are anonymized.
+
+Run with ``TAP_JOTFORM_API_KEY=... python -m benchmarks.record fixtures.json``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import requests
+
+PAGE_SIZE = 1000
+TIMEOUT = 300
+
+
+def fetch(session: requests.Session, url: str, **params: Any) -> Any:  # noqa: ANN401
+    """Request an API endpoint and return the ``content`` of the response."""
+    response = session.get(url, params=params, timeout=TIMEOUT)
+    response.raise_for_status()
+    return response.json()["content"]
+
+
+def fetch_all(
+    session: requests.Session,
+    url: str,
+    max_records: int,
+) -> list[dict[str, Any]]:
+    """Request the pages of a list endpoint, up to a number of records."""
+    records: list[dict[str, Any]] = []
+    while len(records) < max_records:
+        page = fetch(
+            session,
+            url,
+            limit=min(PAGE_SIZE, max_records - len(records)),
+            offset=len(records),
+            orderby="created_at",
+        )
+        records.extend(page)
+        if not page:
+            break
+    return records
+
+
+def main() -> None:
+    """Record the fixture file."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--api-url", default="https://api.jotform.com")
+    parser.add_argument("--max-forms", type=int, default=100)
+    parser.add_argument("--max-submissions", type=int, default=10000)
+    args = parser.parse_args()
+
+    session = requests.Session()
+    session.headers["APIKEY"] = os.environ["TAP_JOTFORM_API_KEY"]
+    forms = fetch_all(session, f"{args.api_url}/user/forms", args.max_forms)
+    fixtures = {
+        "forms": forms,
+        "submissions": fetch_all(
+            session,
+            f"{args.api_url}/user/submissions",
+            args.max_submissions,
+        ),
+        "questions": {
+            form["id"]: fetch(session, f"{args.api_url}/form/{form['id']}/questions")
+            for form in forms
+        },
+    }
+    args.output.write_text(json.dumps(fixtures))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""Benchmark stream syncs against a local fake of the Jotform API.
+
+Each stream is synced on its own, with only that stream selected, and reported
+with its records per second, the requests and response bytes it took, including
+those of parent streams, and the peak memory allocated by Python. Peak memory is
+traced in a second sync so tracing does not slow down the timed one.
+
+The fake API serves synthetic records of a configurable size, or records from a
+fixture file written by ``benchmarks.record``, with a configurable latency.
+Tap settings can be passed to compare tuning options, and results can be saved
+and compared against a baseline to catch regressions, e.g.::
+
+    python -m benchmarks.run --output base.json
+    python -m benchmarks.run --baseline base.json --config '{"streaming_parse": true}'
+
+Run with ``python -m benchmarks.run --help`` for all options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any
+
+from singer_sdk.metrics import Metric, Point, get_metrics_logger
+
+from tap_jotform.tap import TapJotform
+from tests.fake_jotform import FakeJotform, make_dataset
+
+DEFAULT_STREAMS = ("forms", "questions", "submissions", "submission_answers")
+
+
+class RecordCounter(logging.Handler):
+    """Sum the record counts logged by the metrics logger per stream."""
+
+    def __init__(self) -> None:
+        """Initialize the handler."""
+        super().__init__()
+        self.counts: dict[str, int] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Add the value of a record count point."""
+        point = record.args[0] if isinstance(record.args, tuple) else None
+        if isinstance(point, Point) and point.metric == Metric.RECORD_COUNT:
+            stream = point.tags.get("stream", "")
+            self.counts[stream] = self.counts.get(stream, 0) + point.value
+
+
+def select_only(catalog: dict[str, Any], stream: str) -> dict[str, Any]:
+    """Select a single stream in a catalog."""
+    for entry in catalog["streams"]:
+        for metadata in entry["metadata"]:
+            if metadata["breadcrumb"] == []:
+                metadata["metadata"]["selected"] = entry["tap_stream_id"] == stream
+    return catalog
+
+
+def make_tap(api: FakeJotform, stream: str, config: dict[str, Any]) -> TapJotform:
+    """Create a tap that only syncs a single stream from the fake API."""
+    config = {"api_key": "benchmark", "api_url": api.url, **config}
+    catalog = TapJotform(config=config, parse_env_config=False).catalog_dict
+    return TapJotform(
+        config=config,
+        catalog=select_only(catalog, stream),
+        parse_env_config=False,
+    )
+
+
+def sync(tap: TapJotform, stream: str) -> int:
+    """Run a sync and return the number of records written for a stream."""
+    counter = RecordCounter()
+    logger = get_metrics_logger()
+    logger.addHandler(counter)
+    try:
+        with Path(os.devnull).open("w") as sink, redirect_stdout(sink):
+            tap.sync_all()
+    finally:
+        logger.removeHandler(counter)
+    return counter.counts.get(stream, 0)
+
+
+def measure(api: FakeJotform, stream: str, config: dict[str, Any]) -> dict[str, Any]:
+    """Sync a stream twice and return its throughput, traffic and peak memory."""
+    tap = make_tap(api, stream, config)
+    requests, bytes_sent = len(api.requests), api.bytes_sent
+    start = time.perf_counter()
+    records = sync(tap, stream)
+    elapsed = time.perf_counter() - start
+    requests, bytes_sent = len(api.requests) - requests, api.bytes_sent - bytes_sent
+
+    tap = make_tap(api, stream, config)
+    tracemalloc.start()
+    try:
+        sync(tap, stream)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "records": records,
+        "seconds": round(elapsed, 3),
+        "records_per_second": round(records / elapsed, 1),
+        "requests": requests,
+        "bytes": bytes_sent,
+        "peak_memory": peak,
+    }
+
+
+def regressions(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    tolerance: float,
+) -> list[str]:
+    """Compare results against a baseline and describe every regression."""
+    found = []
+    for stream, result in results.items():
+        if not (expected := baseline.get(stream)):
+            continue
+        if result["records_per_second"] < expected["records_per_second"] * (
+            1 - tolerance
+        ):
+            found.append(
+                f"{stream}: {result['records_per_second']:,.0f} records/s, "
+                f"baseline {expected['records_per_second']:,.0f}",
+            )
+        found.extend(
+            f"{stream}: {key} {result[key]:,}, baseline {expected[key]:,}"
+            for key in ("requests", "bytes", "peak_memory")
+            if result[key] > expected[key] * (1 + tolerance)
+        )
+    return found
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--streams", nargs="+", default=list(DEFAULT_STREAMS))
+    parser.add_argument("--forms", type=int, default=20)
+    parser.add_argument("--submissions-per-form", type=int, default=250)
+    parser.add_argument("--questions-per-form", type=int, default=20)
+    parser.add_argument(
+        "--fixtures",
+        type=Path,
+        help="Serve records from this fixture file instead of synthetic ones",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Seconds to wait before answering each request",
+    )
+    parser.add_argument(
+        "--config",
+        type=json.loads,
+        default={},
+        help="Tap settings as a JSON object",
+    )
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Fail if results regress from the results in this file",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed relative regression from the baseline",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmark and print the results."""
+    args = parse_args(argv)
+    api = FakeJotform(fixtures=args.fixtures, latency=args.latency)
+    if args.fixtures is None:
+        dataset = make_dataset(
+            args.forms,
+            submissions_per_form=args.submissions_per_form,
+            questions_per_form=args.questions_per_form,
+        )
+        api.forms = dataset["forms"]
+        api.submissions = dataset["submissions"]
+        api.questions = dataset["questions"]
+
+    api.start()
+    try:
+        results = {stream: measure(api, stream, args.config) for stream in args.streams}
+    finally:
+        api.stop()
+
+    print(  # noqa: T201
+        f"{'stream':<20} {'records':>9} {'records/s':>11} {'requests':>9} "
+        f"{'bytes':>13} {'peak memory':>13}",
+    )
+    for stream, result in results.items():
+        print(  # noqa: T201
+            f"{stream:<20} {result['records']:>9,} "
+            f"{result['records_per_second']:>11,.0f} {result['requests']:>9,} "
+            f"{result['bytes']:>13,} {result['peak_memory']:>13,}",
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        if found := regressions(results, baseline, args.tolerance):
+            print("Regressions:", *found, sep="\n  ", file=sys.stderr)  # noqa: T201
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -94,5 +94,26 @@ def tests(session: nox.Session) -> None:
     session.run("pytest", *session.posargs)
 
 
+@nox.session(default=False)
+def benchmarks(session: nox.Session) -> None:
+    """Run the offline benchmarks."""
+    env = {
+        "UV_PROJECT_ENVIRONMENT": session.virtualenv.location,
+    }
+    if isinstance(session.python, str):
+        env["UV_PYTHON"] = session.python
+
+    session.run_install(
+        *UV_SYNC_COMMAND,
+        "--group=testing",
+        env=env,
+    )
+    # Used by the connection_reuse benchmark to create a TLS certificate
+    session.install("cryptography")
+    modules = session.posargs or ["parse_response", "run"]
+    for module in modules:
+        session.run("python", "-m", f"benchmarks.{module}")
+
+
 if __name__ == "__main__":
     nox.main()
@@ -0,0 +1,61 @@
+"""Batch files of records, for Singer BATCH messages."""
+
+from __future__ import annotations
+
+import gzip
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, override
+from uuid import uuid4
+
+from singer_sdk.batch import BaseBatcher, lazy_chunked_generator
+
+from tap_jotform import encoding
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+#: Streams written to batch files by default when BATCH messages are enabled. Child
+#: streams are left out, as they write at least one file per parent record
+BATCH_STREAMS = ("forms", "submissions")
+
+# Level of zlib by default, much faster than the maximum level used by gzip
+COMPRESS_LEVEL = 6
+
+
+def parquet_available() -> bool:
+    """Return whether the optional Parquet writer is installed."""
+    return find_spec("pyarrow") is not None
+
+
+class JSONLinesBatcher(BaseBatcher):
+    """Write records to JSON Lines batch files of ``batch_size`` records.
+
+    The files are the same as those of the SDK batcher, with records encoded like
+    messages in the fast output mode. They are compressed with gzip, unless the
+    compression of the encoding is ``none``.
+    """
+
+    @override
+    def get_batches(self, records: Iterator[dict[str, Any]]) -> Iterator[list[str]]:
+        sync_id = f"{self.tap_name}--{self.stream_name}-{uuid4()}"
+        storage = self.batch_config.storage
+        prefix = storage.prefix or ""
+        compress = self.batch_config.encoding.compression != "none"
+        extension = ".json.gz" if compress else ".json"
+
+        for i, chunk in enumerate(
+            lazy_chunked_generator(records, self.batch_config.batch_size),
+            start=1,
+        ):
+            filename = f"{prefix}{sync_id}-{i}{extension}"
+            with storage.open(filename, "wb") as file:
+                if compress:
+                    with gzip.GzipFile(
+                        fileobj=file,
+                        mode="wb",
+                        compresslevel=COMPRESS_LEVEL,
+                    ) as gz:
+                        gz.writelines(map(encoding.dumps_line, chunk))
+                else:
+                    file.writelines(map(encoding.dumps_line, chunk))
+            yield [storage.get_url(filename)]
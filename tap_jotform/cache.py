@@ -0,0 +1,119 @@
+"""HTTP response caching for tap-jotform."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, override
+
+import requests_cache
+from requests_cache.backends.base import BaseCache, DictStorage
+from requests_cache.policy.settings import DEFAULT_IGNORED_PARAMS
+
+if TYPE_CHECKING:
+    import requests
+
+# The API key is sent in the APIKEY header. It is left out of cache keys and
+# redacted from cached requests.
+IGNORED_PARAMETERS = (*DEFAULT_IGNORED_PARAMS, "APIKEY")
+
+
+class LRUStorage(DictStorage):
+    """In-memory storage that evicts the least recently used items.
+
+    Args:
+        max_entries: Maximum number of items to keep.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize the storage."""
+        super().__init__()  # type: ignore[no-untyped-call]
+        self.data: OrderedDict[str, Any] = OrderedDict()
+        self.max_entries = max_entries
+
+    @override
+    def __getitem__(self, key: str) -> Any:
+        item = super().__getitem__(key)  # type: ignore[no-untyped-call]
+        self.data.move_to_end(key)
+        return item
+
+    @override
+    def __setitem__(self, key: str, item: Any) -> None:
+        super().__setitem__(key, item)
+        self.data.move_to_end(key)
+        while len(self.data) > self.max_entries:
+            self.data.popitem(last=False)
+
+
+class LRUCache(BaseCache):
+    """In-memory cache backend bounded to a number of responses.
+
+    Args:
+        cache_name: Cache namespace.
+        max_entries: Maximum number of responses to keep.
+        kwargs: Additional backend keyword arguments.
+    """
+
+    def __init__(
+        self,
+        cache_name: str = "http_cache",
+        *,
+        max_entries: int,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the backend."""
+        super().__init__(cache_name, **kwargs)
+        self.responses = LRUStorage(max_entries)
+        self.redirects = LRUStorage(max_entries)
+
+
+def create_session(
+    cache_config: dict[str, Any],
+    stream_name: str,
+) -> requests_cache.CachedSession:
+    """Create a cached session from the ``requests_cache`` setting.
+
+    Args:
+        cache_config: Value of the ``requests_cache`` setting.
+        stream_name: Name of the stream the session is for, used to look up its
+            expiration time in ``stream_expire_after``.
+
+    Returns:
+        A cached session.
+    """
+    options: dict[str, Any] = {
+        "ignored_parameters": IGNORED_PARAMETERS,
+        **cache_config.get("config", {}),
+    }
+    stream_expire_after = cache_config.get("stream_expire_after") or {}
+    if stream_name in stream_expire_after:
+        options["expire_after"] = stream_expire_after[stream_name]
+
+    max_entries = cache_config.get("max_entries")
+    if options.get("backend") == "memory" and max_entries:
+        options["backend"] = LRUCache(
+            options.pop("cache_name", "http_cache"),
+            max_entries=max_entries,
+        )
+
+    return requests_cache.CachedSession(**options)
+
+
+def cache_costs(response: requests.Response) -> dict[str, int]:
+    """Return the cache hits, misses and bytes saved by a response.
+
+    Responses revalidated with a conditional request count as hits, since their
+    body was not downloaded again.
+
+    Args:
+        response: A response returned by a cached session.
+
+    Returns:
+        Sync costs for the response.
+    """
+    if getattr(response, "from_cache", False):
+        return {
+            "cache_hits": 1,
+            "cache_misses": 0,
+            "cache_bytes_saved": len(response.content),
+        }
+    return {"cache_hits": 0, "cache_misses": 1, "cache_bytes_saved": 0}
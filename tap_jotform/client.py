@@ -2,22 +2,164 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, override
+import datetime as dt
+import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
+from http import HTTPStatus
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast, override
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
 import requests
-import requests_cache
+from singer_sdk import singerlib
 from singer_sdk.authenticators import APIKeyAuthenticator
-from singer_sdk.pagination import OffsetPaginator
+from singer_sdk.batch import Batcher
+from singer_sdk.helpers._batch import BaseBatchFileEncoding, BatchFileFormat
+from singer_sdk.helpers._catalog import pop_deselected_record_properties
+from singer_sdk.helpers._typing import conform_record_data_types
+from singer_sdk.helpers._util import utc_now
+from singer_sdk.helpers.conform import TypeConformanceLevel
+from singer_sdk.pagination import OffsetPaginator, SinglePagePaginator
+from singer_sdk.singerlib.catalog import REPLICATION_INCREMENTAL
 from singer_sdk.streams import RESTStream
 
+from tap_jotform import encoding
+from tap_jotform.batch import BATCH_STREAMS, JSONLinesBatcher, parquet_available
+from tap_jotform.cache import cache_costs, create_session
+from tap_jotform.dedup import DEFAULT_MAX_ENTRIES, RecordIndex
+from tap_jotform.output import RecordConformer
+from tap_jotform.resilience import Hedger
+from tap_jotform.streaming import ContentParser
+
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable, Iterator, Mapping, Sequence
 
+    import requests_cache
+    from backoff.types import Details
+    from singer_sdk import Stream
+    from singer_sdk.batch import BaseBatcher
+    from singer_sdk.helpers._batch import BatchConfig
     from singer_sdk.helpers.types import Context, Record
 
+    from tap_jotform.forms import FormIndex
+    from tap_jotform.instrumentation import Instrumentation
+    from tap_jotform.ratelimit import QuotaScheduler
+    from tap_jotform.resilience import RetryPolicy
+    from tap_jotform.tap import TapJotform
+
+MAX_PAGE_SIZE = 1000
+FILTER_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_DONE = object()
+
+
+def date_windows(
+    start: dt.datetime,
+    end: dt.datetime,
+    step: dt.timedelta,
+) -> list[tuple[dt.datetime, dt.datetime]]:
+    """Split a date range into consecutive windows of at most ``step``."""
+    windows = []
+    while start < end:
+        windows.append((start, min(start + step, end)))
+        start += step
+    return windows
+
+
+def _put(items: queue.Queue[Any], item: Any, stop: threading.Event) -> bool:  # noqa: ANN401
+    """Put an item in a bounded queue unless the consumer has stopped."""
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=0.1)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _descendants(stream: Stream) -> Iterator[Stream]:
+    for child in stream.child_streams:
+        yield child
+        yield from _descendants(child)
+
+
+def get_query_param(request: requests.PreparedRequest, name: str) -> str | None:
+    """Return the value of a query parameter of a request."""
+    return dict(parse_qsl(urlsplit(request.url or "").query)).get(name)
+
+
+def set_query_param(request: requests.PreparedRequest, name: str, value: str) -> None:
+    """Set the value of a query parameter of a request in place."""
+    url = urlsplit(request.url or "")
+    query = dict(parse_qsl(url.query))
+    query[name] = value
+    request.url = url._replace(query=urlencode(query)).geturl()
+
 
 class JotformPaginator(OffsetPaginator):
-    """Jotform pagination class."""
+    """Jotform pagination class.
+
+    The next offset is computed from the ``limit`` that was actually requested, so
+    the page size can change between requests.
+    """
+
+    @override
+    def get_next(self, response: requests.Response) -> int | None:
+        limit = get_query_param(response.request, "limit")
+        offset = get_query_param(response.request, "offset")
+        if limit is None:
+            return super().get_next(response)
+        return int(offset or 0) + int(limit)
+
+
+class PageSizer:
+    """Adapt the page size of a stream to response latency and size.
+
+    The page size doubles while responses are well within the targets, halves when
+    they exceed them and is halved as well on timeouts and server errors.
+
+    Args:
+        initial: Initial page size.
+        minimum: Smallest page size.
+        maximum: Largest page size.
+        target_seconds: Target response time in seconds.
+        target_bytes: Target response body size in bytes.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        *,
+        minimum: int,
+        maximum: int,
+        target_seconds: float,
+        target_bytes: int,
+    ) -> None:
+        """Initialize the page sizer."""
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_seconds = target_seconds
+        self.target_bytes = target_bytes
+        self.size = min(max(initial, minimum), maximum)
+
+    def observe(self, seconds: float, size: int) -> None:
+        """Adjust the page size after a successful response.
+
+        Args:
+            seconds: Time it took to receive the response.
+            size: Size of the response body in bytes.
+        """
+        if seconds > self.target_seconds or size > self.target_bytes:
+            self.shrink()
+        elif seconds < self.target_seconds / 2 and size < self.target_bytes / 2:
+            self.size = min(self.size * 2, self.maximum)
+
+    def shrink(self) -> None:
+        """Halve the page size."""
+        self.size = max(self.size // 2, self.minimum)
 
 
 class JotformStream(RESTStream[int]):
@@ -25,17 +167,36 @@ class JotformStream(RESTStream[int]):
 
     page_size = 100
     primary_keys: tuple[str, ...] = ("id",)
-    records_jsonpath = "$.content[*]"
 
     INTEGER_FIELDS: tuple[str, ...] = ()
 
+    #: Whether records are fetched by a background thread of the tap, in which case
+    #: the stream must not change the state
+    fetched_in_background = False
+
+    #: Whether pages can be parsed incrementally while they are downloaded
+    STREAMING_SUPPORTED = False
+    STREAMING_CHUNK_SIZE = 64 * 1024
+
     _requests_session: requests.Session | None
+    _prefetched: dict[str, requests.Response]
+    _buffering: bool
 
     @override
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the stream object."""
         super().__init__(*args, **kwargs)
         self._requests_session = None
+        self._prefetched = {}
+        self._buffering = False
+        if self.instrumentation.enabled:
+            # Time post-processing as a whole, including that of subclasses
+            self.post_process = self.instrumentation.wrap(  # type: ignore[method-assign]
+                self.post_process,
+                self.name,
+                self.path,
+                "post_process",
+            )
 
     @override
     @property
@@ -53,44 +214,678 @@ class JotformStream(RESTStream[int]):
         row: Record,
         context: Context | None = None,
     ) -> Record:
-        for field in self.INTEGER_FIELDS:
+        for field in self.selected_integer_fields:
             value = row.get(field)
             row[field] = int(value) if value else None
         return row
 
+    def is_property_selected(self, name: str) -> bool:
+        """Return whether a top-level property is selected in the catalog.
+
+        The SDK drops deselected properties from records after post-processing, so
+        transforms of those properties can be skipped.
+
+        Args:
+            name: The property name.
+
+        Returns:
+            True if the property is selected.
+        """
+        return self.mask[("properties", name)]
+
+    @cached_property
+    def selected_integer_fields(self) -> tuple[str, ...]:
+        """The ``INTEGER_FIELDS`` that are selected in the catalog."""
+        return tuple(
+            field for field in self.INTEGER_FIELDS if self.is_property_selected(field)
+        )
+
+    @property
+    def quota_scheduler(self) -> QuotaScheduler:
+        """Request scheduler shared by all streams of the tap."""
+        return cast("TapJotform", self._tap).quota_scheduler
+
+    @property
+    def instrumentation(self) -> Instrumentation:
+        """Performance instrumentation shared by all streams of the tap."""
+        return cast("TapJotform", self._tap).instrumentation
+
+    @property
+    def stream_prefetcher(self) -> StreamPrefetcher | None:
+        """Background fetching of top-level streams, if enabled."""
+        return cast("TapJotform", self._tap).stream_prefetcher
+
+    @property
+    def request_slots(self) -> threading.BoundedSemaphore:
+        """Slots of the requests in flight, shared by all streams of the tap."""
+        return cast("TapJotform", self._tap).request_slots
+
+    @property
+    def form_index(self) -> FormIndex:
+        """Index of the forms of the account, shared by all streams of the tap."""
+        return cast("TapJotform", self._tap).form_index
+
+    @property
+    def streaming_enabled(self) -> bool:
+        """Whether pages are parsed incrementally while they are downloaded."""
+        return self.STREAMING_SUPPORTED and self.config.get("streaming_parse", False)
+
+    @property
+    def max_concurrent_requests(self) -> int:
+        """Maximum number of requests to have in flight at once."""
+        return max(self.config.get("max_concurrent_requests", 1), 1)  # type: ignore[no-any-return]
+
     @override
-    def parse_response(
+    def get_records(self, context: Context | None) -> Iterable[Record]:
+        """Return records, prefetching child stream requests when possible.
+
+        Records are buffered one page at a time so the first request of every child
+        context in that page can be sent concurrently. Children are still synced by
+        the SDK one parent record at a time, in the same order as a sequential sync.
+        """
+        children = [
+            child
+            for child in self.child_streams
+            if isinstance(child, JotformStream)
+            and (child.selected or child.has_selected_descendents)
+        ]
+        if context is not None and self.should_skip(context):
+            self.logger.info("Nothing new to sync for context %s, skipping", context)
+            return
+
+        records: Iterable[Record] | None = None
+        prefetcher = self.stream_prefetcher
+        if prefetcher is not None and self.parent_stream_type is None:
+            records = prefetcher.take(self)
+        if records is None:
+            records = self.fetch_records(context)
+
+        if self.max_concurrent_requests < 2 or not children:  # noqa: PLR2004
+            yield from records
+            return
+
+        # Records read ahead are not emitted yet, so checkpoints wait for them
+        self._buffering = True
+        try:
+            batch: list[Record] = []
+            for record in records:
+                batch.append(record)
+                # Batches follow the pages actually requested, so checkpoints are
+                # not held back by more than a page
+                if len(batch) >= self.page_limit:
+                    self._prefetch_children(children, batch, context)
+                    yield from batch
+                    batch = []
+                    self.checkpoint_emitted()
+
+            self._prefetch_children(children, batch, context)
+            yield from batch
+        finally:
+            self._buffering = False
+
+    @property
+    def page_limit(self) -> int:
+        """Number of records requested in the last page."""
+        return self.page_size
+
+    def checkpoint_emitted(self) -> None:
+        """Checkpoint the records emitted so far, for streams that are resumable."""
+
+    def fetch_records(self, context: Context | None) -> Iterable[Record]:
+        """Return the records of a context, without syncing child streams.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            An iterable of records.
+        """
+        return self.request_records(context)
+
+    def _prefetch_children(
+        self,
+        children: Sequence[JotformStream],
+        records: Sequence[Record],
+        context: Context | None,
+    ) -> None:
+        contexts = [
+            child_context
+            for record in records
+            for child_context in self.generate_child_contexts(record, context)
+            if child_context is not None
+        ]
+        for child in children:
+            child.prefetch(contexts)
+
+    def should_skip(self, context: Context) -> bool:  # noqa: ARG002
+        """Return whether a context is known to have nothing new to sync.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            True if no requests should be sent for the context.
+        """
+        return False
+
+    def prefetch(self, contexts: Sequence[Context]) -> None:
+        """Send the first request of each context concurrently.
+
+        Responses are held until the regular sync path prepares a request for the
+        same URL. Failed requests are dropped, so the sequential path retries them
+        and surfaces any error as usual.
+
+        Args:
+            contexts: Child contexts generated by the parent stream.
+        """
+        self._prefetched.clear()
+        contexts = [
+            context
+            for context in map(self.preprocess_context, contexts)
+            if not self.should_skip(context)
+        ]
+        if not contexts:
+            return
+
+        # Incremental requests are filtered by the partition's starting value, which
+        # the SDK only writes once it starts syncing the partition
+        for context in contexts:
+            self._write_starting_replication_value(context)
+        prepared_requests = [
+            self._prepare_request(
+                context=self.first_request_context(context),
+                page=self.get_new_paginator() or SinglePagePaginator(),
+            )
+            for context in contexts
+        ]
+        decorated_request = self.request_decorator(self._request)
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as pool:
+            futures = [
+                (prepared.url, pool.submit(decorated_request, prepared, context))
+                for prepared, context in zip(prepared_requests, contexts, strict=True)
+            ]
+            for url, future in futures:
+                if url and future.exception() is None:
+                    self._prefetched[url] = future.result()
+
+    def first_request_context(self, context: Context) -> Context:
+        """Return the context of the first request sent for a context.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The context passed to ``get_url_params`` for the first page.
+        """
+        return context
+
+    def request_partitions(
+        self,
+        partitions: Sequence[Context],
+    ) -> Generator[Record, None, None]:
+        """Request the records of several partitions concurrently.
+
+        Up to ``max_concurrent_requests`` partitions are paginated at once. Records
+        are yielded partition by partition, in the given order, and only a bounded
+        number of records is buffered for each partition.
+
+        Args:
+            partitions: Contexts passed to ``request_records``.
+
+        Yields:
+            Records of every partition.
+        """
+        stop = threading.Event()
+        buffers: list[queue.Queue[Any]] = [
+            queue.Queue(maxsize=MAX_PAGE_SIZE) for _ in partitions
+        ]
+
+        def produce(partition: Context, buffer: queue.Queue[Any]) -> None:
+            try:
+                for record in self.request_records(partition):
+                    if not _put(buffer, record, stop):
+                        return
+            except Exception as ex:  # noqa: BLE001
+                _put(buffer, ex, stop)
+            _put(buffer, _DONE, stop)
+
+        pool = ThreadPoolExecutor(max_workers=self.max_concurrent_requests)
+        try:
+            for partition, buffer in zip(partitions, buffers, strict=True):
+                pool.submit(produce, partition, buffer)
+            for buffer in buffers:
+                while (item := buffer.get()) is not _DONE:
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+        finally:
+            stop.set()
+            pool.shutdown(cancel_futures=True)
+
+    @override
+    def _request(
+        self,
+        prepared_request: requests.PreparedRequest,
+        context: Context | None,
+    ) -> requests.Response:
+        if prepared_request.url and (
+            response := self._prefetched.pop(prepared_request.url, None)
+        ):
+            return response
+        instrumentation = self.instrumentation
+        with instrumentation.time(self.name, self.path, "quota_wait"):
+            self.quota_scheduler.acquire()
+        with (
+            self.request_slots,
+            instrumentation.time(self.name, self.path, "network"),
+        ):
+            response = self._send(prepared_request, context)
+
+        if getattr(response, "from_cache", False):
+            instrumentation.add(self.name, self.path, requests=1, cache_hits=1)
+        else:
+            length = response.headers.get("Content-Length")
+            if length is not None:
+                size = int(length)
+            else:
+                size = 0 if self.streaming_enabled else len(response.content)
+            instrumentation.add(self.name, self.path, requests=1, bytes=size)
+        instrumentation.export_if_due()
+        return response
+
+    def _send(
+        self,
+        prepared_request: requests.PreparedRequest,
+        context: Context | None,
+    ) -> requests.Response:
+        request = partial(super()._request, prepared_request, context)
+        if self.hedger is None or prepared_request.method != "GET":
+            return request()
+        return self.hedger.send(request, self._can_hedge)
+
+    def _can_hedge(self) -> bool:
+        # Duplicate requests are not worth the quota once it is running low
+        if self.quota_scheduler.interval() > 0:
+            return False
+        self.instrumentation.add(self.name, self.path, hedges=1)
+        return True
+
+    @cached_property
+    def hedger(self) -> Hedger | None:
+        """Hedger of slow requests, if hedging is enabled."""
+        hedging = self.config.get("hedging") or {}
+        if not hedging.get("enabled"):
+            return None
+        return Hedger(
+            executor=cast("TapJotform", self._tap).hedging_pool,
+            percentile=hedging.get("percentile", 95),
+            min_samples=hedging.get("min_samples", 20),
+            max_hedges=self.max_concurrent_requests,
+        )
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """Retry policy shared by all streams of the tap."""
+        return cast("TapJotform", self._tap).retry_policy
+
+    @override
+    @property
+    def timeout(self) -> int:
+        timeouts: dict[str, int] = self.config.get("request_timeouts") or {}
+        return timeouts.get(self.name, super().timeout)
+
+    @override
+    def backoff_wait_generator(self) -> Generator[float, None, None]:
+        return self.retry_policy.waits()
+
+    @override
+    def backoff_max_tries(self) -> int:
+        return self.retry_policy.max_tries
+
+    @override
+    def backoff_jitter(self, value: float) -> float:
+        # Waits of the retry policy are already jittered
+        return value
+
+    @override
+    def backoff_handler(self, details: Details) -> None:
+        self.instrumentation.add(self.name, self.path, retries=1)
+        super().backoff_handler(details)
+
+    @override
+    def validate_response(self, response: requests.Response) -> None:
+        # Other 429 responses are short-term limits, retried after Retry-After
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS and (
+            (limit_left := self._error_limit_left(response)) is not None
+            and limit_left <= 0
+        ):
+            self.quota_scheduler.exhaust()
+        super().validate_response(response)
+
+    @staticmethod
+    def _error_limit_left(response: requests.Response) -> int | None:
+        try:
+            return int(encoding.loads(response.content)["limit-left"])
+        except (ValueError, TypeError, KeyError):
+            return None
+
+    @override
+    def parse_response(self, response: requests.Response) -> Iterable[Record]:
+        """Parse the response and return an iterator of result rows.
+
+        The body is decoded once and records are read from its ``content`` key.
+        """
+        if self.streaming_enabled:
+            return self.instrumentation.time_iter(
+                self._parse_streamed_response(response),
+                self.name,
+                self.path,
+                "decode",
+            )
+
+        with self.instrumentation.time(self.name, self.path, "decode"):
+            data = encoding.loads(response.content)
+        self._log_limit_left(response, data["limit-left"])
+        return self.extract_records(data["content"])
+
+    def _parse_streamed_response(
         self,
         response: requests.Response,
     ) -> Generator[Record, None, None]:
-        self.logger.info(
-            "Received response",
-            extra={"limit_left": response.json()["limit-left"]},
+        parser = ContentParser(response.iter_content(self.STREAMING_CHUNK_SIZE))
+        yield from parser
+        self._log_limit_left(response, parser.envelope["limit-left"])
+
+    def _log_limit_left(
+        self,
+        response: requests.Response,
+        limit_left: int | str,
+    ) -> None:
+        if getattr(response, "from_cache", False):
+            # The quota in a cached body is out of date
+            return
+        self.logger.info("Received response", extra={"limit_left": limit_left})
+        self.quota_scheduler.update(int(limit_left))
+        self.instrumentation.observe_limit_left(int(limit_left))
+
+    def extract_records(self, content: Any) -> Iterable[Record]:  # noqa: ANN401
+        """Return the records in the ``content`` of a response.
+
+        Like the ``$.content[*]`` JSONPath of the SDK, an object is a single record,
+        e.g. the root folder returned by ``/user/folders``.
+
+        Args:
+            content: The decoded ``content`` of a response.
+
+        Returns:
+            An iterable of records.
+        """
+        if isinstance(content, list):
+            return content
+        return [] if content is None else [content]
+
+    @override
+    def finalize_state_progress_markers(
+        self, state: dict[str, Any] | None = None
+    ) -> None:
+        super().finalize_state_progress_markers(state)
+        if self.parent_stream_type is None:
+            # The tap finalizes top-level streams once they are synced
+            for stream in (self, *_descendants(self)):
+                if isinstance(stream, JotformPaginatedStream):
+                    stream.save_record_index()
+            self.instrumentation.export()
+
+    @override
+    def log_sync_costs(self) -> None:
+        super().log_sync_costs()
+        # The tap calls this for every stream once all of them are synced
+        cast("TapJotform", self._tap).shutdown_hedging_pool()
+
+    @cached_property
+    def record_conformer(self) -> RecordConformer | None:
+        """Conformer of the records of the stream in the fast output mode."""
+        fast_output = self.config.get("fast_output") or {}
+        if (
+            not fast_output.get("enabled")
+            or self.TYPE_CONFORMANCE_LEVEL != TypeConformanceLevel.RECURSIVE
+        ):
+            return None
+        return RecordConformer(self.name, self.effective_schema, self.mask, self.logger)
+
+    def conform_record(self, record: Record) -> Record:
+        """Remove deselected properties from a record and conform it to the schema.
+
+        Args:
+            record: The record, after post-processing.
+
+        Returns:
+            The record to write.
+        """
+        if self.record_conformer is not None:
+            return self.record_conformer(record)
+        pop_deselected_record_properties(record, self.schema, self.mask)
+        return conform_record_data_types(
+            stream_name=self.name,
+            record=record,
+            schema=self.effective_schema,
+            level=self.TYPE_CONFORMANCE_LEVEL,
+            logger=self.logger,
+        )
+
+    @override
+    def _generate_record_messages(
+        self,
+        record: Record,
+    ) -> Generator[singerlib.RecordMessage, None, None]:
+        record = self.conform_record(record)
+        for stream_map in self.stream_maps:
+            mapped_record = stream_map.transform(record)
+            if mapped_record is not None:
+                yield singerlib.RecordMessage(
+                    stream=stream_map.stream_alias,
+                    record=mapped_record,
+                    version=self._stream_version,
+                    time_extracted=utc_now(),
+                )
+
+    @cached_property
+    def batch_config(self) -> BatchConfig | None:
+        """Configuration of the batch files of the stream, if it is batched."""
+        if self.name not in self.config.get("batch_streams", BATCH_STREAMS):
+            return None
+        batch_config = super().get_batch_config(self.config)
+        if (
+            batch_config is not None
+            and batch_config.encoding.format == BatchFileFormat.PARQUET
+            and not parquet_available()
+        ):
+            self.logger.warning(
+                "Parquet batch files were requested but pyarrow is not installed, "
+                "writing JSON Lines files",
+            )
+            batch_config.encoding = BaseBatchFileEncoding(
+                format=BatchFileFormat.JSONL,
+                compression=batch_config.encoding.compression,
+            )
+        return batch_config
+
+    @override
+    def get_batch_config(self, config: Mapping[str, Any]) -> BatchConfig | None:
+        """Return the batch config of streams listed in ``batch_streams``.
+
+        Args:
+            config: Tap configuration dictionary.
+
+        Returns:
+            Batch config for this stream, or None to write RECORD messages.
+        """
+        return self.batch_config
+
+    @override
+    def get_batches(
+        self,
+        batch_config: BatchConfig,
+        context: Context | None = None,
+    ) -> Iterable[tuple[BaseBatchFileEncoding, list[str]]]:
+        """Write the records of the stream to batch files.
+
+        Records are conformed and mapped as in RECORD messages. Streams created from
+        this one with aliases in stream maps are not batched.
+
+        Args:
+            batch_config: Batch config for this stream.
+            context: Stream partition or context dictionary.
+
+        Yields:
+            A tuple of (encoding, manifest) for each batch.
+        """
+        batcher_type: type[BaseBatcher] = (
+            JSONLinesBatcher
+            if batch_config.encoding.format == BatchFileFormat.JSONL
+            else Batcher
         )
-        yield from super().parse_response(response)
+        batcher = batcher_type(self.tap_name, self.name, batch_config)
+        records = self._sync_records(context, write_messages=False)
+        for manifest in batcher.get_batches(self._batch_records(records)):
+            yield batch_config.encoding, manifest
+
+    def _batch_records(self, records: Iterable[Record]) -> Iterator[Record]:
+        stream_map = self.stream_maps[0]
+        for record in records:
+            mapped_record = stream_map.transform(self.conform_record(record))
+            if mapped_record is not None:
+                self.instrumentation.add(self.name, self.path, records=1)
+                yield mapped_record
+
+    @override
+    def _write_record_message(self, record: Record) -> None:
+        if not self.instrumentation.enabled:
+            super()._write_record_message(record)
+            return
+        with self.instrumentation.time(self.name, self.path, "serialize"):
+            super()._write_record_message(record)
+        self.instrumentation.add(self.name, self.path, records=1)
+
+    @property
+    def cache_enabled(self) -> bool:
+        """Whether HTTP responses are cached."""
+        return bool((self.config.get("requests_cache") or {}).get("enabled"))
+
+    @override
+    def calculate_sync_cost(
+        self,
+        request: requests.PreparedRequest,
+        response: requests.Response,
+        context: Context | None,
+    ) -> dict[str, int]:
+        """Count cache hits, misses and bytes saved when caching is enabled."""
+        if not self.cache_enabled:
+            return {}
+        return cache_costs(response)
 
     @override
     @property
     def requests_session(self) -> requests_cache.CachedSession | requests.Session:
+        """Return the session of the stream.
+
+        Sessions differ between streams in their cache and streaming settings,
+        but all of them send requests through the tap's shared transport adapter,
+        so connections are reused across streams.
+        """
         if self._requests_session is None:
-            if (
-                self.config.get("requests_cache")
-                and self.config["requests_cache"]["enabled"]
-            ):
-                self._requests_session = requests_cache.CachedSession(
-                    **self.config["requests_cache"]["config"],
+            if self.cache_enabled:
+                self._requests_session = create_session(
+                    self.config["requests_cache"],
+                    self.name,
                 )
             else:
                 self._requests_session = requests.Session()
+            self._requests_session.stream = self.streaming_enabled
+            adapter = cast("TapJotform", self._tap).http_adapter
+            self._requests_session.mount("https://", adapter)
+            self._requests_session.mount("http://", adapter)
         return self._requests_session
 
 
 class JotformPaginatedStream(JotformStream):
     """A Jotform stream with pagination."""
 
+    _page_sizer: PageSizer | None
+    _page_limit: int
+    _start_offset: int
+    _checkpoint: dict[str, Any] | None
+    _checkpoint_state: dict[str, Any]
+    _checkpoint_pages: int
+
+    @override
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the stream object."""
+        super().__init__(*args, **kwargs)
+        page_sizes: dict[str, int] = self.config.get("page_sizes") or {}
+        self.page_size = page_sizes.get(self.name, self.page_size)
+        self._page_limit = self.page_size
+        self._start_offset = 0
+        self._checkpoint = None
+        self._checkpoint_state = {}
+        self._checkpoint_pages = 0
+
+        adaptive = self.config.get("adaptive_page_size") or {}
+        self._page_sizer = None
+        if adaptive.get("enabled"):
+            self._page_sizer = PageSizer(
+                self.page_size,
+                minimum=adaptive.get("min_page_size", 10),
+                maximum=adaptive.get("max_page_size", MAX_PAGE_SIZE),
+                target_seconds=adaptive.get("target_seconds", 5),
+                target_bytes=adaptive.get("target_bytes", 5_000_000),
+            )
+
+    @property
+    def current_page_size(self) -> int:
+        """Page size of the next request."""
+        return self._page_sizer.size if self._page_sizer else self.page_size
+
+    @override
+    @property
+    def page_limit(self) -> int:
+        return self._page_limit
+
     @override
     def get_new_paginator(self) -> JotformPaginator:
-        return JotformPaginator(0, self.page_size)
+        offset, self._start_offset = self._start_offset, 0
+        return JotformPaginator(offset, self.page_size)
+
+    @override
+    def _request(
+        self,
+        prepared_request: requests.PreparedRequest,
+        context: Context | None,
+    ) -> requests.Response:
+        if self._page_sizer is not None:
+            # Retries reuse the prepared request, so apply the latest page size
+            limit = str(self._page_sizer.size)
+            if get_query_param(prepared_request, "limit") != limit:
+                set_query_param(prepared_request, "limit", limit)
+        self._page_limit = int(
+            get_query_param(prepared_request, "limit") or self.page_size,
+        )
+        response = super()._request(prepared_request, context)
+        if self._page_sizer is None:
+            return response
+
+        if self.streaming_enabled:
+            size = int(response.headers.get("Content-Length") or 0)
+        else:
+            size = len(response.content)
+        self._page_sizer.observe(response.elapsed.total_seconds(), size)
+        return response
+
+    @override
+    def backoff_handler(self, details: Details) -> None:
+        if self._page_sizer is not None:
+            self._page_sizer.shrink()
+        super().backoff_handler(details)
 
     @override
     def get_url_params(
@@ -98,24 +893,385 @@ class JotformPaginatedStream(JotformStream):
         context: Context | None,
         next_page_token: int | None,
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"limit": self.page_size}
+        params: dict[str, Any] = {
+            "limit": self.current_page_size,
+            # Ascending order keeps offsets stable while new records are created
+            "orderby": (context or {}).get("orderby", "created_at"),
+            "direction": "ASC",
+        }
+        filters: dict[str, str] = {}
 
-        starting_value = self.get_starting_timestamp(context)
-        if starting_value and self.replication_key:
+        if context and "filter" in context:
+            # Date windows and replication passes carry their own filter
+            filters.update(context["filter"])
+        elif self.replication_key and (start := self.get_filter_start(context)):
             self.logger.info(
                 "Bookmark found %(bookmark)s",
-                extra={"bookmark": starting_value},
+                extra={"bookmark": start},
             )
-            params["filter"] = f'{{"{self.replication_key}:gt": "{starting_value}"}}'
+            filters[f"{self.replication_key}:gt"] = start
+
+        if filters:
+            params["filter"] = json.dumps(filters)
 
         if next_page_token:
             params["offset"] = next_page_token
 
+        if self._checkpoint is not None:
+            self._save_checkpoint(self._checkpoint, next_page_token or 0)
+
         return params
 
+    def _save_checkpoint(self, checkpoint: dict[str, Any], offset: int) -> None:
+        # Every record before this page has been read by now
+        checkpoint["offset"] = offset
+        self._checkpoint_pages += 1
+        if not self._buffering:
+            self.checkpoint_emitted()
+
+    def _start_checkpoint(self, context: Context | None) -> None:
+        self._checkpoint = {
+            "filter": (context or {}).get("filter"),
+            "offset": self._start_offset,
+        }
+        if not self._buffering:
+            self.checkpoint_emitted()
+
+    @override
+    def checkpoint_emitted(self) -> None:
+        if self._checkpoint is None:
+            return
+        self._checkpoint_state["resume"] = dict(self._checkpoint)
+        self.state_manager.is_flushed = False
+        frequency = self.config.get("state_checkpoint_pages", 1)
+        # Records of batched streams are not written until their batch is full
+        if (
+            frequency
+            and self.batch_config is None
+            and self._checkpoint_pages >= frequency
+        ):
+            self._checkpoint_pages = 0
+            self._write_state_message()
+
+    @property
+    def resumable(self) -> bool:
+        """Whether page offsets are checkpointed, so an interrupted sync resumes.
+
+        Checkpoints are only written from the thread that writes STATE messages.
+        """
+        return not self.fetched_in_background
+
+    def get_filter_start(self, context: Context | None) -> str | None:
+        """Return the lower bound of the replication key filter.
+
+        The bookmark is moved back by ``lookback_window_seconds`` to pick up records
+        written late, e.g. by long-running form edits.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The starting timestamp in the API filter format, or None if there is no
+            bookmark or start date.
+        """
+        start = self.get_starting_timestamp(context)
+        if start is None:
+            return None
+        start -= dt.timedelta(seconds=self.config.get("lookback_window_seconds", 0))
+        return start.astimezone(dt.UTC).strftime(FILTER_DATETIME_FORMAT)
+
+    @override
+    def first_request_context(self, context: Context) -> Context:
+        passes = self.replication_passes(context)
+        return passes[0] if passes else context
+
+    def replication_passes(self, context: Context | None) -> list[Context]:
+        """Split an incremental sync by ``updated_at`` into two filtered passes.
+
+        Records that were never updated have no ``updated_at`` in the API, so a
+        filter on it alone misses new records, while a filter on ``created_at``
+        misses updates. The first pass requests records created after the bookmark
+        and the second one records updated after it. Records in both passes must be
+        deduplicated.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            A context with a ``filter`` for each pass, or an empty list if a single
+            request sequence is enough.
+        """
+        if self.replication_key != "updated_at" or (context and "filter" in context):
+            return []
+        if (start := self.get_filter_start(context)) is None:
+            return []
+        return [
+            {**(context or {}), "filter": {"created_at:gt": start}},
+            {
+                **(context or {}),
+                "filter": {"updated_at:gt": start},
+                "orderby": "updated_at",
+            },
+        ]
+
+    @override
+    def request_records(self, context: Context | None) -> Iterable[Record]:
+        """Request records, resuming from the last checkpoint of the context.
+
+        The offset of each page is saved in the ``resume`` key of the context
+        state before it is requested, with the filter of the request sequence it
+        belongs to, and a STATE message is written every ``state_checkpoint_pages``
+        pages. While records are buffered to prefetch child streams, the offset is
+        only saved once the buffered records are emitted. A sync that is
+        interrupted is resumed from the page that was being read, as long as the
+        bookmark and thus the filters have not changed. Date windows of a backfill
+        are fetched concurrently and not resumable, and neither are streams that
+        are not :attr:`resumable`.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Yields:
+            Records of every page.
+        """
+        if context and "filter" in context:
+            yield from super().request_records(context)
+            return
+
+        state = self.get_context_state(context)
+        checkpoint = self.resumable
+        resume: dict[str, Any] | None = state.get("resume") if checkpoint else None
+        passes: list[Context | None] = [*self.replication_passes(context)] or [
+            context,
+        ]
+        if resume is not None:
+            filters = [(p or {}).get("filter") for p in passes]
+            if resume.get("filter") in filters:
+                passes = passes[filters.index(resume["filter"]) :]
+                self._start_offset = resume["offset"]
+                self.logger.info(
+                    "Resuming interrupted sync at offset %d",
+                    resume["offset"],
+                )
+
+        seen: set[str] = set()
+        deduplicate = len(passes) > 1 and self.record_index is None
+        previous = "replication_key_value" in state
+        self._checkpoint_state = state
+        try:
+            for pass_context in passes:
+                if checkpoint:
+                    self._start_checkpoint(pass_context)
+                for record in self.skip_emitted(
+                    super().request_records(pass_context),
+                    previous=previous,
+                ):
+                    if deduplicate:
+                        if record["id"] in seen:
+                            continue
+                        seen.add(record["id"])
+                    yield record
+        finally:
+            self._checkpoint = None
+            self._start_offset = 0
+        if checkpoint:
+            state.pop("resume", None)
+
+    @cached_property
+    def record_index(self) -> RecordIndex | None:
+        """Index of the record versions emitted, if deduplication is enabled."""
+        deduplication = self.config.get("deduplication") or {}
+        if (
+            not deduplication.get("enabled")
+            or self.replication_method != REPLICATION_INCREMENTAL
+        ):
+            return None
+        index_dir = deduplication.get("index_dir")
+        return RecordIndex(
+            deduplication.get("max_entries", DEFAULT_MAX_ENTRIES),
+            Path(index_dir) / f"{self.name}.idx" if index_dir else None,
+        )
+
+    def skip_emitted(
+        self,
+        records: Iterable[Record],
+        *,
+        previous: bool,
+    ) -> Iterator[Record]:
+        """Skip the versions of records that were already emitted.
+
+        Versions are identified by the ``id`` and ``updated_at`` of records, or their
+        ``created_at`` if they were never updated.
+
+        Args:
+            records: The records.
+            previous: Whether to skip versions emitted by the previous run. Only
+                contexts that had a bookmark before the sync should skip them, so
+                records are emitted again when the state is reset.
+
+        Yields:
+            The records that were not emitted before.
+        """
+        index = self.record_index
+        if index is None:
+            yield from records
+            return
+        for record in records:
+            version = record.get("updated_at") or record.get("created_at")
+            if not index.seen(record["id"], str(version), previous=previous):
+                yield record
+
+    def save_record_index(self) -> None:
+        """Save the index of the record versions emitted for the next run."""
+        if self.record_index is None:
+            return
+        if self.record_index.duplicates:
+            self.logger.info(
+                "Skipped %d records that were already emitted",
+                self.record_index.duplicates,
+            )
+        self.record_index.save()
+
+    def backfill_windows(self, context: Context | None) -> list[Context]:
+        """Split a backfill into ``created_at`` date windows.
+
+        Only a sync without a bookmark is a backfill. Windows on ``created_at``
+        would miss the older records updated after a bookmark, so incremental syncs
+        use the replication passes instead.
+
+        Windows share their boundaries, so records created exactly at a boundary
+        are returned by both windows and must be deduplicated.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            A context with a ``filter`` for each window, or an empty list if
+            backfills are disabled, there is a bookmark or there is no start date.
+        """
+        backfill = self.config.get("backfill") or {}
+        if not backfill.get("enabled"):
+            return []
+        if "replication_key_value" in self.get_context_state(context):
+            return []
+
+        start_date = self.config.get("start_date")
+        if not start_date:
+            self.logger.warning("Backfill requires a start date")
+            return []
+        start = dt.datetime.fromisoformat(start_date)
+
+        second = dt.timedelta(seconds=1)
+        return [
+            {
+                "filter": {
+                    "created_at:gt": (window_start - second).strftime(
+                        FILTER_DATETIME_FORMAT,
+                    ),
+                    "created_at:lt": (window_end + second).strftime(
+                        FILTER_DATETIME_FORMAT,
+                    ),
+                },
+            }
+            for window_start, window_end in date_windows(
+                start.astimezone(dt.UTC).replace(tzinfo=None),
+                dt.datetime.now(dt.UTC).replace(tzinfo=None),
+                dt.timedelta(days=backfill.get("window_days", 30)),
+            )
+        ]
+
     @override
     def post_process(self, row: Record, context: Context | None = None) -> Record:
         """Post-process a record."""
         row = super().post_process(row, context)
-        row["updated_at"] = row["updated_at"] or row["created_at"]
+        if self.is_property_selected("updated_at"):
+            row["updated_at"] = row["updated_at"] or row["created_at"]
         return row
+
+
+class StreamPrefetcher:
+    """Fetch the records of top-level streams in background threads.
+
+    The SDK syncs streams one after the other and writes every Singer message from
+    the main thread. Once the first stream starts syncing, the records of the
+    following ones are fetched concurrently, and buffered up to
+    ``max_buffered_records`` each until their stream is synced, so a sync takes
+    about as long as its slowest stream rather than the sum of all of them. Child
+    streams are still synced from the main thread.
+
+    Args:
+        streams: Top-level streams to sync.
+        max_buffered_records: Maximum number of records buffered per stream.
+    """
+
+    def __init__(
+        self,
+        streams: Sequence[JotformStream],
+        max_buffered_records: int,
+    ) -> None:
+        """Initialize the prefetcher."""
+        self.streams = streams
+        self.max_buffered_records = max_buffered_records
+        self._started = False
+        self._stop = threading.Event()
+        self._buffers: dict[str, queue.Queue[Any]] = {}
+
+    def take(self, stream: JotformStream) -> Iterator[Record] | None:
+        """Return the records fetched in the background for a stream.
+
+        The first call starts fetching every stream but the given one.
+
+        Args:
+            stream: The stream being synced.
+
+        Returns:
+            The records of the stream, or None if it is not fetched in the
+            background.
+        """
+        if not self._started:
+            self._started = True
+            self._start([other for other in self.streams if other is not stream])
+        buffer = self._buffers.pop(stream.name, None)
+        return None if buffer is None else self._consume(buffer)
+
+    def stop(self) -> None:
+        """Stop fetching records."""
+        self._stop.set()
+
+    def _start(self, streams: Sequence[JotformStream]) -> None:
+        for stream in streams:
+            # Create the state of the stream and set its starting value from the
+            # bookmark, as the SDK does when syncing it, before other threads read it
+            stream.get_context_state(None)
+            stream._write_starting_replication_value(None)  # noqa: SLF001
+            stream.fetched_in_background = True
+            buffer: queue.Queue[Any] = queue.Queue(maxsize=self.max_buffered_records)
+            self._buffers[stream.name] = buffer
+            threading.Thread(
+                target=self._produce,
+                args=(stream, buffer),
+                name=f"fetch-{stream.name}",
+                daemon=True,
+            ).start()
+
+    def _produce(self, stream: JotformStream, buffer: queue.Queue[Any]) -> None:
+        try:
+            for record in stream.fetch_records(None):
+                if not _put(buffer, record, self._stop):
+                    return
+        except Exception as ex:  # noqa: BLE001
+            _put(buffer, ex, self._stop)
+        _put(buffer, _DONE, self._stop)
+
+    def _consume(self, buffer: queue.Queue[Any]) -> Iterator[Record]:
+        done = False
+        try:
+            while (item := buffer.get()) is not _DONE:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+            done = True
+        finally:
+            if not done:
+                # The sync failed, other streams will not be synced
+                self.stop()
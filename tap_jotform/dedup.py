@@ -0,0 +1,100 @@
+"""Index of the record versions emitted by incremental syncs."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from array import array
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+#: Default number of record versions kept in an index
+DEFAULT_MAX_ENTRIES = 250_000
+
+
+def version_digest(record_id: str, version: str) -> int:
+    """Return the 64-bit digest of a version of a record.
+
+    Args:
+        record_id: ID of the record.
+        version: Version of the record, e.g. its ``updated_at``.
+
+    Returns:
+        The digest, as an integer.
+    """
+    digest = hashlib.blake2b(f"{record_id}\0{version}".encode(), digest_size=8)
+    return int.from_bytes(digest.digest(), "little")
+
+
+class RecordIndex:
+    """Bounded index of the versions of records emitted by a stream.
+
+    Versions are kept as 64-bit digests, the least recently seen being evicted
+    once there are ``max_entries`` of them. The index of the previous run is read
+    from ``path``, an array of digests in machine byte order, and the index of the
+    current run replaces it with :meth:`save`.
+
+    Args:
+        max_entries: Maximum number of versions kept in memory and on disk.
+        path: Path of the index of the previous run, if any.
+    """
+
+    def __init__(self, max_entries: int, path: Path | None = None) -> None:
+        """Load the index of the previous run."""
+        self.max_entries = max_entries
+        self.path = path
+        self.duplicates = 0
+        # From the least to the most recently seen
+        self._emitted: OrderedDict[int, None] = OrderedDict()
+        self._previous: dict[int, None] = dict.fromkeys(self._load())
+
+    def _load(self) -> array[int]:
+        digests = array("Q")
+        if self.path is None or not self.path.exists():
+            return digests
+        try:
+            digests.frombytes(self.path.read_bytes())
+        except ValueError:
+            logger.warning("Ignoring corrupt record index %s", self.path)
+            return array("Q")
+        return digests[-self.max_entries :]
+
+    def seen(self, record_id: str, version: str, *, previous: bool = True) -> bool:
+        """Return whether a version of a record was emitted, and remember it.
+
+        Args:
+            record_id: ID of the record.
+            version: Version of the record.
+            previous: Whether to look up the versions emitted by the previous run.
+
+        Returns:
+            True if the version was emitted before.
+        """
+        digest = version_digest(record_id, version)
+        duplicate = digest in self._emitted or (previous and digest in self._previous)
+        self._emitted[digest] = None
+        self._emitted.move_to_end(digest)
+        if len(self._emitted) > self.max_entries:
+            self._emitted.popitem(last=False)
+        if duplicate:
+            self.duplicates += 1
+        return duplicate
+
+    def save(self) -> None:
+        """Write the versions seen in this run to disk, then older ones that fit."""
+        if self.path is None:
+            return
+        room = self.max_entries - len(self._emitted)
+        older = [digest for digest in self._previous if digest not in self._emitted]
+        digests = array("Q", older[-room:] if room > 0 else [])
+        digests.extend(self._emitted)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Replaced at once, so an interrupted write keeps the previous index
+        temporary = self.path.with_name(f".{self.path.name}.tmp")
+        temporary.write_bytes(digests.tobytes())
+        temporary.replace(self.path)
@@ -0,0 +1,82 @@
+"""JSON encoding helpers, using orjson when it is installed."""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+from json.encoder import encode_basestring_ascii
+from typing import Any
+
+from singer_sdk.singerlib.json import serialize_json
+
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+
+def loads(data: bytes | str) -> Any:  # noqa: ANN401
+    """Decode a JSON document.
+
+    Args:
+        data: The JSON document.
+
+    Returns:
+        The decoded object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:  # noqa: ANN401
+    """Encode an object as JSON, with the same output as :func:`json.dumps`.
+
+    Strings, the most common case, are encoded directly with the C string encoder
+    of the standard library, skipping the setup of a full encoder.
+
+    Args:
+        obj: The object to encode.
+
+    Returns:
+        The JSON document.
+    """
+    if type(obj) is str:
+        return encode_basestring_ascii(obj)
+    return json.dumps(obj)
+
+
+def _encode_datetime(obj: Any) -> str:  # noqa: ANN401
+    if isinstance(obj, dt.datetime):
+        return obj.isoformat(sep="T")
+    msg = f"Object of type {type(obj).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+# Same output as the SDK without decimals or non-finite numbers
+_line_encoder = json.JSONEncoder(
+    separators=(",", ":"),
+    allow_nan=False,
+    default=_encode_datetime,
+)
+
+
+def dumps_line(obj: dict[str, Any]) -> bytes:
+    """Encode a Singer message or a record as a line of JSON.
+
+    ``orjson`` is used when it is installed, and the C encoder of the standard
+    library otherwise. Objects they cannot encode, e.g. with
+    :class:`decimal.Decimal` numbers, are encoded by the SDK instead.
+
+    Args:
+        obj: The message as a dictionary, or the record.
+
+    Returns:
+        The JSON document, terminated by a newline.
+    """
+    try:
+        if orjson is not None:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)  # type: ignore[no-any-return]
+        return (_line_encoder.encode(obj) + "\n").encode()
+    except (TypeError, ValueError):
+        return (serialize_json(obj) + "\n").encode()
@@ -0,0 +1,174 @@
+"""Index of the forms of an account, consulted by the streams that depend on them."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from tap_jotform import encoding
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+    from singer_sdk.helpers.types import Record
+
+logger = logging.getLogger(__name__)
+
+#: Default number of seconds a saved index is used for before listing forms again
+DEFAULT_MAX_AGE = 3600
+
+
+class FormSummary(NamedTuple):
+    """Attributes of a form used to decide which requests of its children to send."""
+
+    status: str | None
+    archived: bool
+    updated_at: str | None
+    submission_count: int
+    last_submission: str | None
+
+    @classmethod
+    def from_record(cls, record: Record) -> FormSummary:
+        """Summarize a form record, as returned by the API.
+
+        Args:
+            record: The form record, before post-processing.
+
+        Returns:
+            The summary of the form.
+        """
+        return cls(
+            status=record.get("status"),
+            archived=bool(int(record.get("archived") or 0)),
+            updated_at=record.get("updated_at") or record.get("created_at"),
+            submission_count=int(record.get("count") or 0),
+            last_submission=record.get("last_submission"),
+        )
+
+    @property
+    def active(self) -> bool:
+        """Whether the form is neither deleted nor archived."""
+        return self.status != "DELETED" and not self.archived
+
+    @property
+    def activity(self) -> dict[str, Any]:
+        """Submission count and last submission date of the form."""
+        return {
+            "count": self.submission_count,
+            "last_submission": self.last_submission,
+        }
+
+
+class FormIndex:
+    """Summaries of the forms of an account, by form ID.
+
+    Forms are added as the forms stream fetches them. The index is complete once
+    every form has been listed, either by an unfiltered sync of the forms stream
+    or by :meth:`ensure_complete`. A complete index is written to ``path``, and
+    read back by the next runs as long as it is less than ``max_age`` seconds old.
+
+    Args:
+        path: Path of the saved index, if any.
+        max_age: Number of seconds a saved index is used for.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        max_age: float = DEFAULT_MAX_AGE,
+    ) -> None:
+        """Load the saved index if it is recent enough."""
+        self.path = path
+        self.max_age = max_age
+        self.complete = False
+        self._forms: dict[str, FormSummary] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        if time.time() - self.path.stat().st_mtime > self.max_age:
+            return
+        try:
+            forms = encoding.loads(self.path.read_bytes())
+            self._forms = {
+                form_id: FormSummary(*summary) for form_id, summary in forms.items()
+            }
+        except (ValueError, TypeError, AttributeError):
+            logger.warning("Ignoring corrupt form index %s", self.path)
+            return
+        self.complete = True
+
+    def __len__(self) -> int:
+        """Return the number of forms in the index."""
+        return len(self._forms)
+
+    def get(self, form_id: str) -> FormSummary | None:
+        """Return the summary of a form, if it is in the index.
+
+        Args:
+            form_id: ID of the form.
+
+        Returns:
+            The summary of the form, or None if it was not listed.
+        """
+        return self._forms.get(form_id)
+
+    def add(self, record: Record) -> None:
+        """Add or replace a form.
+
+        Args:
+            record: The form record, as returned by the API.
+        """
+        self._forms[record["id"]] = FormSummary.from_record(record)
+
+    def mark_complete(self) -> None:
+        """Mark every form as listed, and save the index."""
+        self.complete = True
+        self.save()
+
+    def ensure_complete(self, list_forms: Callable[[], Iterable[Record]]) -> None:
+        """List every form unless the index is already complete.
+
+        Args:
+            list_forms: Function returning every form of the account.
+        """
+        with self._lock:
+            if self.complete:
+                return
+            logger.info("Listing forms to complete the form index")
+            for record in list_forms():
+                self.add(record)
+            self.mark_complete()
+
+    def activity_digest(self) -> str:
+        """Return a digest of the submission count and last submission of all forms.
+
+        The digest only changes when a form gets new submissions or submissions are
+        deleted, not when existing submissions are edited.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for form_id, form in sorted(self._forms.copy().items()):
+            digest.update(
+                f"{form_id}\0{form.submission_count}\0{form.last_submission}\n".encode()
+            )
+        return digest.hexdigest()
+
+    def save(self) -> None:
+        """Write the index to disk, if it has a path."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Replaced at once, so an interrupted write keeps the previous index
+        temporary = self.path.with_name(f".{self.path.name}.tmp")
+        temporary.write_text(
+            encoding.dumps(
+                {form_id: list(form) for form_id, form in self._forms.copy().items()},
+            ),
+        )
+        temporary.replace(self.path)
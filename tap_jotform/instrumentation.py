@@ -0,0 +1,296 @@
+"""Performance instrumentation of the streams of a tap."""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+#: Stages of a sync, timed separately for every stream and endpoint
+STAGES = ("quota_wait", "network", "decode", "post_process", "serialize")
+
+#: Counters kept for every stream and endpoint
+COUNTERS = ("requests", "retries", "hedges", "bytes", "cache_hits", "records")
+
+_PROMETHEUS_COUNTERS = {
+    "requests": "Requests sent, including retries and cache hits",
+    "retries": "Requests retried after an error",
+    "hedges": "Duplicate requests sent for slow responses",
+    "bytes": "Response bytes transferred, excluding cache hits",
+    "cache_hits": "Responses served from the HTTP cache",
+    "records": "RECORD messages written",
+}
+
+
+class Instrumentation:
+    """Collect timings and counters of every stream and endpoint of a tap.
+
+    Time is split into the stages in ``STAGES``: waiting for the API quota, waiting
+    for the network, decoding JSON bodies, post-processing records and serializing
+    RECORD messages. When pages are parsed while they are downloaded, the download
+    of the body is part of the decode stage. Measurements are thread-safe.
+
+    Args:
+        enabled: Whether to collect measurements.
+        export_interval: Minimum number of seconds between two exports of the
+            metrics while streams are syncing.
+        json_path: Path of a JSON summary written on every export.
+        prometheus_path: Path of a Prometheus textfile written on every export.
+        clock: Monotonic clock.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        export_interval: float = 60,
+        json_path: str | None = None,
+        prometheus_path: str | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """Initialize the instrumentation."""
+        self.enabled = enabled
+        self.export_interval = export_interval
+        self.json_path = json_path
+        self.prometheus_path = prometheus_path
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats: dict[tuple[str, str], dict[str, float]] = {}
+        self._first_limit_left: int | None = None
+        self._limit_left: int | None = None
+        self._last_export = clock()
+
+    def add(self, stream: str, endpoint: str, **values: float) -> None:
+        """Add to the timings and counters of an endpoint.
+
+        Args:
+            stream: Stream name.
+            endpoint: Endpoint path of the stream.
+            values: Seconds per stage, as ``<stage>_seconds``, and counter values.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._stats.setdefault((stream, endpoint), {})
+            for key, value in values.items():
+                stats[key] = stats.get(key, 0) + value
+
+    @contextmanager
+    def time(self, stream: str, endpoint: str, stage: str) -> Iterator[None]:
+        """Time a block of code as a stage of an endpoint.
+
+        Args:
+            stream: Stream name.
+            endpoint: Endpoint path of the stream.
+            stage: One of ``STAGES``.
+
+        Yields:
+            None.
+        """
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.add(stream, endpoint, **{f"{stage}_seconds": self._clock() - start})
+
+    def time_iter(
+        self,
+        iterable: Iterable[T],
+        stream: str,
+        endpoint: str,
+        stage: str,
+    ) -> Iterator[T]:
+        """Time the production of the items of an iterable as a stage.
+
+        Time spent by the consumer between items is not counted.
+
+        Args:
+            iterable: The items.
+            stream: Stream name.
+            endpoint: Endpoint path of the stream.
+            stage: One of ``STAGES``.
+
+        Yields:
+            The items of the iterable.
+        """
+        iterator = iter(iterable)
+        elapsed = 0.0
+        try:
+            while True:
+                start = self._clock()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += self._clock() - start
+                yield item
+        finally:
+            self.add(stream, endpoint, **{f"{stage}_seconds": elapsed})
+
+    def wrap(
+        self,
+        func: Callable[P, T],
+        stream: str,
+        endpoint: str,
+        stage: str,
+    ) -> Callable[P, T]:
+        """Return a function that times every call of ``func`` as a stage.
+
+        Args:
+            func: The function.
+            stream: Stream name.
+            endpoint: Endpoint path of the stream.
+            stage: One of ``STAGES``.
+
+        Returns:
+            The timed function.
+        """
+
+        def timed(*args: P.args, **kwargs: P.kwargs) -> T:
+            with self.time(stream, endpoint, stage):
+                return func(*args, **kwargs)
+
+        return timed
+
+    def observe_limit_left(self, limit_left: int) -> None:
+        """Record the remaining daily quota reported by the API.
+
+        Args:
+            limit_left: The ``limit-left`` of a response.
+        """
+        with self._lock:
+            if self._first_limit_left is None:
+                self._first_limit_left = limit_left
+            self._limit_left = limit_left
+
+    def summary(self) -> dict[str, Any]:
+        """Return the metrics collected so far.
+
+        Returns:
+            Timings and counters per stream and endpoint, and the quota consumed.
+        """
+        streams: dict[str, dict[str, dict[str, float]]] = {}
+        with self._lock:
+            for (stream, endpoint), stats in sorted(self._stats.items()):
+                streams.setdefault(stream, {})[endpoint] = {
+                    **{f"{stage}_seconds": 0.0 for stage in STAGES},
+                    **dict.fromkeys(COUNTERS, 0),
+                    **stats,
+                }
+            quota = {
+                "limit_left": self._limit_left,
+                "used": (
+                    self._first_limit_left - self._limit_left
+                    if self._first_limit_left is not None
+                    and self._limit_left is not None
+                    else 0
+                ),
+            }
+        return {"streams": streams, "quota": quota}
+
+    def export(self) -> None:
+        """Log the metrics and write them to the configured files."""
+        if not self.enabled:
+            return
+        self._last_export = self._clock()
+        self.log()
+        if self.json_path:
+            self.write_json(self.json_path)
+        if self.prometheus_path:
+            self.write_prometheus(self.prometheus_path)
+
+    def export_if_due(self) -> None:
+        """Export the metrics if ``export_interval`` seconds passed since the last."""
+        if self.enabled and self._clock() - self._last_export >= self.export_interval:
+            self.export()
+
+    def log(self) -> None:
+        """Log the metrics of every stream and endpoint, one line each."""
+        summary = self.summary()
+        for stream, endpoints in summary["streams"].items():
+            for endpoint, stats in endpoints.items():
+                point = {"stream": stream, "endpoint": endpoint, **stats}
+                logger.info("PERF: %s", json.dumps(point), extra=point)
+        logger.info(
+            "PERF: %s",
+            json.dumps({"quota": summary["quota"]}),
+            extra=summary["quota"],
+        )
+
+    def write_json(self, path: str) -> None:
+        """Write the metrics to a JSON file.
+
+        Args:
+            path: Path of the file.
+        """
+        _write_atomically(path, json.dumps(self.summary(), indent=2))
+
+    def write_prometheus(self, path: str) -> None:
+        """Write the metrics to a file in the Prometheus text format.
+
+        The file can be collected with the textfile collector of node_exporter.
+
+        Args:
+            path: Path of the file.
+        """
+        summary = self.summary()
+        points = [
+            (stream, endpoint, stats)
+            for stream, endpoints in summary["streams"].items()
+            for endpoint, stats in endpoints.items()
+        ]
+        lines = [
+            "# HELP tap_jotform_stage_seconds_total Time spent in each sync stage",
+            "# TYPE tap_jotform_stage_seconds_total counter",
+        ]
+        lines.extend(
+            f'tap_jotform_stage_seconds_total{{stream="{stream}",'
+            f'endpoint="{endpoint}",stage="{stage}"}} {stats[f"{stage}_seconds"]}'
+            for stream, endpoint, stats in points
+            for stage in STAGES
+        )
+        for counter, description in _PROMETHEUS_COUNTERS.items():
+            name = f"tap_jotform_{counter}_total"
+            lines.extend((f"# HELP {name} {description}", f"# TYPE {name} counter"))
+            lines.extend(
+                f'{name}{{stream="{stream}",endpoint="{endpoint}"}} '
+                f"{int(stats[counter])}"
+                for stream, endpoint, stats in points
+            )
+        lines.extend(
+            (
+                "# HELP tap_jotform_quota_used Daily API quota used during the sync",
+                "# TYPE tap_jotform_quota_used gauge",
+                f"tap_jotform_quota_used {summary['quota']['used']}",
+            ),
+        )
+        if summary["quota"]["limit_left"] is not None:
+            lines.extend(
+                (
+                    "# HELP tap_jotform_quota_limit_left Remaining daily API quota",
+                    "# TYPE tap_jotform_quota_limit_left gauge",
+                    f"tap_jotform_quota_limit_left {summary['quota']['limit_left']}",
+                ),
+            )
+        _write_atomically(path, "\n".join(lines) + "\n")
+
+
+def _write_atomically(path: str, text: str) -> None:
+    # Readers such as node_exporter never see a partially written file
+    target = Path(path)
+    temporary = target.with_name(f".{target.name}.tmp")
+    temporary.write_text(text)
+    temporary.replace(target)
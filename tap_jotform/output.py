@@ -0,0 +1,322 @@
+"""High-throughput output of Singer messages."""
+
+from __future__ import annotations
+
+import datetime as dt
+import decimal
+import math
+import sys
+from typing import TYPE_CHECKING, Any, override
+
+from singer_sdk.exceptions import EmptySchemaTypeError
+from singer_sdk.io_base import SingerWriter
+from singer_sdk.singerlib import RecordMessage
+
+from tap_jotform import encoding
+
+if TYPE_CHECKING:
+    import logging
+    from collections.abc import Callable
+
+    from singer_sdk.singerlib import Message, SelectionMask
+
+    Conform = Callable[[Any], Any]
+
+#: Types of values decoded from JSON that type conformance leaves unchanged,
+#: unless the schema is an exclusive boolean
+_PLAIN_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def is_array_type(schema: dict[str, Any]) -> bool:
+    """Return whether a schema is an array.
+
+    Same as the private ``is_array_type`` helper of the SDK.
+
+    Raises:
+        EmptySchemaTypeError: If the schema is empty.
+        ValueError: If the schema has no type.
+    """
+    if not schema:
+        raise EmptySchemaTypeError
+    if "anyOf" in schema:
+        return any(is_array_type(subschema) for subschema in schema["anyOf"])
+    if "allOf" in schema:
+        return all(is_array_type(subschema) for subschema in schema["allOf"])
+    if "type" not in schema:
+        msg = f"Could not detect type from schema '{schema}'"
+        raise ValueError(msg)
+    return "array" in schema["type"]
+
+
+def is_boolean_type(schema: dict[str, Any]) -> bool | None:
+    """Return whether a schema allows booleans, or None if it has no type.
+
+    Same as the private ``is_boolean_type`` helper of the SDK.
+    """
+    if "anyOf" not in schema and "type" not in schema:
+        return None
+    for schema_type in schema.get("anyOf", [schema.get("type")]):
+        types = (
+            schema_type.get("type", [])
+            if isinstance(schema_type, dict)
+            else schema_type
+        )
+        if "boolean" in types or types == "boolean":
+            return True
+    return False
+
+
+def is_object_type(schema: dict[str, Any]) -> bool | None:
+    """Return whether a schema allows objects, or None if it has no type.
+
+    Same as the private ``is_object_type`` helper of the SDK.
+    """
+    if "anyOf" not in schema and "type" not in schema:
+        return None
+    return any(
+        "object" in schema_type or schema_type == "object"
+        for schema_type in schema.get("anyOf", [schema.get("type")])
+    )
+
+
+def is_uniform_list(schema: dict[str, Any]) -> bool:
+    """Return whether a schema is an array with a single schema for its items.
+
+    Same as the private ``is_uniform_list`` helper of the SDK.
+    """
+    return (
+        is_array_type(schema) is True
+        and "items" in schema
+        and "prefixItems" not in schema
+        and isinstance(schema["items"], dict)
+    )
+
+
+def is_exclusive_boolean_type(schema: dict[str, Any]) -> bool:
+    """Return whether a schema only allows booleans, and possibly null.
+
+    Same as the private ``_is_exclusive_boolean_type`` helper of the SDK.
+    """
+    if "type" not in schema:
+        return False
+    return (
+        schema["type"] == "boolean"
+        or schema["type"] == ["boolean"]
+        or set(schema["type"]) == {"boolean", "null"}
+    )
+
+
+def conform_primitive(value: Any, schema: dict[str, Any]) -> Any:  # noqa: ANN401, PLR0911
+    """Convert a value that is not an object or an array to a JSON compatible type.
+
+    Same as the private ``_conform_primitive_property`` helper of the SDK.
+
+    Args:
+        value: The value.
+        schema: The schema of the property.
+
+    Returns:
+        The conformed value.
+    """
+    if isinstance(value, dt.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=dt.UTC)
+        return value.isoformat("T", timespec="microseconds")
+    if isinstance(value, dt.date):
+        return value.isoformat()
+    if isinstance(value, dt.timedelta):
+        return (dt.datetime.fromtimestamp(0, dt.UTC) + value).isoformat()
+    if isinstance(value, dt.time):
+        return str(value)
+    if isinstance(value, bytes):
+        # A BIT value of 0 is False and anything else is True
+        return value != b"\x00" if is_boolean_type(schema) else value.hex()
+    if isinstance(value, float | decimal.Decimal):
+        if math.isnan(value) or math.isinf(value):
+            return None
+        return value
+    if is_exclusive_boolean_type(schema):
+        return None if value is None else value != 0
+    return value
+
+
+class RecordConformer:
+    """Conform records to a stream schema with a plan compiled once per stream.
+
+    Records are the same as with the SDK, which removes deselected properties and
+    then conforms types by walking the schema for every record. Here, the selection
+    and the schema are resolved once into a plan of nested functions, and values
+    decoded from JSON that need no conversion are kept as they are.
+
+    Args:
+        stream_name: Name of the stream.
+        schema: Schema of the stream.
+        mask: Selection mask of the stream.
+        logger: Logger to warn about properties missing from the schema.
+    """
+
+    def __init__(
+        self,
+        stream_name: str,
+        schema: dict[str, Any],
+        mask: SelectionMask,
+        logger: logging.Logger,
+    ) -> None:
+        """Compile the plan."""
+        self.stream_name = stream_name
+        self.logger = logger
+        self._unmapped: set[str] = set()
+        self._conform = self._compile_object(schema, mask, (), None)
+
+    def __call__(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Return the conformed copy of a record.
+
+        Args:
+            record: The record, after post-processing.
+
+        Returns:
+            The record to write.
+        """
+        return self._conform(record)
+
+    def _compile_object(
+        self,
+        schema: dict[str, Any],
+        mask: SelectionMask | None,
+        breadcrumb: tuple[str, ...],
+        parent: str | None,
+    ) -> Callable[[dict[str, Any]], dict[str, Any]]:
+        # Deselected properties map to None. Properties are only deselected in
+        # nested objects, not in array items, as in the SDK.
+        plan: dict[str, Conform | None] = {}
+        for name, property_schema in schema.get("properties", {}).items():
+            property_breadcrumb = (*breadcrumb, "properties", name)
+            if mask is not None and not mask[property_breadcrumb]:
+                plan[name] = None
+                continue
+            plan[name] = self._compile_property(
+                property_schema,
+                mask,
+                property_breadcrumb,
+                name if parent is None else f"{parent}.{name}",
+            )
+        additional_properties = bool(schema.get("additionalProperties"))
+
+        def conform_object(obj: dict[str, Any]) -> dict[str, Any]:
+            output: dict[str, Any] = {}
+            unmapped: list[str] = []
+            for name, value in obj.items():
+                if name in plan:
+                    if (conform := plan[name]) is not None:
+                        output[name] = conform(value)
+                elif additional_properties:
+                    output[name] = value
+                else:
+                    unmapped.append(name if parent is None else f"{parent}.{name}")
+            if unmapped:
+                self._warn_unmapped(unmapped)
+            return output
+
+        return conform_object
+
+    def _compile_property(
+        self,
+        schema: dict[str, Any],
+        mask: SelectionMask | None,
+        breadcrumb: tuple[str, ...],
+        path: str,
+    ) -> Conform:
+        conform_items: Callable[[list[Any]], list[Any]] | None = None
+        if is_uniform_list(schema):
+            conform_items = self._compile_items(schema["items"], path)
+
+        conform_object: Callable[[dict[str, Any]], dict[str, Any]] | None = None
+        if is_object_type(schema) and "properties" in schema:
+            conform_object = self._compile_object(schema, mask, breadcrumb, path)
+
+        plain_types = frozenset() if is_exclusive_boolean_type(schema) else _PLAIN_TYPES
+
+        def conform(value: Any) -> Any:  # noqa: ANN401
+            if type(value) in plain_types:
+                return value
+            if conform_items is not None and isinstance(value, list):
+                return conform_items(value)
+            if conform_object is not None and isinstance(value, dict):
+                return conform_object(value)
+            return conform_primitive(value, schema)
+
+        return conform
+
+    def _compile_items(
+        self,
+        schema: dict[str, Any],
+        path: str,
+    ) -> Callable[[list[Any]], list[Any]]:
+        conform_object = None
+        if is_object_type(schema):
+            conform_object = self._compile_object(schema, None, (), path)
+
+        def conform_items(items: list[Any]) -> list[Any]:
+            return [
+                conform_object(item)
+                if conform_object is not None and isinstance(item, dict)
+                else conform_primitive(item, schema)
+                for item in items
+            ]
+
+        return conform_items
+
+    def _warn_unmapped(self, paths: list[str]) -> None:
+        if self._unmapped.issuperset(paths):
+            return
+        self._unmapped.update(paths)
+        self.logger.warning(
+            "Properties %s were present in the '%s' stream but not found in catalog "
+            "schema. Ignoring.",
+            tuple(paths),
+            self.stream_name,
+        )
+
+
+class BufferedWriter(SingerWriter):
+    """Singer writer that can buffer RECORD messages for high-volume streams.
+
+    By default, every message is written and flushed on its own, as with the SDK
+    writer. Once :attr:`buffer_size` is set, RECORD messages are encoded with
+    ``orjson`` when it is installed and collected in a buffer that is written to
+    stdout when it reaches that many bytes. Any other message is written right away
+    along with the buffer, so STATE messages never get ahead of their records.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the writer."""
+        super().__init__()
+        self.buffer_size = 0
+        self._buffer = bytearray()
+
+    @override
+    def write_message(self, message: Message) -> None:
+        if not self.buffer_size:
+            super().write_message(message)
+            return
+        self._buffer += encoding.dumps_line(message.to_dict())
+        if (
+            not isinstance(message, RecordMessage)
+            or len(self._buffer) >= self.buffer_size
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered messages to stdout."""
+        if not self._buffer:
+            return
+        # Resolved on every flush, so stdout can be redirected
+        stdout = sys.stdout
+        if (binary := getattr(stdout, "buffer", None)) is not None:
+            stdout.flush()
+            binary.write(self._buffer)
+            binary.flush()
+        else:
+            stdout.write(self._buffer.decode())
+            stdout.flush()
+        self._buffer.clear()
@@ -0,0 +1,111 @@
+"""Request pacing based on the remaining Jotform API quota."""
+
+from __future__ import annotations
+
+import datetime as dt
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+def seconds_until_midnight_utc() -> float:
+    """Return the number of seconds until the daily quota resets."""
+    now = dt.datetime.now(dt.UTC)
+    tomorrow = (now + dt.timedelta(days=1)).replace(
+        hour=0,
+        minute=0,
+        second=0,
+        microsecond=0,
+    )
+    return (tomorrow - now).total_seconds()
+
+
+class QuotaScheduler:
+    """Pace requests across all streams according to the remaining daily quota.
+
+    Every request reserves a time slot before it is sent. While the quota reported
+    by the API in ``limit-left`` is above ``throttle_below`` slots are granted
+    immediately. Below that, requests are spread out so the remaining quota would
+    last until the daily reset, increasingly so as it approaches zero. Once the
+    quota is exhausted, requests can pause until the reset instead of failing.
+
+    Args:
+        throttle_below: Remaining quota below which requests start being throttled.
+        pause_when_exhausted: Whether to wait for the quota reset when exhausted.
+        max_pause: Maximum number of seconds to wait for the quota reset.
+        seconds_until_reset: Callable returning the seconds until the quota resets.
+        clock: Monotonic clock.
+        sleep: Sleep function.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        throttle_below: int = 100,
+        pause_when_exhausted: bool = False,
+        max_pause: float = 86400,
+        seconds_until_reset: Callable[[], float] = seconds_until_midnight_utc,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.throttle_below = throttle_below
+        self.pause_when_exhausted = pause_when_exhausted
+        self.max_pause = max_pause
+        self._seconds_until_reset = seconds_until_reset
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._limit_left: int | None = None
+        self._next_slot = 0.0
+
+    @property
+    def limit_left(self) -> int | None:
+        """Last remaining quota reported by the API, if any."""
+        return self._limit_left
+
+    def interval(self) -> float:
+        """Return the minimum number of seconds between two requests."""
+        limit_left = self._limit_left
+        if limit_left is None or limit_left >= self.throttle_below:
+            return 0.0
+
+        pressure = 1 - limit_left / self.throttle_below
+        return pressure * self._seconds_until_reset() / limit_left
+
+    def acquire(self) -> None:
+        """Block until the next request is allowed to be sent."""
+        with self._lock:
+            now = self._clock()
+            slot = max(self._next_slot, now)
+            if self._limit_left is not None and self._limit_left <= 0:
+                if self.pause_when_exhausted:
+                    slot += min(self._seconds_until_reset(), self.max_pause)
+                # The quota is assumed to be restored after the reset
+                self._limit_left = None
+                self._next_slot = slot
+            else:
+                self._next_slot = slot + self.interval()
+
+        if (wait := slot - now) > 0:
+            logger.info("Waiting %.2f seconds for API quota", wait)
+            self._sleep(wait)
+
+    def update(self, limit_left: int) -> None:
+        """Record the remaining quota reported by the API.
+
+        Args:
+            limit_left: Value of ``limit-left`` in the last response.
+        """
+        with self._lock:
+            self._limit_left = limit_left
+
+    def exhaust(self) -> None:
+        """Record that the API rejected a request because of the quota."""
+        self.update(0)
@@ -0,0 +1,255 @@
+"""Retries and hedged requests tuned to the errors of the Jotform API."""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+import requests
+from singer_sdk.exceptions import RetriableAPIError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+logger = logging.getLogger(__name__)
+
+#: Base and maximum number of seconds to wait before retrying, per error class.
+#: Quota errors wait the longest, although an exhausted daily quota can be handled
+#: by pausing requests until it resets. Timeouts are retried soon, since they are
+#: usually caused by a single stalled request rather than an overloaded API.
+BACKOFF = {
+    "quota": (10.0, 300.0),
+    "server": (2.0, 60.0),
+    "timeout": (0.5, 10.0),
+    "connection": (1.0, 30.0),
+}
+
+
+def classify_error(exception: BaseException) -> str:
+    """Return the class of a retriable request error.
+
+    Args:
+        exception: The error raised by a request.
+
+    Returns:
+        One of the keys of ``BACKOFF``.
+    """
+    if isinstance(exception, RetriableAPIError):
+        response = exception.response
+        if (
+            response is not None
+            and response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+        ):
+            return "quota"
+        return "server"
+    if isinstance(exception, requests.exceptions.Timeout):
+        return "timeout"
+    return "connection"
+
+
+def _retry_after(exception: BaseException) -> float | None:
+    response = getattr(exception, "response", None)
+    value = response.headers.get("Retry-After") if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class RetryPolicy:
+    """Backoff of failed requests per error class, within a retry budget.
+
+    Waits grow exponentially with the number of errors of the same class for a
+    request, with full jitter, up to the maximum of the class. A ``Retry-After``
+    header is honored instead when the API sends one. Once ``budget`` retries have
+    been spent by all the requests of a run, failed requests are no longer retried.
+
+    Args:
+        max_tries: Maximum number of attempts of a request.
+        budget: Maximum number of retries in a run, or None for no limit.
+        backoff: Base and maximum waits per error class.
+        uniform: Random number generator, for the jitter.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_tries: int = 5,
+        budget: int | None = None,
+        backoff: dict[str, tuple[float, float]] = BACKOFF,
+        uniform: Callable[[float, float], float] = random.uniform,
+    ) -> None:
+        """Initialize the policy."""
+        self.max_tries = max_tries
+        self.budget = budget
+        self.backoff = backoff
+        self._uniform = uniform
+        self._lock = threading.Lock()
+        self.retries: Counter[str] = Counter()
+
+    def consume(self, error: str) -> bool:
+        """Spend a retry of the budget.
+
+        Args:
+            error: The class of the error.
+
+        Returns:
+            False if the budget is spent.
+        """
+        with self._lock:
+            if self.budget is not None and self.retries.total() >= self.budget:
+                return False
+            self.retries[error] += 1
+            return True
+
+    def wait(self, error: str, attempt: int, exception: BaseException) -> float:
+        """Return the number of seconds to wait before retrying a request.
+
+        Args:
+            error: The class of the error.
+            attempt: Number of errors of the same class for the request.
+            exception: The error.
+
+        Returns:
+            Seconds to wait.
+        """
+        base, maximum = self.backoff[error]
+        if (retry_after := _retry_after(exception)) is not None:
+            return min(retry_after, maximum)
+        return self._uniform(0, min(maximum, base * 2 ** (attempt - 1)))
+
+    def waits(self) -> Generator[float, Any, None]:
+        """Generate the waits between the attempts of a request.
+
+        The generator is sent the error of each failed attempt, and stops when the
+        retry budget is spent.
+
+        Yields:
+            Seconds to wait before the next attempt.
+        """
+        attempts: Counter[str] = Counter()
+        exception = yield 0.0
+        while True:
+            error = classify_error(exception)
+            if not self.consume(error):
+                logger.warning("Retry budget of %s retries is spent", self.budget)
+                return
+            attempts[error] += 1
+            exception = yield self.wait(error, attempts[error], exception)
+
+
+class Hedger:
+    """Send a duplicate of requests slower than a percentile of recent latencies.
+
+    The first successful response is used and the other one is closed. Only
+    idempotent requests may be hedged.
+
+    Args:
+        executor: Pool sending the requests and their duplicates.
+        percentile: Percentile of the latencies of recent requests after which a
+            duplicate request is sent.
+        min_samples: Number of latencies to observe before hedging requests.
+        max_hedges: Maximum number of duplicate requests in flight.
+        window: Number of recent latencies kept.
+        clock: Monotonic clock.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        executor: Executor,
+        percentile: float = 95,
+        min_samples: int = 20,
+        max_hedges: int = 1,
+        window: int = 200,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """Initialize the hedger."""
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hedge_slots = threading.BoundedSemaphore(max_hedges)
+        self._pool = executor
+
+    def threshold(self) -> float | None:
+        """Return the latency after which requests are hedged, if known."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        index = round(self.percentile / 100 * (len(latencies) - 1))
+        return latencies[index]
+
+    def observe(self, seconds: float) -> None:
+        """Record the latency of a successful request.
+
+        Args:
+            seconds: Time it took to receive the response.
+        """
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def send(
+        self,
+        request: Callable[[], requests.Response],
+        can_hedge: Callable[[], bool],
+    ) -> requests.Response:
+        """Send a request, and a duplicate if it is too slow.
+
+        Args:
+            request: Function sending the request.
+            can_hedge: Called before sending a duplicate. No duplicate is sent if it
+                returns False.
+
+        Returns:
+            The first successful response.
+        """
+        start = self._clock()
+        threshold = self.threshold()
+        if threshold is None:
+            response = request()
+            self.observe(self._clock() - start)
+            return response
+
+        primary = self._pool.submit(request)
+        done, _ = wait([primary], timeout=threshold)
+        if done or not self._hedge_slots.acquire(blocking=False):
+            return self._result(primary, start)
+        if not can_hedge():
+            self._hedge_slots.release()
+            return self._result(primary, start)
+
+        hedge = self._pool.submit(request)
+        hedge.add_done_callback(lambda _: self._hedge_slots.release())
+        pending: set[Future[requests.Response]] = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.add_done_callback(_close_response)
+                    return self._result(future, start)
+        # Both requests failed
+        return primary.result()
+
+    def _result(
+        self,
+        future: Future[requests.Response],
+        start: float,
+    ) -> requests.Response:
+        response = future.result()
+        self.observe(self._clock() - start)
+        return response
+
+
+def _close_response(future: Future[requests.Response]) -> None:
+    if future.exception() is None:
+        future.result().close()
@@ -0,0 +1,113 @@
+"""Incremental parsing of Jotform API responses."""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any
+
+from tap_jotform import encoding
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+_STRUCTURAL = re.compile(rb'["{}\[\]]')
+_STRING_END = re.compile(rb'["\\]')
+
+_BEFORE_CONTENT = 0
+_IN_CONTENT = 1
+_AFTER_CONTENT = 2
+
+
+class ContentParser:
+    """Yield the items of the top-level ``content`` array as the body is read.
+
+    Only the bytes of the item being read are kept in memory. Everything outside
+    of the ``content`` array, e.g. ``limit-left``, is available in :attr:`envelope`
+    once all items have been read.
+
+    Args:
+        chunks: Chunks of the response body.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        """Initialize the parser."""
+        self._chunks = chunks
+        self.envelope: dict[str, Any] = {}
+
+    def __iter__(self) -> Iterator[Any]:  # noqa: C901, PLR0912, PLR0915
+        """Iterate over the items of the ``content`` array."""
+        buffer = b""
+        skeleton: list[bytes] = []
+        start = pos = 0
+        depth = 0
+        state = _BEFORE_CONTENT
+        in_string = False
+        string_start = item_start = -1
+        key = b""
+
+        for chunk in self._chunks:
+            buffer = buffer[start:] + chunk
+            pos -= start
+            string_start -= start
+            item_start -= start
+            start = 0
+
+            while True:
+                if in_string:
+                    match = _STRING_END.search(buffer, pos)
+                    if match is None:
+                        pos = len(buffer)
+                        break
+                    if match[0] == b"\\":
+                        if match.end() == len(buffer):
+                            # The escaped character is in the next chunk
+                            pos = match.start()
+                            break
+                        pos = match.end() + 1
+                        continue
+                    in_string = False
+                    pos = match.end()
+                    if depth == 1:
+                        key = buffer[string_start + 1 : match.start()]
+                    continue
+
+                match = _STRUCTURAL.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    break
+
+                token = match[0]
+                pos = match.end()
+                if token == b'"':
+                    in_string = True
+                    string_start = match.start()
+                elif token in {b"{", b"["}:
+                    depth += 1
+                    if state == _IN_CONTENT and depth == 3:  # noqa: PLR2004
+                        item_start = match.start()
+                    elif (
+                        state == _BEFORE_CONTENT
+                        and depth == 2  # noqa: PLR2004
+                        and token == b"["
+                        and key == b"content"
+                    ):
+                        skeleton.append(buffer[start:pos])
+                        start = pos
+                        state = _IN_CONTENT
+                else:
+                    depth -= 1
+                    if state != _IN_CONTENT:
+                        continue
+                    if depth == 2:  # noqa: PLR2004
+                        yield encoding.loads(buffer[item_start:pos])
+                        item_start = -1
+                        start = pos
+                    elif depth == 1:
+                        start = match.start()
+                        state = _AFTER_CONTENT
+
+            if state == _IN_CONTENT and item_start < 0:
+                start = pos
+
+        skeleton.append(buffer[start:])
+        self.envelope = encoding.loads(b"".join(skeleton))
@@ -2,29 +2,54 @@
 
 from __future__ import annotations
 
-import json
+import datetime as dt
+from functools import cached_property
+from itertools import chain
 from typing import TYPE_CHECKING, Any, override
 
+from singer_sdk import Stream
 from singer_sdk import typing as th  # JSON Schema typing helpers
 from singer_sdk.helpers.conform import TypeConformanceLevel
+from singer_sdk.singerlib.catalog import REPLICATION_INCREMENTAL
 
-from tap_jotform.client import JotformPaginatedStream, JotformStream
+from tap_jotform import encoding
+from tap_jotform.client import (
+    FILTER_DATETIME_FORMAT,
+    JotformPaginatedStream,
+    JotformStream,
+    date_windows,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator, Iterable, Iterator
 
-    import requests
     from singer_sdk.helpers.types import Context, Record
 
+    AnswersTransform = Callable[[dict[str, dict[str, Any]]], list[dict[str, Any]]]
+
 CREATED_AT = th.Property("created_at", th.DateTimeType)
 UPDATED_AT = th.Property("updated_at", th.DateTimeType)
 
+HISTORY_DATE_FORMAT = "%m/%d/%Y"
+
+# Days of history synced without a bookmark or start date, like the `lastWeek` range
+DEFAULT_HISTORY_DAYS = 7
+
+DEPRECATED_ANSWER_BREADCRUMB = (
+    "properties",
+    "answers",
+    "items",
+    "properties",
+    "answer",
+)
+
 
 class FormsStream(JotformPaginatedStream):
     """Forms stream."""
 
     name = "forms"
     path = "/user/forms"
+    replication_key = "updated_at"
 
     INTEGER_FIELDS = (
         "height",
@@ -63,13 +88,105 @@ class FormsStream(JotformPaginatedStream):
         th.Property("archived", th.IntegerType),
     ).to_dict()
 
+    @override
+    def get_filter_start(self, context: Context | None) -> str | None:
+        """Return the lower bound of the replication key filter.
+
+        Child streams are only synced for the forms that are emitted, and e.g. new
+        submissions do not change the ``updated_at`` of a form. So all forms are
+        requested when a child stream is selected.
+        """
+        if self.has_selected_descendents:
+            return None
+        return super().get_filter_start(context)
+
+    @override
+    def fetch_records(self, context: Context | None) -> Iterable[Record]:
+        """Return forms, adding them to the form index as they are fetched.
+
+        The index is complete once every form has been fetched without a filter.
+        When the stream is only synced for its children, forms are returned from
+        the most to the least recently submitted to, so the children of active
+        forms are synced first.
+        """
+        index = self.form_index
+        lists_all = (
+            self.get_filter_start(context) is None
+            and self.record_index is None
+            and not (self.resumable and "resume" in self.get_context_state(context))
+        )
+        records = self._index_records(super().fetch_records(context))
+        if self.selected:
+            yield from records
+        else:
+            yield from sorted(
+                records,
+                key=lambda record: record["last_submission"] or "",
+                reverse=True,
+            )
+        if lists_all:
+            index.mark_complete()
+
+    @override
+    @property
+    def resumable(self) -> bool:
+        """Whether page offsets are checkpointed.
+
+        Forms only synced for their children are sorted once every page has been
+        fetched, before any child is synced, so their offsets are not checkpointed.
+        """
+        return self.selected and super().resumable
+
+    def _index_records(self, records: Iterable[Record]) -> Iterator[Record]:
+        index = self.form_index
+        for record in records:
+            index.add(record)
+            yield record
+
+    def list_forms(self) -> Iterable[Record]:
+        """Request every form, without emitting them nor changing the state.
+
+        Returns:
+            An iterable of form records, as returned by the API.
+        """
+        return self.request_records({"filter": {}})
+
     @override
     def get_child_context(self, record: Record, context: Context | None) -> Context:
+        """Return the form ID.
+
+        Children look up the other attributes of the form in the form index.
+        """
         return {"form_id": record["id"]}
 
 
+def skip_inactive_form(stream: JotformStream, context: Context) -> bool:
+    """Return whether the context of a child of forms is a form to skip.
+
+    Deleted and archived forms are skipped when ``form_index.skip_inactive`` is
+    enabled.
+
+    Args:
+        stream: The child stream.
+        context: The child context.
+
+    Returns:
+        True if no requests should be sent for the form.
+    """
+    if not (stream.config.get("form_index") or {}).get("skip_inactive"):
+        return False
+    form = stream.form_index.get(context["form_id"])
+    return form is not None and not form.active
+
+
 class QuestionsStream(JotformStream):
-    """Questions stream."""
+    """Questions stream.
+
+    With ``skip_unchanged_questions`` enabled, the ``updated_at`` of each form in
+    the form index is kept in its state partition, and forms that have not been
+    updated since their questions were last synced are skipped without sending any
+    request.
+    """
 
     INTEGER_FIELDS = ("order",)
 
@@ -102,13 +219,38 @@ class QuestionsStream(JotformStream):
         ),
     ).to_dict()
 
+    @property
+    def skip_unchanged(self) -> bool:
+        """Whether to skip forms that have not changed since the last sync."""
+        return bool(self.config.get("skip_unchanged_questions"))
+
+    @override
+    def should_skip(self, context: Context) -> bool:
+        if skip_inactive_form(self, context):
+            return True
+        if not self.skip_unchanged:
+            return False
+        form = self.form_index.get(context["form_id"])
+        state = self.get_context_state(context)
+        return form is not None and state.get("form_updated_at") == form.updated_at
+
     @override
-    def parse_response(
+    def get_records(self, context: Context | None) -> Iterable[Record]:
+        yield from super().get_records(context)
+        if (
+            self.skip_unchanged
+            and context is not None
+            and (form := self.form_index.get(context["form_id"]))
+            and form.updated_at
+        ):
+            self.get_context_state(context)["form_updated_at"] = form.updated_at
+
+    @override
+    def extract_records(
         self,
-        response: requests.Response,
+        content: dict[str, dict[str, Any]],
     ) -> Generator[Record, None, None]:
-        """Parse the response and return an iterator of result rows."""
-        for qid, question in response.json()["content"].items():
+        for qid, question in content.items():
             yield {
                 "qid": qid,
                 "type": question["type"],
@@ -122,11 +264,96 @@ class SubmissionsStream(JotformPaginatedStream):
 
     name = "submissions"
     path = "/user/submissions"
+    replication_key = "updated_at"
 
     INTEGER_FIELDS = (
         "flag",
         "new",
     )
+    STREAMING_SUPPORTED = True
+
+    _child_answers: dict[str, dict[str, dict[str, Any]]]
+    _forms_activity: str | None
+
+    @override
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the stream object."""
+        super().__init__(*args, **kwargs)
+        self._child_answers = {}
+        self._forms_activity = None
+
+    def forms_activity(self, context: Context | None) -> str | None:
+        """Return the digest of the activity of all forms, if syncs can be skipped.
+
+        Forms are listed first if the form index is not complete yet.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The digest, or None if ``skip_unchanged_submissions`` does not apply.
+        """
+        if (
+            not self.config.get("skip_unchanged_submissions")
+            or context is not None
+            or self.parent_stream_type is not None
+            or self.replication_method != REPLICATION_INCREMENTAL
+        ):
+            return None
+        # A separate forms stream, since this may run in the background while the
+        # tap's forms stream paginates and checkpoints its own sync
+        self.form_index.ensure_complete(FormsStream(self._tap).list_forms)
+        return self.form_index.activity_digest()
+
+    @override
+    def get_records(self, context: Context | None) -> Iterable[Record]:
+        yield from super().get_records(context)
+        # Saved from the main thread once every record has been emitted
+        if self._forms_activity is not None:
+            self.get_context_state(context)["forms_activity"] = self._forms_activity
+
+    @override
+    def fetch_records(self, context: Context | None) -> Iterable[Record]:
+        """Return records, fetching backfill windows concurrently if enabled.
+
+        Nothing is requested if no form has new submissions since the last sync.
+        """
+        self._forms_activity = self.forms_activity(context)
+        state = self.get_context_state(context)
+        if (
+            self._forms_activity is not None
+            and state.get("forms_activity") == self._forms_activity
+        ):
+            self.logger.info("No form has new submissions since the last sync")
+            return
+
+        windows = self.backfill_windows(context)
+        if not windows:
+            yield from super().fetch_records(context)
+            return
+
+        records = self.request_partitions(windows)
+        if self.record_index is not None:
+            # Backfills start without a bookmark
+            yield from self.skip_emitted(records, previous=False)
+            return
+
+        # Only records created exactly at a boundary shared by two windows are
+        # returned twice, so only their IDs are kept
+        second = dt.timedelta(seconds=1)
+        boundaries = {
+            (
+                dt.datetime.fromisoformat(window["filter"]["created_at:lt"]) - second
+            ).strftime(FILTER_DATETIME_FORMAT)
+            for window in windows[:-1]
+        }
+        seen: set[str] = set()
+        for record in records:
+            if record["created_at"] in boundaries:
+                if record["id"] in seen:
+                    continue
+                seen.add(record["id"])
+            yield record
 
     schema = th.PropertiesList(
         th.Property("id", th.StringType, description="The Submission ID"),
@@ -174,6 +401,50 @@ class SubmissionsStream(JotformPaginatedStream):
         ),
     ).to_dict()
 
+    @cached_property
+    def answers_transform(self) -> AnswersTransform | None:
+        """Transform for the ``answers`` of each submission, built once per sync.
+
+        The deprecated ``answer`` string is only serialized when it is selected.
+
+        Returns:
+            The transform, or None if ``answers`` is not selected.
+        """
+        if not self.is_property_selected("answers"):
+            return None
+
+        if not self.mask[DEPRECATED_ANSWER_BREADCRUMB]:
+
+            def transform(answers: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+                result = []
+                for qid, entry in answers.items():
+                    value = {"qid": qid, **entry}
+                    value["answer_object"] = value.pop("answer", None)
+                    result.append(value)
+                return result
+
+            return transform
+
+        dumps = encoding.dumps
+
+        def transform_with_answer(
+            answers: dict[str, dict[str, Any]],
+        ) -> list[dict[str, Any]]:
+            result = []
+            for qid, entry in answers.items():
+                answer = entry.get("answer")
+                result.append(
+                    {
+                        "qid": qid,
+                        **entry,
+                        "answer": dumps(answer) if answer is not None else None,
+                        "answer_object": answer,
+                    },
+                )
+            return result
+
+        return transform_with_answer
+
     @override
     def post_process(self, row: Record, context: Context | None = None) -> Record:
         """Post-process a row.
@@ -186,18 +457,194 @@ class SubmissionsStream(JotformPaginatedStream):
             The processed row of data.
         """
         row = super().post_process(row, context)
+        answers = row.pop("answers", None) or {}
+        if self.answers_child_selected:
+            self._child_answers[row["id"]] = answers
+        if (transform := self.answers_transform) is not None:
+            row["answers"] = transform(answers)
+        return row
+
+    @cached_property
+    def answers_child_selected(self) -> bool:
+        """Whether the raw answers are needed by a selected child stream."""
+        return any(
+            isinstance(child, SubmissionAnswersStream) and child.selected
+            for child in self.child_streams
+        )
+
+    @override
+    def get_child_context(self, record: Record, context: Context | None) -> Context:
+        """Return the submission and its raw answers.
+
+        The answers are passed in the context so the answers stream is generated
+        in the same pass as submissions. They are kept even if ``answers`` is
+        deselected in this stream.
+        """
+        return {
+            "submission_id": record["id"],
+            "form_id": record["form_id"],
+            "created_at": record["created_at"],
+            "answers": self._child_answers.pop(record["id"], {}),
+        }
+
+
+class FormSubmissionsStream(SubmissionsStream):
+    """Submissions stream, synced form by form.
+
+    Each form is a state partition with its own bookmark. Forms whose submission
+    count and last submission date have not changed since the last incremental
+    sync are skipped without sending any request.
+    """
+
+    path = "/form/{form_id}/submissions"
+    parent_stream_type = FormsStream
+
+    @override
+    def should_skip(self, context: Context) -> bool:
+        if skip_inactive_form(self, context):
+            return True
+        if self.replication_method != REPLICATION_INCREMENTAL:
+            return False
+        form = self.form_index.get(context["form_id"])
+        state = self.get_context_state(context)
+        return form is not None and state.get("form_activity") == form.activity
+
+    @override
+    def backfill_windows(self, context: Context | None) -> list[Context]:
+        # Forms are already synced as separate partitions
+        return []
+
+    @override
+    def get_records(self, context: Context | None) -> Iterable[Record]:
+        yield from super().get_records(context)
+        if context is not None and (form := self.form_index.get(context["form_id"])):
+            self.get_context_state(context)["form_activity"] = form.activity
+
+
+def answer_columns(answer: Any) -> dict[str, Any]:  # noqa: ANN401
+    """Split an answer into typed columns, depending on its shape.
+
+    Args:
+        answer: The answer value.
+
+    Returns:
+        The answer columns. Only the column matching the shape is set.
+    """
+    columns: dict[str, Any] = {
+        "answer_text": None,
+        "answer_number": None,
+        "answer_items": None,
+        "answer_json": None,
+    }
+    if isinstance(answer, str):
+        columns["answer_text"] = answer
+    elif isinstance(answer, int | float) and not isinstance(answer, bool):
+        columns["answer_number"] = answer
+    elif isinstance(answer, list) and all(isinstance(item, str) for item in answer):
+        columns["answer_items"] = answer
+    elif answer is not None:
+        columns["answer_json"] = encoding.dumps(answer)
+    return columns
+
+
+class SubmissionAnswersStream(Stream):
+    """Submission answers stream, one row per submission and question.
+
+    Rows are built from the answers of each submission as it is synced, without
+    sending any request. Deselect ``answers`` in the submissions stream to only
+    emit answers in this layout.
+    """
+
+    name = "submission_answers"
+    primary_keys = ("submission_id", "qid")
+    replication_key = None
+    parent_stream_type: type[Stream] = SubmissionsStream
+    state_partitioning_keys = ()
+    selected_by_default = False
+
+    schema = th.PropertiesList(
+        th.Property("submission_id", th.StringType, required=True),
+        th.Property("qid", th.StringType, required=True, description="Question ID"),
+        th.Property("form_id", th.StringType),
+        CREATED_AT,
+        th.Property("name", th.StringType, description="Question name"),
+        th.Property("type", th.StringType, description="Question type"),
+        th.Property("text", th.StringType, description="Question text"),
+        th.Property("order", th.IntegerType, description="Question order"),
+        th.Property(
+            "answer_text",
+            th.StringType,
+            description="The answer, if it is a string",
+        ),
+        th.Property(
+            "answer_number",
+            th.NumberType,
+            description="The answer, if it is a number",
+        ),
+        th.Property(
+            "answer_items",
+            th.ArrayType(th.StringType),
+            description="The answer, if it is a list of strings",
+        ),
+        th.Property(
+            "answer_json",
+            th.StringType,
+            description="Any other answer, e.g. an object, encoded as JSON",
+        ),
+        th.Property(
+            "pretty_format",
+            th.StringType,
+            description="The answer formatted as text by Jotform",
+        ),
+    ).to_dict()
+
+    _answers: dict[str, dict[str, Any]]
+    _schema_written: bool
+
+    @override
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the stream object."""
+        super().__init__(*args, **kwargs)
+        self._answers = {}
+        self._schema_written = False
+
+    @override
+    def preprocess_context(self, context: Context) -> Context:
+        self._answers = context.get("answers") or {}
+        return {key: value for key, value in context.items() if key != "answers"}
+
+    @override
+    def _write_schema_message(self) -> None:
+        # The stream is synced once per submission, but its schema never changes
+        if not self._schema_written:
+            super()._write_schema_message()
+            self._schema_written = True
 
-        answers_list = []
-        answers: dict[str, dict[str, str | None]] = row.pop("answers", {})
+    @override
+    def get_records(self, context: Context | None) -> Iterable[Record]:
+        if context is None:
+            return
+        answers, self._answers = self._answers, {}
         for qid, entry in answers.items():
-            answer = entry.get("answer")
-            entry["answer"] = json.dumps(answer) if answer is not None else None
-            entry["answer_object"] = answer
-            value: dict[str, str | None] = {"qid": qid, **entry}
-            answers_list.append(value)
-        row["answers"] = answers_list
+            order = entry.get("order")
+            yield {
+                "submission_id": context["submission_id"],
+                "qid": qid,
+                "form_id": context["form_id"],
+                "created_at": context["created_at"],
+                "name": entry.get("name"),
+                "type": entry.get("type"),
+                "text": entry.get("text"),
+                "order": int(order) if order else None,
+                **answer_columns(entry.get("answer")),
+                "pretty_format": entry.get("prettyFormat"),
+            }
 
-        return row
+
+class FormSubmissionAnswersStream(SubmissionAnswersStream):
+    """Submission answers stream, for submissions synced form by form."""
+
+    parent_stream_type = FormSubmissionsStream
 
 
 class ReportsStream(JotformStream):
@@ -247,17 +694,28 @@ class ReportsStream(JotformStream):
             The processed row of data.
         """
         row = super().post_process(row, context)
-        fields = row.get("fields") or ""
-        row["fields"] = fields.split(",")
+        if self.is_property_selected("fields"):
+            fields = row.get("fields") or ""
+            row["fields"] = fields.split(",")
         return row
 
 
 class UserHistory(JotformStream):
-    """User History stream."""
+    """User History stream.
+
+    History is synced incrementally by ``timestamp``, from the bookmark or the
+    ``start_date``, in windows of ``history_window_days`` requested concurrently.
+    The API filters history by day, in the time zone of the account, so each window
+    is requested with a day of margin on both sides and its entries are then
+    filtered by their timestamp. Every entry is thus emitted by exactly one window.
+    """
 
     name = "user_history"
     path = "/user/history"
     primary_keys = ("username", "timestamp", "type")
+    replication_key = "timestamp"
+
+    INTEGER_FIELDS = ("timestamp",)
 
     schema = th.PropertiesList(
         th.Property(
@@ -289,21 +747,125 @@ class UserHistory(JotformStream):
         th.Property("subuser", th.StringType),
     ).to_dict()
 
+    def history_start(self, context: Context | None) -> dt.datetime:
+        """Return the time from which history is synced.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The bookmark moved back by ``lookback_window_seconds``, or the start
+            date, or a week ago if there is neither.
+        """
+        # The SDK falls back to the start date when there is no bookmark
+        value = self.get_starting_replication_key_value(context)
+        if value is None:
+            value = self.config.get("start_date")
+        if value is None:
+            return dt.datetime.now(dt.UTC) - dt.timedelta(days=DEFAULT_HISTORY_DAYS)
+        if isinstance(value, int) or str(value).isdigit():
+            return dt.datetime.fromtimestamp(int(value), dt.UTC) - dt.timedelta(
+                seconds=self.config.get("lookback_window_seconds", 0),
+            )
+        start = dt.datetime.fromisoformat(value)
+        return start if start.tzinfo else start.replace(tzinfo=dt.UTC)
+
+    def history_windows(self, context: Context | None) -> list[Context]:
+        """Split the history to sync into windows of ``history_window_days``.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            A context with the ``start`` and ``end`` timestamps of each window. The
+            last window has no end, so entries logged during the sync are included.
+        """
+        start = self.history_start(context)
+        windows = date_windows(
+            start,
+            dt.datetime.now(dt.UTC),
+            dt.timedelta(days=self.config.get("history_window_days", 7)),
+        ) or [(start, start)]
+        return [
+            {
+                "start": int(window_start.timestamp()),
+                "end": int(window_end.timestamp()) if i < len(windows) - 1 else None,
+            }
+            for i, (window_start, window_end) in enumerate(windows)
+        ]
+
+    @override
+    def fetch_records(self, context: Context | None) -> Iterable[Record]:
+        """Return the history of every window, in order."""
+        return self.request_partitions(self.history_windows(context))
+
+    @override
+    def request_records(self, context: Context | None) -> Iterable[Record]:
+        """Request the history of a window, keeping only the entries within it.
+
+        Args:
+            context: A window from ``history_windows``.
+
+        Yields:
+            History entries logged within the window.
+        """
+        start, end = (context or {}).get("start"), (context or {}).get("end")
+        for record in super().request_records(context):
+            timestamp = int(record["timestamp"])
+            if (start is None or timestamp >= start) and (
+                end is None or timestamp < end
+            ):
+                yield record
+
     @override
     def get_url_params(
         self,
         context: Context | None,
         next_page_token: Any | None,
     ) -> dict[str, Any] | str:
-        return {
-            "action": "all",
-            "date": "lastWeek",
-            "sortBy": "ASC",
-        }
+        params: dict[str, Any] = {"action": "all", "sortBy": "ASC"}
+        if context is None or "start" not in context:
+            params["date"] = "lastWeek"
+            return params
+        day = dt.timedelta(days=1)
+        start = dt.datetime.fromtimestamp(context["start"], dt.UTC) - day
+        end = (
+            dt.datetime.fromtimestamp(context["end"], dt.UTC)
+            if context["end"] is not None
+            else dt.datetime.now(dt.UTC)
+        ) + day
+        params["startDate"] = start.strftime(HISTORY_DATE_FORMAT)
+        params["endDate"] = end.strftime(HISTORY_DATE_FORMAT)
+        return params
+
+
+def walk_folders(root: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield a folder and all its subfolders, depth first, without recursion.
+
+    The subfolders of a folder are read before it is yielded, so it can be changed
+    by the caller.
+
+    Args:
+        root: The folder.
+
+    Yields:
+        The folder, then its subfolders.
+    """
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        stack.extend(reversed(folder.get("subfolders") or []))
+        yield folder
 
 
 class FoldersStream(JotformStream):
-    """Folders stream."""
+    """Folders stream.
+
+    The API returns the root folder, with its subfolders nested in it. With
+    ``compact_folders`` enabled, every folder is a record of its own, with only the
+    IDs of its subfolders and without its ``forms`` map. Folder membership of forms
+    is emitted by the ``folder_forms`` child stream, in both layouts.
+    """
 
     name = "folders"
     path = "/user/folders"
@@ -351,15 +913,118 @@ class FoldersStream(JotformStream):
         th.Property("subfolders", th.ArrayType(th.ObjectType())),
     ).to_dict()
 
+    _memberships: dict[str, Iterator[tuple[str, str]]]
+
+    @override
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the stream object."""
+        super().__init__(*args, **kwargs)
+        self._memberships = {}
+
+    @property
+    def compact(self) -> bool:
+        """Whether every folder is a record of its own."""
+        return bool(self.config.get("compact_folders"))
+
+    @cached_property
+    def folder_forms_selected(self) -> bool:
+        """Whether folder membership is needed by a selected child stream."""
+        return any(
+            isinstance(child, FolderFormsStream) and child.selected
+            for child in self.child_streams
+        )
+
+    @override
+    def extract_records(self, content: Any) -> Iterable[Record]:
+        roots = super().extract_records(content)
+        if not self.compact:
+            return roots
+        return (folder for root in roots for folder in walk_folders(root))
+
     @override
     def post_process(self, row: Record, context: Context | None = None) -> Record:
-        forms = {
-            form_id: JotformStream.post_process(self, form, context)
-            for form_id, form in row.pop("forms", {}).items()
-        }
-        row["forms"] = forms
+        forms = row.pop("forms", None) or {}
+        if self.folder_forms_selected:
+            # Subfolders are records of their own in the compact layout
+            folders = [] if self.compact else row.get("subfolders") or []
+            self._memberships[row["id"]] = chain(
+                ((row["id"], form_id) for form_id in forms),
+                (
+                    (folder["id"], form_id)
+                    for subfolder in folders
+                    for folder in walk_folders(subfolder)
+                    for form_id in folder.get("forms") or {}
+                ),
+            )
+        if self.compact:
+            row["subfolders"] = [
+                {"id": subfolder["id"]} for subfolder in row.get("subfolders") or []
+            ]
+        elif self.is_property_selected("forms"):
+            row["forms"] = {
+                form_id: JotformStream.post_process(self, form, context)
+                for form_id, form in forms.items()
+            }
         return row
 
+    @override
+    def get_child_context(self, record: Record, context: Context | None) -> Context:
+        """Return the folder and the form memberships of its child stream.
+
+        Memberships are generated lazily from the folder while the child is synced.
+        """
+        return {
+            "folder_id": record["id"],
+            "memberships": self._memberships.pop(record["id"], iter(())),
+        }
+
+
+class FolderFormsStream(Stream):
+    """Folder membership of forms, one row per folder and form.
+
+    Rows are built from the folders response without sending any request.
+    """
+
+    name = "folder_forms"
+    primary_keys = ("folder_id", "form_id")
+    replication_key = None
+    parent_stream_type = FoldersStream
+    state_partitioning_keys = ()
+    selected_by_default = False
+
+    schema = th.PropertiesList(
+        th.Property("folder_id", th.StringType, required=True),
+        th.Property("form_id", th.StringType, required=True),
+    ).to_dict()
+
+    _memberships: Iterator[tuple[str, str]]
+    _schema_written: bool
+
+    @override
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the stream object."""
+        super().__init__(*args, **kwargs)
+        self._memberships = iter(())
+        self._schema_written = False
+
+    @override
+    def preprocess_context(self, context: Context) -> Context:
+        self._memberships = context.get("memberships") or iter(())
+        return {"folder_id": context["folder_id"]}
+
+    @override
+    def _write_schema_message(self) -> None:
+        # The stream is synced once per folder record, but its schema never changes
+        if not self._schema_written:
+            super()._write_schema_message()
+            self._schema_written = True
+
+    @override
+    def get_records(self, context: Context | None) -> Iterable[Record]:
+        memberships, self._memberships = self._memberships, iter(())
+        for folder_id, form_id in memberships:
+            yield {"folder_id": folder_id, "form_id": form_id}
+
 
 LABEL_FIELDS = [
     th.Property("id", th.StringType),
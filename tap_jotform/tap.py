@@ -2,18 +2,41 @@
 
 from __future__ import annotations
 
-from typing import override
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, override
 
 from singer_sdk import Stream, Tap
 from singer_sdk import typing as th
 
 from tap_jotform import streams
+from tap_jotform.batch import BATCH_STREAMS
+from tap_jotform.client import JotformStream, StreamPrefetcher
+from tap_jotform.dedup import DEFAULT_MAX_ENTRIES
+from tap_jotform.forms import DEFAULT_MAX_AGE, FormIndex
+from tap_jotform.instrumentation import Instrumentation
+from tap_jotform.output import BufferedWriter
+from tap_jotform.ratelimit import QuotaScheduler
+from tap_jotform.resilience import RetryPolicy
+from tap_jotform.transport import HTTP2Adapter, create_adapter, http2_available
+
+if TYPE_CHECKING:
+    from requests.adapters import BaseAdapter
+
+# Default connection pool size of requests
+DEFAULT_POOL_SIZE = 10
+
+# Default number of records buffered for each stream fetched in the background
+DEFAULT_MAX_BUFFERED_RECORDS = 10_000
 
 
 class TapJotform(Tap):
     """Singer Tap for Jotform."""
 
     name = "tap-jotform"
+    message_writer_class = BufferedWriter
 
     config_jsonschema = th.PropertiesList(
         th.Property(
@@ -37,6 +60,25 @@ class TapJotform(Tap):
             required=False,
             description="Start date for data collection",
         ),
+        th.Property(
+            "lookback_window_seconds",
+            th.IntegerType,
+            default=0,
+            description=(
+                "Number of seconds to move incremental bookmarks back by, to pick up "
+                "records written late"
+            ),
+        ),
+        th.Property(
+            "state_checkpoint_pages",
+            th.IntegerType,
+            default=1,
+            description=(
+                "Number of pages between STATE messages that record the offset of "
+                "the page being read, so interrupted syncs are resumed from it. "
+                "Set to 0 to only checkpoint with regular STATE messages"
+            ),
+        ),
         th.Property(
             "requests_cache",
             th.ObjectType(
@@ -54,13 +96,466 @@ class TapJotform(Tap):
                             th.IntegerType,
                             description="Cache expiration time in seconds",
                         ),
+                        th.Property(
+                            "backend",
+                            th.StringType,
+                            allowed_values=["sqlite", "filesystem", "memory"],
+                            description="Cache backend. Defaults to `sqlite`",
+                        ),
+                        th.Property(
+                            "cache_name",
+                            th.StringType,
+                            description=(
+                                "Path of the SQLite database or cache directory"
+                            ),
+                        ),
+                        th.Property(
+                            "urls_expire_after",
+                            th.ObjectType(additional_properties=th.IntegerType),
+                            description=(
+                                "Cache expiration time in seconds per URL glob "
+                                'pattern, e.g. `{"*/form/*/questions": 86400}`'
+                            ),
+                        ),
+                        th.Property(
+                            "always_revalidate",
+                            th.BooleanType,
+                            description=(
+                                "Revalidate cached responses that have an `ETag` or "
+                                "`Last-Modified` header, even if not expired"
+                            ),
+                        ),
+                    ),
+                    description=(
+                        "Requests cache configuration, passed to "
+                        "`requests_cache.CachedSession`"
                     ),
-                    description="Requests cache configuration",
                     default={},
                 ),
+                th.Property(
+                    "stream_expire_after",
+                    th.ObjectType(additional_properties=th.IntegerType),
+                    description="Cache expiration time in seconds per stream name",
+                ),
+                th.Property(
+                    "max_entries",
+                    th.IntegerType,
+                    description=(
+                        "Maximum number of responses kept by the `memory` backend, "
+                        "evicting the least recently used"
+                    ),
+                ),
             ),
             description="Cache configuration for HTTP requests",
         ),
+        th.Property(
+            "max_concurrent_requests",
+            th.IntegerType,
+            default=1,
+            description=(
+                "Maximum number of concurrent requests across all streams, e.g. when "
+                "fetching questions for many forms"
+            ),
+        ),
+        th.Property(
+            "concurrent_streams",
+            th.ObjectType(
+                th.Property(
+                    "enabled",
+                    th.BooleanType,
+                    default=False,
+                    description=(
+                        "Fetch the records of top-level streams in background "
+                        "threads while the previous streams are synced"
+                    ),
+                ),
+                th.Property(
+                    "max_buffered_records",
+                    th.IntegerType,
+                    default=DEFAULT_MAX_BUFFERED_RECORDS,
+                    description=(
+                        "Number of records fetched in advance and buffered for each "
+                        "stream"
+                    ),
+                ),
+            ),
+            description=(
+                "Concurrent fetching of top-level streams. Requests of all streams "
+                "are capped by `max_concurrent_requests`"
+            ),
+        ),
+        th.Property(
+            "connection_pool_size",
+            th.IntegerType,
+            description=(
+                "Number of connections kept alive and shared by all streams. "
+                "Defaults to 10, or `max_concurrent_requests` if larger"
+            ),
+        ),
+        th.Property(
+            "http2",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Send requests over HTTP/2. Requires `httpx[http2]` to be installed"
+            ),
+        ),
+        th.Property(
+            "rate_limit",
+            th.ObjectType(
+                th.Property(
+                    "throttle_below",
+                    th.IntegerType,
+                    default=100,
+                    description=(
+                        "Remaining daily quota below which requests are spread out "
+                        "until the quota resets"
+                    ),
+                ),
+                th.Property(
+                    "pause_when_exhausted",
+                    th.BooleanType,
+                    default=False,
+                    description=(
+                        "Wait for the daily quota to reset, up to "
+                        "`max_pause_seconds`, instead of failing when it is exhausted"
+                    ),
+                ),
+                th.Property(
+                    "max_pause_seconds",
+                    th.IntegerType,
+                    default=86400,
+                    description="Maximum time to wait for the daily quota to reset",
+                ),
+            ),
+            description="Pacing of requests based on the remaining daily API quota",
+        ),
+        th.Property(
+            "retry",
+            th.ObjectType(
+                th.Property(
+                    "max_tries",
+                    th.IntegerType,
+                    default=5,
+                    description="Maximum number of attempts of a request",
+                ),
+                th.Property(
+                    "budget",
+                    th.IntegerType,
+                    description=(
+                        "Maximum number of retries across all requests of a sync, "
+                        "after which failed requests are no longer retried"
+                    ),
+                ),
+            ),
+            description=(
+                "Retries of failed requests, with a backoff per class of error: "
+                "quota, server errors, timeouts and connection errors"
+            ),
+        ),
+        th.Property(
+            "request_timeouts",
+            th.ObjectType(additional_properties=th.IntegerType),
+            description=(
+                'Request timeout in seconds per stream name, e.g. `{"questions": 10}`. '
+                "Streams not listed time out after 300 seconds"
+            ),
+        ),
+        th.Property(
+            "hedging",
+            th.ObjectType(
+                th.Property(
+                    "enabled",
+                    th.BooleanType,
+                    default=False,
+                    description=(
+                        "Send a duplicate of requests that are slower than most "
+                        "recent requests of the same stream"
+                    ),
+                ),
+                th.Property(
+                    "percentile",
+                    th.NumberType,
+                    default=95,
+                    description=(
+                        "Percentile of the latencies of recent requests after which "
+                        "a duplicate request is sent"
+                    ),
+                ),
+                th.Property(
+                    "min_samples",
+                    th.IntegerType,
+                    default=20,
+                    description="Number of requests to observe before hedging",
+                ),
+            ),
+            description="Hedged requests, to cut the tail latency of streams",
+        ),
+        th.Property(
+            "metrics",
+            th.ObjectType(
+                th.Property(
+                    "enabled",
+                    th.BooleanType,
+                    default=False,
+                    description="Collect performance metrics",
+                ),
+                th.Property(
+                    "export_interval_seconds",
+                    th.NumberType,
+                    default=60,
+                    description=(
+                        "Minimum number of seconds between two exports of the "
+                        "metrics while a stream is syncing. Metrics are also "
+                        "exported after every top-level stream"
+                    ),
+                ),
+                th.Property(
+                    "json_path",
+                    th.StringType,
+                    description="Path of a JSON summary written on every export",
+                ),
+                th.Property(
+                    "prometheus_path",
+                    th.StringType,
+                    description=(
+                        "Path of a Prometheus textfile written on every export"
+                    ),
+                ),
+            ),
+            description=(
+                "Performance metrics per stream and endpoint: time spent waiting for "
+                "the quota and the network, decoding, post-processing and "
+                "serializing, and counts of requests, retries, bytes, cache hits "
+                "and records"
+            ),
+        ),
+        th.Property(
+            "page_sizes",
+            th.ObjectType(additional_properties=th.IntegerType),
+            description=(
+                'Page size per stream name, e.g. `{"forms": 1000}`. Streams not '
+                "listed use 100 records per page"
+            ),
+        ),
+        th.Property(
+            "adaptive_page_size",
+            th.ObjectType(
+                th.Property(
+                    "enabled",
+                    th.BooleanType,
+                    default=False,
+                    description="Adapt page sizes to response latency and size",
+                ),
+                th.Property(
+                    "min_page_size",
+                    th.IntegerType,
+                    default=10,
+                    description="Smallest page size",
+                ),
+                th.Property(
+                    "max_page_size",
+                    th.IntegerType,
+                    default=1000,
+                    description="Largest page size",
+                ),
+                th.Property(
+                    "target_seconds",
+                    th.NumberType,
+                    default=5,
+                    description="Response time above which the page size shrinks",
+                ),
+                th.Property(
+                    "target_bytes",
+                    th.IntegerType,
+                    default=5_000_000,
+                    description="Response size above which the page size shrinks",
+                ),
+            ),
+            description=(
+                "Grow page sizes while responses are fast and small, and shrink them "
+                "on slow or large responses, timeouts and server errors"
+            ),
+        ),
+        th.Property(
+            "submissions_per_form",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Sync submissions form by form from `/form/{id}/submissions`, with a "
+                "bookmark per form. In incremental mode, forms without new "
+                "submissions since the last sync are skipped"
+            ),
+        ),
+        th.Property(
+            "skip_unchanged_questions",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Remember the `updated_at` of each form and skip fetching the "
+                "questions of forms that have not been updated since the last sync"
+            ),
+        ),
+        th.Property(
+            "skip_unchanged_submissions",
+            th.BooleanType,
+            default=False,
+            description=(
+                "In incremental syncs of `/user/submissions`, skip the sync when no "
+                "form has new submissions since the last one, according to the "
+                "submission count and last submission date of every form. Edits of "
+                "existing submissions are picked up by the next sync that is not "
+                "skipped"
+            ),
+        ),
+        th.Property(
+            "form_index",
+            th.ObjectType(
+                th.Property(
+                    "skip_inactive",
+                    th.BooleanType,
+                    default=False,
+                    description=(
+                        "Skip the questions and per-form submissions of deleted and "
+                        "archived forms"
+                    ),
+                ),
+                th.Property(
+                    "path",
+                    th.StringType,
+                    description=(
+                        "Path of a file the index is saved to once every form has "
+                        "been listed, and read from by the next syncs"
+                    ),
+                ),
+                th.Property(
+                    "max_age_seconds",
+                    th.IntegerType,
+                    default=DEFAULT_MAX_AGE,
+                    description=(
+                        "Number of seconds a saved index is used for before forms "
+                        "are listed again"
+                    ),
+                ),
+            ),
+            description=(
+                "Index of the status, update date and submission activity of every "
+                "form, built while forms are synced and consulted by the streams "
+                "that depend on them"
+            ),
+        ),
+        th.Property(
+            "backfill",
+            th.ObjectType(
+                th.Property(
+                    "enabled",
+                    th.BooleanType,
+                    default=False,
+                    description=(
+                        "Split the submissions sync into `created_at` date windows "
+                        "fetched concurrently, starting from `start_date`, when "
+                        "there is no bookmark"
+                    ),
+                ),
+                th.Property(
+                    "window_days",
+                    th.IntegerType,
+                    default=30,
+                    description="Number of days in each window",
+                ),
+            ),
+            description="Concurrent backfill of the submissions stream",
+        ),
+        th.Property(
+            "history_window_days",
+            th.IntegerType,
+            default=7,
+            description=(
+                "Number of days of user history requested at once. Windows are "
+                "requested concurrently, up to `max_concurrent_requests`"
+            ),
+        ),
+        th.Property(
+            "deduplication",
+            th.ObjectType(
+                th.Property(
+                    "enabled",
+                    th.BooleanType,
+                    default=False,
+                    description=(
+                        "Skip records whose `id` and `updated_at` were already emitted"
+                    ),
+                ),
+                th.Property(
+                    "index_dir",
+                    th.StringType,
+                    description=(
+                        "Directory of the index of the records emitted by each "
+                        "stream, used to skip them in the next incremental sync"
+                    ),
+                ),
+                th.Property(
+                    "max_entries",
+                    th.IntegerType,
+                    default=DEFAULT_MAX_ENTRIES,
+                    description="Number of records kept in the index of each stream",
+                ),
+            ),
+            description=(
+                "Deduplication of records fetched again by overlapping incremental "
+                "filters and the lookback window"
+            ),
+        ),
+        th.Property(
+            "fast_output",
+            th.ObjectType(
+                th.Property(
+                    "enabled",
+                    th.BooleanType,
+                    default=False,
+                    description="Enable the fast output mode",
+                ),
+                th.Property(
+                    "buffer_size",
+                    th.IntegerType,
+                    default=1_048_576,
+                    description="Number of bytes of RECORD messages to buffer",
+                ),
+            ),
+            description=(
+                "Conform records with plans compiled once per stream, encode messages "
+                "with orjson when it is installed and write RECORD messages to stdout "
+                "in large buffers"
+            ),
+        ),
+        th.Property(
+            "batch_streams",
+            th.ArrayType(th.StringType),
+            default=list(BATCH_STREAMS),
+            description=(
+                "Streams written to BATCH files when `batch_config` is set. Other "
+                "streams are written as RECORD messages"
+            ),
+        ),
+        th.Property(
+            "streaming_parse",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Parse submission pages incrementally while they are downloaded, "
+                "keeping a single submission in memory at a time"
+            ),
+        ),
+        th.Property(
+            "compact_folders",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Emit every folder as a record of its own, with the IDs of its "
+                "subfolders and without its `forms` map. Folder membership of forms "
+                "is emitted by the `folder_forms` stream"
+            ),
+        ),
         th.Property(
             "include_deprecated_streams",
             th.BooleanType,
@@ -69,12 +564,132 @@ class TapJotform(Tap):
         ),
     ).to_dict()
 
+    #: Index of the forms of the account, shared by all streams
+    form_index: FormIndex
+
+    @override
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the tap."""
+        super().__init__(*args, **kwargs)
+        # Built eagerly, since streams fetched in the background use it at once
+        form_index = self.config.get("form_index") or {}
+        path = form_index.get("path")
+        self.form_index = FormIndex(
+            Path(path) if path else None,
+            max_age=form_index.get("max_age_seconds", DEFAULT_MAX_AGE),
+        )
+        fast_output = self.config.get("fast_output") or {}
+        if fast_output.get("enabled") and isinstance(
+            self.message_writer,
+            BufferedWriter,
+        ):
+            self.message_writer.buffer_size = fast_output.get("buffer_size", 1_048_576)
+
+    @cached_property
+    def quota_scheduler(self) -> QuotaScheduler:
+        """Request scheduler shared by all streams."""
+        rate_limit = self.config.get("rate_limit") or {}
+        return QuotaScheduler(
+            throttle_below=rate_limit.get("throttle_below", 100),
+            pause_when_exhausted=rate_limit.get("pause_when_exhausted", False),
+            max_pause=rate_limit.get("max_pause_seconds", 86400),
+        )
+
+    @cached_property
+    def retry_policy(self) -> RetryPolicy:
+        """Retry policy shared by all streams."""
+        retry = self.config.get("retry") or {}
+        return RetryPolicy(
+            max_tries=retry.get("max_tries", 5),
+            budget=retry.get("budget"),
+        )
+
+    @cached_property
+    def instrumentation(self) -> Instrumentation:
+        """Performance instrumentation shared by all streams."""
+        metrics = self.config.get("metrics") or {}
+        return Instrumentation(
+            enabled=metrics.get("enabled", False),
+            export_interval=metrics.get("export_interval_seconds", 60),
+            json_path=metrics.get("json_path"),
+            prometheus_path=metrics.get("prometheus_path"),
+        )
+
+    @cached_property
+    def request_slots(self) -> threading.BoundedSemaphore:
+        """Slots of the requests in flight, shared by all streams."""
+        return threading.BoundedSemaphore(
+            max(self.config.get("max_concurrent_requests", 1), 1),
+        )
+
+    @cached_property
+    def hedging_pool(self) -> ThreadPoolExecutor:
+        """Threads sending hedged requests, shared by all streams."""
+        # Every request in flight, and a duplicate of each
+        return ThreadPoolExecutor(
+            max_workers=2 * max(self.config.get("max_concurrent_requests", 1), 1),
+            thread_name_prefix="hedging",
+        )
+
+    def shutdown_hedging_pool(self) -> None:
+        """Stop the threads of the hedging pool, if it was started."""
+        pool: ThreadPoolExecutor | None = self.__dict__.pop("hedging_pool", None)
+        if pool is not None:
+            # Duplicates that lost the race are not waited for
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @cached_property
+    def stream_prefetcher(self) -> StreamPrefetcher | None:
+        """Background fetching of top-level streams, if enabled."""
+        concurrent_streams = self.config.get("concurrent_streams") or {}
+        if not concurrent_streams.get("enabled"):
+            return None
+        return StreamPrefetcher(
+            [
+                stream
+                for stream in self.streams.values()
+                if isinstance(stream, JotformStream)
+                and stream.parent_stream_type is None
+                and (stream.selected or stream.has_selected_descendents)
+            ],
+            max_buffered_records=concurrent_streams.get(
+                "max_buffered_records",
+                DEFAULT_MAX_BUFFERED_RECORDS,
+            ),
+        )
+
+    @cached_property
+    def http_adapter(self) -> BaseAdapter:
+        """Transport adapter shared by all streams, pooling their connections."""
+        pool_size = self.config.get("connection_pool_size") or max(
+            self.config.get("max_concurrent_requests", 1),
+            DEFAULT_POOL_SIZE,
+        )
+        if self.config.get("http2"):
+            if http2_available():
+                return HTTP2Adapter(pool_size)
+            self.logger.warning(
+                "HTTP/2 was requested but httpx is not installed, using HTTP/1.1",
+            )
+        return create_adapter(pool_size)
+
     @override
     def discover_streams(self) -> list[Stream]:
+        submissions: list[Stream] = (
+            [
+                streams.FormSubmissionsStream(self),
+                streams.FormSubmissionAnswersStream(self),
+            ]
+            if self.config.get("submissions_per_form")
+            else [
+                streams.SubmissionsStream(self),
+                streams.SubmissionAnswersStream(self),
+            ]
+        )
         all_streams: list[Stream] = [
             streams.FormsStream(self),
             streams.QuestionsStream(self),
-            streams.SubmissionsStream(self),
+            *submissions,
             streams.ReportsStream(self),
             streams.UserHistory(self),
             streams.LabelsStream(self),
@@ -83,6 +698,7 @@ class TapJotform(Tap):
             all_streams.extend(
                 [
                     streams.FoldersStream(self),
+                    streams.FolderFormsStream(self),
                 ]
             )
         return all_streams
@@ -0,0 +1,247 @@
+"""HTTP transport shared by the streams of a tap."""
+
+from __future__ import annotations
+
+import io
+import ssl
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, override
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import (
+    DEFAULT_CA_BUNDLE_PATH,
+    get_encoding_from_headers,
+    select_proxy,
+)
+from urllib3 import HTTPResponse
+
+try:
+    import httpx  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment, unused-ignore]
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping
+
+# Headers that no longer describe the body once it has been decompressed.
+_DECODED_HEADERS = ("content-encoding", "content-length")
+
+
+def http2_available() -> bool:
+    """Return whether the optional HTTP/2 client is installed."""
+    return httpx is not None
+
+
+def create_adapter(pool_size: int) -> HTTPAdapter:
+    """Create an adapter that keeps up to ``pool_size`` connections alive per host.
+
+    Args:
+        pool_size: Number of connections to keep alive per host.
+
+    Returns:
+        A transport adapter.
+    """
+    return HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+
+def _ssl_context(
+    *,
+    verify: bool | str,
+    cert: bytes | str | tuple[bytes | str, bytes | str] | None,
+) -> ssl.SSLContext:
+    """Build the TLS settings of a request, as understood by :mod:`requests`.
+
+    Args:
+        verify: Whether to verify the server, or a CA bundle file or directory.
+        cert: Client certificate file, or a certificate and key file pair.
+
+    Returns:
+        An SSL context.
+    """
+    if verify is False:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    else:
+        ca_path = DEFAULT_CA_BUNDLE_PATH if verify is True else verify
+        if Path(ca_path).is_dir():
+            context = ssl.create_default_context(capath=ca_path)
+        else:
+            context = ssl.create_default_context(cafile=ca_path)
+    if cert is not None:
+        certfile, keyfile = cert if isinstance(cert, tuple) else (cert, None)
+        context.load_cert_chain(certfile, keyfile)
+    return context
+
+
+class _ChunkReader(io.RawIOBase):
+    """A file-like object over an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterator[bytes], on_close: Callable[[], None]) -> None:
+        self._chunks = chunks
+        self._pending = b""
+        self._on_close = on_close
+
+    @override
+    def close(self) -> None:
+        if not self.closed:
+            self._on_close()
+        super().close()
+
+    @override
+    def readable(self) -> bool:
+        return True
+
+    @override
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = chunk
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+class HTTP2Adapter(BaseAdapter):
+    """Transport adapter that sends requests over HTTP/2 with ``httpx``.
+
+    Responses are decompressed by ``httpx`` and returned as regular
+    :class:`requests.Response` objects, so caching, streaming and retries work
+    as with the default adapter. TLS verification, client certificates and
+    proxies follow the session settings, with one ``httpx`` client for each
+    combination of them.
+
+    Args:
+        pool_size: Maximum number of connections to keep alive per client.
+    """
+
+    def __init__(self, pool_size: int) -> None:
+        """Initialize the adapter."""
+        if httpx is None:
+            msg = "HTTP/2 support requires httpx: pip install 'httpx[http2]'"
+            raise RuntimeError(msg)
+        super().__init__()
+        self._pool_size = pool_size
+        self._clients: dict[tuple[Any, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def get_client(
+        self,
+        *,
+        verify: bool | str,
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None,
+        proxy: str | None,
+    ) -> Any:  # noqa: ANN401
+        """Return the ``httpx`` client for the TLS and proxy settings of a request.
+
+        Args:
+            verify: Whether to verify the server, or a CA bundle file or directory.
+            cert: Client certificate file, or a certificate and key file pair.
+            proxy: Proxy URL, if any.
+
+        Returns:
+            An HTTP/2 client.
+        """
+        key = (verify, cert, proxy)
+        with self._lock:
+            if (client := self._clients.get(key)) is None:
+                client = httpx.Client(
+                    http2=True,
+                    verify=_ssl_context(verify=verify, cert=cert),
+                    proxy=proxy,
+                    limits=httpx.Limits(
+                        max_connections=self._pool_size,
+                        max_keepalive_connections=self._pool_size,
+                    ),
+                )
+                self._clients[key] = client
+            return client
+
+    @override
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+        verify: bool | str = True,
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = httpx.Timeout(read, connect=connect)
+        try:
+            client = self.get_client(
+                verify=verify,
+                cert=cert,
+                proxy=select_proxy(request.url or "", dict(proxies or {})),
+            )
+        except OSError as e:
+            raise requests.exceptions.SSLError(e, request=request) from e
+        outgoing = client.build_request(
+            request.method or "GET",
+            request.url or "",
+            headers=dict(request.headers),
+            content=request.body,
+            timeout=timeout,
+        )
+        try:
+            incoming = client.send(outgoing, stream=True)
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(e, request=request) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(e, request=request) from e
+        return self.build_response(request, incoming)
+
+    def build_response(
+        self,
+        request: requests.PreparedRequest,
+        incoming: Any,  # noqa: ANN401
+    ) -> requests.Response:
+        """Convert an ``httpx`` response to a :class:`requests.Response`.
+
+        Args:
+            request: The request that was sent.
+            incoming: The ``httpx`` response, not read yet.
+
+        Returns:
+            The response. Closing it closes the ``httpx`` response.
+        """
+        headers = {
+            name: value
+            for name, value in incoming.headers.items()
+            if name.lower() not in _DECODED_HEADERS
+        }
+        response = requests.Response()
+        response.status_code = incoming.status_code
+        response.reason = incoming.reason_phrase
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = str(incoming.url)
+        response.request = request
+        response.connection = self  # type: ignore[assignment]
+        response.raw = HTTPResponse(
+            body=io.BufferedReader(_ChunkReader(incoming.iter_bytes(), incoming.close)),
+            headers=headers,
+            status=incoming.status_code,
+            reason=incoming.reason_phrase,
+            preload_content=False,
+            decode_content=False,
+            request_method=request.method,
+            request_url=response.url,
+        )
+        return response
+
+    @override
+    def close(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
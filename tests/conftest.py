@@ -1,3 +1,21 @@
 """Pytest configuration for tests in this directory."""
 
 from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.fake_jotform import FakeJotform
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@pytest.fixture
+def fake_api() -> Generator[FakeJotform, None, None]:
+    """Start a local fake Jotform API for the duration of a test."""
+    api = FakeJotform()
+    api.start()
+    yield api
+    api.stop()
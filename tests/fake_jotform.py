@@ -0,0 +1,452 @@
+"""A local fake of the Jotform API for offline tests."""
+
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlparse
+
+if TYPE_CHECKING:
+    import ssl
+    from collections.abc import Callable, Iterable, Iterator
+    from pathlib import Path
+
+    StreamedBody = Callable[[dict[str, str]], Iterable[bytes]]
+
+
+def make_form(index: int) -> dict[str, Any]:
+    """Build a synthetic form record."""
+    return {
+        "id": f"{1000 + index}",
+        "username": "tester",
+        "title": f"Form {index}",
+        "height": "500",
+        "url": f"https://form.jotform.com/{1000 + index}",
+        "status": "ENABLED",
+        "created_at": "2023-01-01 00:00:00",
+        "updated_at": None,
+        "last_submission": None,
+        "new": "0",
+        "count": "0",
+        "type": "CARD",
+        "favorite": "0",
+        "archived": "0",
+    }
+
+
+def make_history_entry(timestamp: int) -> dict[str, Any]:
+    """Build a synthetic user history entry."""
+    return {
+        "type": "formUpdate",
+        "username": "tester",
+        "ip": "127.0.0.1",
+        "server": "api",
+        "timestamp": str(timestamp),
+        "email": "tester@example.com",
+        "parent": "",
+        "subuser": "",
+    }
+
+
+def make_folder(
+    folder_id: str,
+    forms: list[dict[str, Any]],
+    subfolders: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Build a synthetic folder with its forms and subfolders."""
+    return {
+        "id": folder_id,
+        "path": folder_id,
+        "owner": "tester",
+        "name": f"Folder {folder_id}",
+        "parent": "",
+        "color": "#ffffff",
+        "forms": {form["id"]: form for form in forms},
+        "subfolders": subfolders or [],
+    }
+
+
+def make_questions(count: int) -> dict[str, Any]:
+    """Build a synthetic questions map for a form."""
+    return {
+        str(qid): {
+            "qid": str(qid),
+            "type": "control_textbox",
+            "order": str(qid),
+            "text": f"Question {qid}",
+            "name": f"question{qid}",
+        }
+        for qid in range(1, count + 1)
+    }
+
+
+def make_submission(
+    index: int,
+    form_id: str = "1000",
+    answers: int = 20,
+) -> dict[str, Any]:
+    """Build a synthetic submission record with a number of answers."""
+    created_at = f"2024-01-{1 + index % 28:02d} {index % 24:02d}:00:00"
+    return {
+        "id": f"{5000000 + index}",
+        "form_id": form_id,
+        "ip": "127.0.0.1",
+        "created_at": created_at,
+        "updated_at": None,
+        "status": "ACTIVE",
+        "new": "1",
+        "flag": "0",
+        "notes": "",
+        "answers": {
+            str(qid): {
+                "name": f"question{qid}",
+                "order": str(qid),
+                "text": f"Question {qid}",
+                "type": "control_textbox",
+                "answer": f"Answer {index}-{qid} " * 4,
+                "prettyFormat": f"Answer {index}-{qid}",
+            }
+            for qid in range(1, answers + 1)
+        },
+    }
+
+
+def make_dataset(
+    forms: int,
+    submissions_per_form: int = 0,
+    questions_per_form: int = 0,
+) -> dict[str, Any]:
+    """Build synthetic forms, with their submissions and questions."""
+    form_records = [make_form(i) for i in range(forms)]
+    for form in form_records:
+        form["count"] = str(submissions_per_form)
+    return {
+        "forms": form_records,
+        "submissions": [
+            make_submission(
+                index * submissions_per_form + i,
+                form_id=form["id"],
+                answers=questions_per_form,
+            )
+            for index, form in enumerate(form_records)
+            for i in range(submissions_per_form)
+        ],
+        "questions": {
+            form["id"]: make_questions(questions_per_form) for form in form_records
+        },
+    }
+
+
+def make_page(content: Any, limit_left: int = 10000) -> bytes:
+    """Serialize a Jotform API response body."""
+    return json.dumps(
+        {
+            "responseCode": HTTPStatus.OK,
+            "message": "success",
+            "content": content,
+            "limit-left": limit_left,
+        },
+    ).encode()
+
+
+def matches(record: dict[str, Any], key: str, value: str) -> bool:  # noqa: PLR0911
+    """Evaluate a single condition of a Jotform ``filter`` parameter."""
+    field, _, operator = key.partition(":")
+    actual = record.get(field)
+    if actual is None:
+        return False
+    match operator:
+        case "gt":
+            return str(actual) > value
+        case "lt":
+            return str(actual) < value
+        case "gte":
+            return str(actual) >= value
+        case "lte":
+            return str(actual) <= value
+        case "ne":
+            return str(actual) != value
+    return str(actual) == value
+
+
+def stream_page(records: Iterable[Any], limit_left: int = 10000) -> Iterator[bytes]:
+    """Serialize a Jotform API response body lazily, one record at a time."""
+    yield b'{"responseCode": 200, "message": "success", "content": ['
+    for index, record in enumerate(records):
+        yield (b"," if index else b"") + json.dumps(record).encode()
+    yield b'], "limit-left": %d}' % limit_left
+
+
+class FakeJotform:
+    """Serve synthetic Jotform API responses from a local HTTP server.
+
+    Args:
+        forms: Form records served by ``/user/forms``.
+        submissions: Submission records served by ``/user/submissions``.
+        questions: Questions map per form ID served by ``/form/{id}/questions``.
+        history: History entries served by ``/user/history``, filtered by day with
+            ``startDate`` included and ``endDate`` excluded.
+        folders: Root folder served by ``/user/folders``.
+        fixtures: JSON file with ``forms``, ``submissions`` and ``questions`` to
+            serve, e.g. recorded from the live API with ``benchmarks.record``.
+        latency: Seconds to wait before answering each request.
+        ssl_context: Serve HTTPS with this context instead of plain HTTP.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        forms: list[dict[str, Any]] | None = None,
+        submissions: list[dict[str, Any]] | None = None,
+        questions: dict[str, dict[str, Any]] | None = None,
+        history: list[dict[str, Any]] | None = None,
+        folders: dict[str, Any] | None = None,
+        fixtures: Path | None = None,
+        latency: float = 0.0,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        """Initialize the fake API."""
+        self.forms = forms or []
+        self.submissions = submissions or []
+        self.questions = questions or {}
+        self.history = history or []
+        self.folders = folders
+        if fixtures is not None:
+            self.load(fixtures)
+        self.latency = latency
+        self.limit_left = 10000
+        self.requests: list[str] = []
+        self.intervals: list[tuple[str, float, float]] = []
+        self.connections = 0
+        self.bytes_sent = 0
+        self.fail_at_offset: int | None = None
+        self.stalls: dict[str, float] = {}
+        self.streamed_bodies: dict[str, StreamedBody] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._scheme = "http"
+        if ssl_context is not None:
+            self._server.socket = ssl_context.wrap_socket(
+                self._server.socket,
+                server_side=True,
+            )
+            self._scheme = "https"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self._server.server_address[:2]
+        return f"{self._scheme}://{host!s}:{port}"
+
+    def start(self) -> None:
+        """Start serving requests in a background thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Shut the server down."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def load(self, path: Path) -> None:
+        """Serve the records of a fixture file."""
+        data = json.loads(path.read_text())
+        self.forms = data.get("forms", [])
+        self.submissions = data.get("submissions", [])
+        self.questions = data.get("questions", {})
+
+    def paths(self, prefix: str = "") -> list[str]:
+        """Return the paths requested so far, optionally filtered by prefix."""
+        with self._lock:
+            return [path for path in self.requests if path.startswith(prefix)]
+
+    def route(  # noqa: PLR0911
+        self,
+        path: str,
+        params: dict[str, str],
+    ) -> tuple[int, Any]:
+        """Resolve a request to a status code and ``content`` payload."""
+        parts = path.strip("/").split("/")
+        match parts:
+            case ["user", "forms"]:
+                return HTTPStatus.OK, self.page(self.forms, params)
+            case ["form", form_id, "questions"]:
+                return HTTPStatus.OK, self.questions.get(form_id, {})
+            case ["user", "submissions"]:
+                return HTTPStatus.OK, self.page(self.submissions, params)
+            case ["form", form_id, "submissions"]:
+                submissions = [s for s in self.submissions if s["form_id"] == form_id]
+                return HTTPStatus.OK, self.page(submissions, params)
+            case ["user", "folders"]:
+                return HTTPStatus.OK, self.folders or []
+            case ["user", "reports" | "labels"]:
+                return HTTPStatus.OK, []
+            case ["user", "history"]:
+                return HTTPStatus.OK, self.history_page(params)
+        return HTTPStatus.NOT_FOUND, None
+
+    @staticmethod
+    def page(records: list[dict[str, Any]], params: dict[str, str]) -> list[Any]:
+        """Filter, sort and slice records according to the request parameters."""
+        if "filter" in params:
+            filters = json.loads(params["filter"])
+            records = [
+                record
+                for record in records
+                if all(matches(record, key, value) for key, value in filters.items())
+            ]
+        if orderby := params.get("orderby"):
+            records = sorted(
+                records,
+                key=lambda record: str(record.get(orderby) or ""),
+                reverse=params.get("direction") == "DESC",
+            )
+        offset = int(params.get("offset", 0))
+        limit = int(params.get("limit", 20))
+        return records[offset : offset + limit]
+
+    def history_page(self, params: dict[str, str]) -> list[Any]:
+        """Filter history entries by the days of the request, in UTC."""
+
+        def day(value: str) -> int:
+            date = dt.datetime.strptime(value, "%m/%d/%Y").replace(tzinfo=dt.UTC)
+            return int(date.timestamp())
+
+        start = day(params["startDate"]) if "startDate" in params else 0
+        end = day(params["endDate"]) if "endDate" in params else None
+        return [
+            entry
+            for entry in self.history
+            if int(entry["timestamp"]) >= start
+            and (end is None or int(entry["timestamp"]) < end)
+        ]
+
+    @contextmanager
+    def track(self, path: str) -> Iterator[None]:
+        """Record when a request is being handled, before its response is sent."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.intervals.append((path, start, time.monotonic()))
+
+    def peak_concurrency(self, prefix: str = "") -> int:
+        """Return the largest number of requests handled at once.
+
+        Args:
+            prefix: Only count the requests whose path starts with it.
+        """
+        with self._lock:
+            events = sorted(
+                (moment, change)
+                for path, start, end in self.intervals
+                if path.startswith(prefix)
+                for moment, change in ((start, 1), (end, -1))
+            )
+        peak = current = 0
+        for _, change in events:
+            current += change
+            peak = max(peak, current)
+        return peak
+
+    def overlap(self, prefix: str, other: str = "/") -> bool:
+        """Return whether requests of a path prefix were handled at once with others.
+
+        Args:
+            prefix: Path prefix of the requests.
+            other: Path prefix of the other requests, which exclude the former.
+        """
+        with self._lock:
+            intervals = list(self.intervals)
+        return any(
+            start < other_end and other_start < end
+            for path, start, end in intervals
+            if path.startswith(prefix)
+            for other_path, other_start, other_end in intervals
+            if other_path.startswith(other) and not other_path.startswith(prefix)
+        )
+
+    def count_bytes(self, size: int) -> None:
+        """Add to the number of response body bytes sent."""
+        with self._lock:
+            self.bytes_sent += size
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                with fake._lock:
+                    fake.connections += 1
+                super().setup()
+
+            def do_GET(self) -> None:
+                parsed = urlparse(self.path)
+                params = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+                with fake._lock:
+                    fake.requests.append(self.path)
+                    fake.limit_left -= 1
+                    limit_left = fake.limit_left
+                    stall = fake.stalls.pop(parsed.path, 0)
+                # Responses are only sent afterwards, so requests sent one after
+                # the other are never handled at once
+                with fake.track(self.path):
+                    if fake.latency:
+                        time.sleep(fake.latency)
+                    if stall:
+                        time.sleep(stall)
+
+                if stream_body := fake.streamed_bodies.get(parsed.path):
+                    self.close_connection = True
+                    self.send_response(HTTPStatus.OK)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Connection", "close")
+                    self.end_headers()
+                    for chunk in stream_body(params):
+                        self.wfile.write(chunk)
+                        fake.count_bytes(len(chunk))
+                    return
+
+                status, content = fake.route(parsed.path, params)
+                if params.get("offset") == str(fake.fail_at_offset):
+                    status, content = HTTPStatus.BAD_REQUEST, None
+                digest = hashlib.sha256(json.dumps(content).encode()).hexdigest()
+                etag = f'"{digest}"'
+                if status == HTTPStatus.OK and self.headers["If-None-Match"] == etag:
+                    self.send_response(HTTPStatus.NOT_MODIFIED)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                body = json.dumps(
+                    {
+                        "responseCode": status,
+                        "message": "success" if status == HTTPStatus.OK else "error",
+                        "content": content,
+                        "limit-left": limit_left,
+                    },
+                ).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+                fake.count_bytes(len(body))
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        return Handler
@@ -0,0 +1,107 @@
+"""Tests for HTTP response caching."""
+
+from __future__ import annotations
+
+import io
+from contextlib import redirect_stdout
+from typing import TYPE_CHECKING, Any
+
+import requests
+
+from tap_jotform.cache import LRUCache, LRUStorage, create_session
+from tap_jotform.tap import TapJotform
+from tests.fake_jotform import make_form, make_questions
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tests.fake_jotform import FakeJotform
+
+
+def sync_costs(api: FakeJotform, cache: dict[str, Any]) -> dict[str, dict[str, int]]:
+    """Run a sync with the given cache setting and return the costs per stream."""
+    tap = TapJotform(
+        config={
+            "api_key": "test",
+            "api_url": api.url,
+            "include_deprecated_streams": False,
+            "requests_cache": {"enabled": True, **cache},
+        },
+        parse_env_config=False,
+    )
+    with redirect_stdout(io.StringIO()):
+        tap.sync_all()
+    return {name: stream._sync_costs for name, stream in tap.streams.items()}  # noqa: SLF001
+
+
+def test_lru_storage_evicts_least_recently_used() -> None:
+    """The in-memory storage keeps the most recently used items."""
+    storage = LRUStorage(max_entries=2)
+    storage["a"] = requests.Response()
+    storage["b"] = requests.Response()
+    _ = storage["a"]
+    storage["c"] = requests.Response()
+    assert list(storage) == ["a", "c"]  # noqa: S101
+
+
+def test_memory_backend_is_bounded() -> None:
+    """The memory backend uses the LRU storage when ``max_entries`` is set."""
+    max_entries = 5
+    session = create_session(
+        {"config": {"backend": "memory"}, "max_entries": max_entries},
+        "forms",
+    )
+    assert isinstance(session.cache, LRUCache)  # noqa: S101
+    assert session.cache.responses.max_entries == max_entries  # type: ignore[attr-defined]  # noqa: S101
+
+
+def test_cache_key_excludes_api_key() -> None:
+    """Requests that only differ in their API key share a cache entry."""
+    session = create_session({"config": {"backend": "memory"}}, "forms")
+    keys = {
+        session.cache.create_key(
+            requests.Request(
+                "GET",
+                "https://api.jotform.com/user/forms",
+                headers={"APIKEY": api_key},
+            ).prepare(),
+        )
+        for api_key in ("first", "second")
+    }
+    assert len(keys) == 1  # noqa: S101
+
+
+def test_stream_expire_after() -> None:
+    """Streams can have their own expiration time."""
+    minute, hour = 60, 3600
+    cache = {
+        "config": {"backend": "memory", "expire_after": minute},
+        "stream_expire_after": {"questions": hour},
+    }
+    forms = create_session(cache, "forms")
+    questions = create_session(cache, "questions")
+    assert forms.settings.expire_after == minute  # noqa: S101
+    assert questions.settings.expire_after == hour  # noqa: S101
+
+
+def test_expired_responses_are_revalidated(
+    fake_api: FakeJotform,
+    tmp_path: Path,
+) -> None:
+    """Expired responses with an ETag are revalidated instead of downloaded."""
+    fake_api.forms = [make_form(i) for i in range(2)]
+    fake_api.questions = {form["id"]: make_questions(2) for form in fake_api.forms}
+    cache = {"config": {"cache_name": str(tmp_path / "cache"), "expire_after": 0}}
+
+    first = sync_costs(fake_api, cache)
+    assert first["questions"] == {  # noqa: S101
+        "cache_hits": 0,
+        "cache_misses": 2,
+        "cache_bytes_saved": 0,
+    }
+
+    fake_api.questions["1001"] = make_questions(3)
+    second = sync_costs(fake_api, cache)
+    assert second["questions"]["cache_hits"] == 1  # noqa: S101
+    assert second["questions"]["cache_misses"] == 1  # noqa: S101
+    assert second["questions"]["cache_bytes_saved"] > 0  # noqa: S101
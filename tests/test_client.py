@@ -0,0 +1,88 @@
+"""Tests for the Jotform stream base classes."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import TYPE_CHECKING, cast
+
+import pytest
+import requests
+from singer_sdk.exceptions import RetriableAPIError
+
+from tap_jotform.client import JotformStream, PageSizer
+from tap_jotform.tap import TapJotform
+from tests.fake_jotform import make_form
+
+if TYPE_CHECKING:
+    from tests.fake_jotform import FakeJotform
+
+
+def test_page_sizer_grows_and_shrinks() -> None:
+    """Page sizes grow within targets and shrink beyond them."""
+    initial, minimum, maximum = 100, 10, 1000
+    sizer = PageSizer(
+        initial,
+        minimum=minimum,
+        maximum=maximum,
+        target_seconds=2,
+        target_bytes=1000,
+    )
+    sizer.observe(0.1, 100)
+    assert sizer.size == 2 * initial  # noqa: S101
+    for _ in range(5):
+        sizer.observe(0.1, 100)
+    assert sizer.size == maximum  # noqa: S101
+
+    sizer.observe(0.1, 2000)
+    assert sizer.size == maximum // 2  # noqa: S101
+    sizer.observe(1.5, 100)
+    assert sizer.size == maximum // 2  # noqa: S101
+    for _ in range(10):
+        sizer.shrink()
+    assert sizer.size == minimum  # noqa: S101
+
+
+def test_adaptive_page_size_paginates_all_records(fake_api: FakeJotform) -> None:
+    """Offsets follow the limit of each request as the page size grows."""
+    fake_api.forms = [make_form(i) for i in range(100)]
+    tap = TapJotform(
+        config={
+            "api_key": "test",
+            "api_url": fake_api.url,
+            "page_sizes": {"forms": 10},
+            "adaptive_page_size": {"enabled": True},
+        },
+        parse_env_config=False,
+    )
+    stream = cast("JotformStream", tap.streams["forms"])
+    records = list(stream.get_records(None))
+
+    assert [record["id"] for record in records] == [f["id"] for f in fake_api.forms]  # noqa: S101
+    limits = [path.split("limit=")[1].split("&")[0] for path in fake_api.paths()]
+    assert limits == ["10", "20", "40", "80", "160"]  # noqa: S101
+
+
+@pytest.mark.parametrize(
+    ("body", "exhausted"),
+    [
+        (b'{"responseCode": 429, "limit-left": 0}', True),
+        (b'{"responseCode": 429, "limit-left": 50}', False),
+        (b"Too Many Requests", False),
+    ],
+)
+def test_only_an_exhausted_quota_pauses_requests(
+    body: bytes,
+    *,
+    exhausted: bool,
+) -> None:
+    """A 429 response only marks the daily quota exhausted when none is left."""
+    tap = TapJotform(config={"api_key": "test"}, parse_env_config=False)
+    stream = cast("JotformStream", tap.streams["forms"])
+    response = requests.Response()
+    response.status_code = HTTPStatus.TOO_MANY_REQUESTS
+    response._content = body  # noqa: SLF001
+    response.url = "https://api.jotform.com/user/forms"
+
+    with pytest.raises(RetriableAPIError):
+        stream.validate_response(response)
+    assert (tap.quota_scheduler.limit_left == 0) is exhausted  # noqa: S101
@@ -0,0 +1,53 @@
+"""Tests for the index of emitted record versions."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from tap_jotform.dedup import RecordIndex
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_versions_are_seen_once() -> None:
+    """A version of a record is only new the first time it is seen."""
+    index = RecordIndex(max_entries=10)
+    assert not index.seen("1", "2024-01-01 00:00:00")  # noqa: S101
+    assert index.seen("1", "2024-01-01 00:00:00")  # noqa: S101
+    assert not index.seen("1", "2024-01-02 00:00:00")  # noqa: S101
+    assert index.duplicates == 1  # noqa: S101
+
+
+def test_least_recently_seen_versions_are_evicted() -> None:
+    """The index keeps at most `max_entries` versions."""
+    index = RecordIndex(max_entries=2)
+    index.seen("1", "v")
+    index.seen("2", "v")
+    index.seen("1", "v")
+    index.seen("3", "v")
+    assert index.seen("1", "v")  # noqa: S101
+    assert not index.seen("2", "v")  # noqa: S101
+
+
+def test_index_is_saved_for_the_next_run(tmp_path: Path) -> None:
+    """Versions of the previous run are skipped unless told otherwise."""
+    path = tmp_path / "indexes" / "submissions.idx"
+    index = RecordIndex(max_entries=3, path=path)
+    for record_id in ("1", "2", "3", "4"):
+        index.seen(record_id, "v")
+    index.save()
+    assert path.stat().st_size == 3 * 8  # noqa: S101
+
+    index = RecordIndex(max_entries=3, path=path)
+    assert not index.seen("1", "v")  # noqa: S101
+    assert index.seen("4", "v")  # noqa: S101
+    assert not index.seen("3", "v", previous=False)  # noqa: S101
+
+
+def test_corrupt_index_is_ignored(tmp_path: Path) -> None:
+    """An index that cannot be read is ignored."""
+    path = tmp_path / "submissions.idx"
+    path.write_bytes(b"corrupt")
+    index = RecordIndex(max_entries=3, path=path)
+    assert not index.seen("1", "v")  # noqa: S101
@@ -0,0 +1,81 @@
+"""Tests for the form index."""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+from tap_jotform.forms import FormIndex
+from tests.fake_jotform import make_form
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_forms_are_summarized() -> None:
+    """Forms are summarized from the records returned by the API."""
+    index = FormIndex()
+    form = {**make_form(0), "count": "3", "archived": "1"}
+    index.add(form)
+    summary = index.get("1000")
+    assert summary is not None  # noqa: S101
+    assert summary.updated_at == form["created_at"]  # noqa: S101
+    assert summary.activity == {"count": 3, "last_submission": None}  # noqa: S101
+    assert not summary.active  # noqa: S101
+    assert index.get("1001") is None  # noqa: S101
+
+
+def test_activity_digest_ignores_form_updates() -> None:
+    """The activity digest only changes with the submissions of forms."""
+    index = FormIndex()
+    form = make_form(0)
+    index.add(form)
+    digest = index.activity_digest()
+    index.add({**form, "updated_at": "2024-03-01 00:00:00"})
+    assert index.activity_digest() == digest  # noqa: S101
+    index.add({**form, "count": "1", "last_submission": "2024-03-01 00:00:00"})
+    assert index.activity_digest() != digest  # noqa: S101
+
+
+def test_forms_are_listed_once() -> None:
+    """An incomplete index is completed by listing forms once."""
+    index = FormIndex()
+    calls = []
+
+    forms = [make_form(0), make_form(1)]
+
+    def list_forms() -> list[dict[str, str]]:
+        calls.append(1)
+        return forms
+
+    index.ensure_complete(list_forms)
+    index.ensure_complete(list_forms)
+    assert len(calls) == 1  # noqa: S101
+    assert len(index) == len(forms)  # noqa: S101
+
+
+def test_saved_index_is_reused_until_it_expires(tmp_path: Path) -> None:
+    """A complete index is read back by the next runs while it is recent."""
+    path = tmp_path / "forms.json"
+    index = FormIndex(path)
+    index.add(make_form(0))
+    index.mark_complete()
+
+    index = FormIndex(path, max_age=60)
+    assert index.complete  # noqa: S101
+    assert index.get("1000") is not None  # noqa: S101
+
+    expired = time.time() - 120
+    os.utime(path, (expired, expired))
+    index = FormIndex(path, max_age=60)
+    assert not index.complete  # noqa: S101
+    assert len(index) == 0  # noqa: S101
+
+
+def test_corrupt_index_is_ignored(tmp_path: Path) -> None:
+    """An index that cannot be read is ignored."""
+    path = tmp_path / "forms.json"
+    path.write_text("[1, 2")
+    index = FormIndex(path)
+    assert not index.complete  # noqa: S101
@@ -0,0 +1,120 @@
+"""Tests for performance instrumentation."""
+
+from __future__ import annotations
+
+import io
+import json
+from contextlib import redirect_stdout
+from typing import TYPE_CHECKING
+
+from tap_jotform.instrumentation import STAGES, Instrumentation
+from tap_jotform.tap import TapJotform
+from tests.fake_jotform import make_form, make_questions
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+    from tests.fake_jotform import FakeJotform
+
+
+class FakeClock:
+    """A clock that advances by one second on every reading."""
+
+    def __init__(self) -> None:
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time and advance the clock."""
+        self.now += 1
+        return self.now
+
+
+def test_stages_and_counters_are_summed() -> None:
+    """Timings and counters are summed per stream and endpoint."""
+    instrumentation = Instrumentation(clock=FakeClock())
+    with instrumentation.time("forms", "/user/forms", "network"):
+        pass
+    assert list(instrumentation.time_iter("ab", "forms", "/user/forms", "decode")) == [  # noqa: S101
+        "a",
+        "b",
+    ]
+    instrumentation.add("forms", "/user/forms", requests=1)
+    instrumentation.add("forms", "/user/forms", requests=1, bytes=10)
+    instrumentation.observe_limit_left(100)
+    instrumentation.observe_limit_left(98)
+
+    summary = instrumentation.summary()
+    stats = summary["streams"]["forms"]["/user/forms"]
+    expected = {
+        "network_seconds": 1,
+        "decode_seconds": 3,
+        "post_process_seconds": 0,
+        "requests": 2,
+        "bytes": 10,
+    }
+    assert {key: stats[key] for key in expected} == expected  # noqa: S101
+    assert summary["quota"] == {"limit_left": 98, "used": 2}  # noqa: S101
+
+
+def test_disabled_instrumentation_collects_nothing() -> None:
+    """Nothing is collected when the instrumentation is disabled."""
+    instrumentation = Instrumentation(enabled=False)
+    with instrumentation.time("forms", "/user/forms", "network"):
+        pass
+    instrumentation.add("forms", "/user/forms", requests=1)
+    assert instrumentation.summary()["streams"] == {}  # noqa: S101
+
+
+def test_prometheus_textfile(tmp_path: Path) -> None:
+    """Metrics are written in the Prometheus text format."""
+    instrumentation = Instrumentation()
+    instrumentation.add("forms", "/user/forms", requests=3, network_seconds=0.5)
+    path = tmp_path / "tap_jotform.prom"
+    instrumentation.write_prometheus(str(path))
+
+    lines = path.read_text().splitlines()
+    assert (  # noqa: S101
+        'tap_jotform_stage_seconds_total{stream="forms",endpoint="/user/forms",'
+        'stage="network"} 0.5'
+    ) in lines
+    assert 'tap_jotform_requests_total{stream="forms",endpoint="/user/forms"} 3' in (  # noqa: S101
+        lines
+    )
+    assert "tap_jotform_quota_used 0" in lines  # noqa: S101
+    assert not list(tmp_path.glob(".*.tmp"))  # noqa: S101
+
+
+def test_sync_exports_metrics(
+    fake_api: FakeJotform,
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A sync logs metrics and writes a JSON summary when metrics are enabled."""
+    fake_api.forms = [make_form(i) for i in range(3)]
+    fake_api.questions = {form["id"]: make_questions(2) for form in fake_api.forms}
+    path = tmp_path / "metrics.json"
+    tap = TapJotform(
+        config={
+            "api_key": "test",
+            "api_url": fake_api.url,
+            "include_deprecated_streams": False,
+            "metrics": {"enabled": True, "json_path": str(path)},
+        },
+        parse_env_config=False,
+    )
+    with caplog.at_level("INFO"), redirect_stdout(io.StringIO()):
+        tap.sync_all()
+
+    summary = json.loads(path.read_text())
+    forms = summary["streams"]["forms"]["/user/forms"]
+    questions = summary["streams"]["questions"]["/form/{form_id}/questions"]
+    assert forms["records"] == len(fake_api.forms)  # noqa: S101
+    assert questions["requests"] == len(fake_api.forms)  # noqa: S101
+    assert questions["records"] == 2 * len(fake_api.forms)  # noqa: S101
+    assert questions["bytes"] > 0  # noqa: S101
+    assert all(forms[f"{stage}_seconds"] > 0 for stage in STAGES)  # noqa: S101
+    assert summary["quota"]["used"] > 0  # noqa: S101
+    assert any(message.startswith("PERF: ") for message in caplog.messages)  # noqa: S101
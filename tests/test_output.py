@@ -0,0 +1,187 @@
+"""Tests for the fast output mode."""
+
+from __future__ import annotations
+
+import copy
+import datetime as dt
+import io
+import json
+import logging
+from contextlib import redirect_stdout
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from singer_sdk import typing as th
+from singer_sdk.helpers import _typing as sdk_typing
+from singer_sdk.helpers._catalog import pop_deselected_record_properties
+from singer_sdk.helpers._typing import (
+    _conform_primitive_property,
+    _is_exclusive_boolean_type,
+    conform_record_data_types,
+)
+from singer_sdk.helpers.conform import TypeConformanceLevel
+from singer_sdk.singerlib import Catalog, RecordMessage, StateMessage
+
+from tap_jotform import output
+from tap_jotform.output import (
+    BufferedWriter,
+    RecordConformer,
+    conform_primitive,
+    is_exclusive_boolean_type,
+)
+
+SCHEMA = th.PropertiesList(
+    th.Property("id", th.StringType),
+    th.Property("enabled", th.BooleanType),
+    th.Property(
+        "settings",
+        th.ObjectType(
+            th.Property("title", th.StringType),
+            th.Property("secret", th.StringType),
+        ),
+    ),
+    th.Property(
+        "answers",
+        th.ArrayType(
+            th.ObjectType(
+                th.Property("qid", th.StringType),
+                th.Property("flag", th.BooleanType),
+            ),
+        ),
+    ),
+    th.Property("extra", th.ObjectType(additional_properties=True)),
+).to_dict()
+
+RECORD = {
+    "id": "1",
+    "enabled": 1,
+    "settings": {"title": "Form", "secret": "s3cr3t", "other": 1},
+    "answers": [{"qid": "1", "flag": 0, "other": 1}, "text"],
+    "extra": {"anything": [1, 2]},
+    "score": 1.5,
+}
+
+
+def test_conformer_matches_the_sdk() -> None:
+    """Records are conformed as by the SDK."""
+    catalog = Catalog.from_dict(
+        {
+            "streams": [
+                {
+                    "tap_stream_id": "forms",
+                    "schema": SCHEMA,
+                    "metadata": [
+                        {"breadcrumb": [], "metadata": {"selected": True}},
+                        {
+                            "breadcrumb": [
+                                "properties",
+                                "settings",
+                                "properties",
+                                "secret",
+                            ],
+                            "metadata": {"selected": False},
+                        },
+                    ],
+                },
+            ],
+        },
+    )
+    mask = catalog["forms"].metadata.resolve_selection()
+    logger = logging.getLogger("test")
+
+    expected = copy.deepcopy(RECORD)
+    pop_deselected_record_properties(expected, SCHEMA, mask)
+    expected = conform_record_data_types(
+        "forms",
+        expected,
+        SCHEMA,
+        TypeConformanceLevel.RECURSIVE,
+        logger,
+    )
+    actual = RecordConformer("forms", SCHEMA, mask, logger)(copy.deepcopy(RECORD))
+    assert actual == expected  # noqa: S101
+    assert actual["enabled"] is True  # noqa: S101
+    assert "secret" not in actual["settings"]  # noqa: S101
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        {"type": "boolean"},
+        {"type": ["boolean", "null"]},
+        {"type": ["string", "boolean"]},
+        {"anyOf": [{"type": "boolean"}, {"type": "null"}]},
+        {"type": ["integer", "null"]},
+        {"type": "string", "format": "date-time"},
+        {},
+    ],
+)
+def test_primitives_are_conformed_as_by_the_sdk(schema: dict[str, Any]) -> None:
+    """The helpers copied from the SDK still conform values as it does."""
+    values = [
+        None,
+        0,
+        1,
+        "text",
+        1.5,
+        float("nan"),
+        float("inf"),
+        Decimal("2.5"),
+        b"\x00",
+        b"\x01",
+        dt.datetime(2024, 1, 1, 12, 30),  # noqa: DTZ001
+        dt.datetime(2024, 1, 1, 12, 30, tzinfo=dt.timezone(dt.timedelta(hours=2))),
+        dt.date(2024, 1, 1),
+        dt.time(12, 30),
+        dt.timedelta(hours=1),
+    ]
+    assert is_exclusive_boolean_type(schema) == _is_exclusive_boolean_type(schema)  # noqa: S101
+    for value in values:
+        expected = _conform_primitive_property(value, schema)
+        actual = conform_primitive(value, schema)
+        assert actual == expected, value  # noqa: S101
+        assert type(actual) is type(expected), value  # noqa: S101
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        {"type": "boolean"},
+        {"type": ["object", "null"], "properties": {}},
+        {"type": "array", "items": {"type": "string"}},
+        {"type": ["array", "null"], "items": [{"type": "string"}]},
+        {"type": "array", "items": {}, "prefixItems": [{"type": "string"}]},
+        {"anyOf": [{"type": "array", "items": {}}, {"type": "null"}]},
+        {"anyOf": [{"type": "boolean"}, {"type": "object"}]},
+        {"allOf": [{"type": "array"}, {"type": "string"}]},
+    ],
+)
+@pytest.mark.parametrize(
+    "helper",
+    ["is_array_type", "is_boolean_type", "is_object_type", "is_uniform_list"],
+)
+def test_type_helpers_match_the_sdk(helper: str, schema: dict[str, Any]) -> None:
+    """The type helpers copied from the SDK still detect types as it does."""
+    expected = getattr(sdk_typing, helper)(schema)
+    assert getattr(output, helper)(schema) == expected  # noqa: S101
+
+
+def test_buffered_writer_flushes_before_state() -> None:
+    """RECORD messages are buffered until a STATE message is written."""
+    writer = BufferedWriter()
+    writer.buffer_size = 1_000_000
+    output = io.StringIO()
+    with redirect_stdout(output):
+        writer.write_message(RecordMessage(stream="forms", record={"id": "1"}))
+        writer.write_message(
+            RecordMessage(stream="forms", record={"score": Decimal("1.10")}),
+        )
+        assert output.getvalue() == ""  # noqa: S101
+        writer.write_message(StateMessage(value={"bookmarks": {}}))
+
+    messages: list[dict[str, Any]] = [
+        json.loads(line) for line in output.getvalue().splitlines()
+    ]
+    assert [message["type"] for message in messages] == ["RECORD", "RECORD", "STATE"]  # noqa: S101
+    assert '"score":1.10' in output.getvalue()  # noqa: S101
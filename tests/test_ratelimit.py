@@ -0,0 +1,95 @@
+"""Tests for quota-based request pacing."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from tap_jotform.ratelimit import QuotaScheduler
+
+
+class FakeClock:
+    """A clock that only advances when sleeping."""
+
+    def __init__(self) -> None:
+        """Start the clock at zero."""
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Record a sleep and advance the clock."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Return a fake clock."""
+    return FakeClock()
+
+
+def make_scheduler(clock: FakeClock, **kwargs: Any) -> QuotaScheduler:
+    """Create a scheduler driven by a fake clock."""
+    return QuotaScheduler(
+        throttle_below=100,
+        seconds_until_reset=lambda: 1000.0,
+        clock=clock,
+        sleep=clock.sleep,
+        **kwargs,
+    )
+
+
+def test_no_pacing_while_quota_is_ample(clock: FakeClock) -> None:
+    """Requests are not delayed while the quota is above the threshold."""
+    scheduler = make_scheduler(clock)
+    scheduler.update(5000)
+    for _ in range(10):
+        scheduler.acquire()
+    assert clock.sleeps == []  # noqa: S101
+
+
+def test_pacing_grows_as_quota_shrinks(clock: FakeClock) -> None:
+    """Requests are spread out more as the quota approaches zero."""
+    scheduler = make_scheduler(clock)
+    scheduler.update(50)
+    slow = scheduler.interval()
+    scheduler.update(10)
+    slower = scheduler.interval()
+    assert 0 < slow < slower  # noqa: S101
+
+    scheduler.acquire()
+    scheduler.acquire()
+    assert clock.sleeps == [pytest.approx(slower)]  # noqa: S101
+
+
+def test_pause_until_reset_when_exhausted(clock: FakeClock) -> None:
+    """Requests wait for the reset once the quota is exhausted."""
+    scheduler = make_scheduler(clock, pause_when_exhausted=True)
+    scheduler.exhaust()
+    scheduler.acquire()
+    assert clock.sleeps == [1000.0]  # noqa: S101
+    assert scheduler.limit_left is None  # noqa: S101
+
+    scheduler.acquire()
+    assert clock.sleeps == [1000.0]  # noqa: S101
+
+
+def test_pause_is_bounded(clock: FakeClock) -> None:
+    """The wait for the quota reset is capped."""
+    scheduler = make_scheduler(clock, pause_when_exhausted=True, max_pause=60)
+    scheduler.update(0)
+    scheduler.acquire()
+    assert clock.sleeps == [60]  # noqa: S101
+
+
+def test_no_pause_when_disabled(clock: FakeClock) -> None:
+    """Requests are not delayed unless pausing is enabled."""
+    scheduler = make_scheduler(clock)
+    scheduler.update(0)
+    scheduler.acquire()
+    assert clock.sleeps == []  # noqa: S101
@@ -0,0 +1,128 @@
+"""Tests for retries and hedged requests."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, cast
+
+import pytest
+import requests
+from singer_sdk.exceptions import RetriableAPIError
+from singer_sdk.streams.rest import DEFAULT_REQUEST_TIMEOUT
+
+from tap_jotform.resilience import Hedger, RetryPolicy, classify_error
+from tap_jotform.tap import TapJotform
+
+if TYPE_CHECKING:
+    from tap_jotform.client import JotformStream
+
+
+def make_response(
+    status: int, headers: dict[str, str] | None = None
+) -> requests.Response:
+    """Build a response with a status code and headers."""
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return response
+
+
+def api_error(status: int, headers: dict[str, str] | None = None) -> RetriableAPIError:
+    """Build a retriable API error for a status code."""
+    return RetriableAPIError("error", make_response(status, headers))
+
+
+@pytest.mark.parametrize(
+    ("exception", "error"),
+    [
+        (api_error(429), "quota"),
+        (api_error(502), "server"),
+        (requests.exceptions.ReadTimeout(), "timeout"),
+        (requests.exceptions.ConnectionError(), "connection"),
+    ],
+)
+def test_errors_are_classified(exception: BaseException, error: str) -> None:
+    """Errors are classified by their cause."""
+    assert classify_error(exception) == error  # noqa: S101
+
+
+def test_waits_grow_per_error_class() -> None:
+    """Waits grow with the errors of each class, up to the maximum of the class."""
+    policy = RetryPolicy(uniform=lambda _, high: high)
+    waits = policy.waits()
+    next(waits)
+    assert [waits.send(api_error(500)) for _ in range(7)] == [2, 4, 8, 16, 32, 60, 60]  # noqa: S101
+    assert [  # noqa: S101
+        waits.send(requests.exceptions.ReadTimeout()),
+        waits.send(api_error(429, {"Retry-After": "30"})),
+    ] == [0.5, 30]
+    assert policy.retries == {"server": 7, "timeout": 1, "quota": 1}  # noqa: S101
+
+
+def test_retry_budget_is_shared() -> None:
+    """Requests are no longer retried once the budget is spent."""
+    policy = RetryPolicy(budget=2, uniform=lambda _, high: high)
+    first = policy.waits()
+    next(first)
+    first.send(api_error(500))
+    second = policy.waits()
+    next(second)
+    second.send(requests.exceptions.ConnectionError())
+    with pytest.raises(StopIteration):
+        first.send(api_error(500))
+
+
+def test_slow_requests_are_hedged() -> None:
+    """A duplicate of a slow request is sent and the first response is used."""
+    pool = ThreadPoolExecutor(max_workers=2)
+    hedger = Hedger(executor=pool, min_samples=3)
+    for _ in range(3):
+        hedger.observe(0.01)
+
+    stalled = threading.Event()
+    calls = 0
+
+    def request() -> requests.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            stalled.wait(5)
+            return make_response(500)
+        return make_response(200)
+
+    start = time.perf_counter()
+    response = hedger.send(request, lambda: True)
+    assert time.perf_counter() - start < 1  # noqa: S101
+    assert response.status_code == requests.codes.ok  # noqa: S101
+    # The stalled request and its duplicate
+    expected_calls = 2
+    assert calls == expected_calls  # noqa: S101
+    stalled.set()
+    pool.shutdown()
+
+
+def test_requests_are_not_hedged_without_samples() -> None:
+    """No duplicate is sent before enough latencies are observed."""
+    hedger = Hedger(executor=ThreadPoolExecutor(max_workers=2), min_samples=3)
+
+    def can_hedge() -> bool:
+        raise AssertionError
+
+    response = hedger.send(lambda: make_response(200), can_hedge)
+    assert response.status_code == requests.codes.ok  # noqa: S101
+    assert hedger.threshold() is None  # noqa: S101
+
+
+def test_request_timeouts_per_stream() -> None:
+    """Request timeouts are configured per stream."""
+    timeout = 10
+    tap = TapJotform(
+        config={"api_key": "test", "request_timeouts": {"questions": timeout}},
+        parse_env_config=False,
+    )
+    questions = cast("JotformStream", tap.streams["questions"])
+    forms = cast("JotformStream", tap.streams["forms"])
+    assert questions.timeout == timeout  # noqa: S101
+    assert forms.timeout == DEFAULT_REQUEST_TIMEOUT  # noqa: S101
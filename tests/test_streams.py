@@ -0,0 +1,983 @@
+"""Tests for stream behavior against a local fake Jotform API."""
+
+from __future__ import annotations
+
+import copy
+import datetime as dt
+import gzip
+import io
+import json
+import resource
+import threading
+import time
+from contextlib import redirect_stdout
+from typing import TYPE_CHECKING, Any, cast
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from singer_sdk.exceptions import FatalAPIError
+
+from tap_jotform.tap import TapJotform
+from tests.fake_jotform import (
+    FakeJotform,
+    make_dataset,
+    make_folder,
+    make_form,
+    make_history_entry,
+    make_questions,
+    make_submission,
+    stream_page,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from tap_jotform.client import JotformStream
+
+
+def make_tap(
+    api: FakeJotform,
+    state: dict[str, Any] | None = None,
+    catalog: dict[str, Any] | None = None,
+    **config: Any,
+) -> TapJotform:
+    """Create a tap that talks to the fake API."""
+    return TapJotform(
+        config={
+            "api_key": "test",
+            "api_url": api.url,
+            "include_deprecated_streams": False,
+            **config,
+        },
+        state=state,
+        catalog=catalog,
+        parse_env_config=False,
+    )
+
+
+def run_sync(
+    api: FakeJotform,
+    state: dict[str, Any] | None = None,
+    catalog: dict[str, Any] | None = None,
+    **config: Any,
+) -> list[dict[str, Any]]:
+    """Run a full sync against the fake API and return the Singer messages."""
+    tap = make_tap(api, state, catalog, **config)
+    output = io.StringIO()
+    with redirect_stdout(output):
+        tap.sync_all()
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+def incremental_catalog(
+    api: FakeJotform,
+    stream: str,
+    replication_key: str = "created_at",
+    **config: Any,
+) -> dict[str, Any]:
+    """Return the discovered catalog with incremental replication for a stream."""
+    catalog = make_tap(api, **config).catalog_dict
+    for entry in catalog["streams"]:
+        if entry["tap_stream_id"] == stream:
+            entry["replication_method"] = "INCREMENTAL"
+            entry["replication_key"] = replication_key
+    return catalog
+
+
+def select(catalog: dict[str, Any], stream: str) -> dict[str, Any]:
+    """Select a stream in a catalog."""
+    for entry in catalog["streams"]:
+        if entry["tap_stream_id"] == stream:
+            for metadata in entry["metadata"]:
+                if metadata["breadcrumb"] == []:
+                    metadata["metadata"]["selected"] = True
+    return catalog
+
+
+def select_only(catalog: dict[str, Any], *streams: str) -> dict[str, Any]:
+    """Select the given streams in a catalog, and deselect all the others."""
+    for entry in catalog["streams"]:
+        for metadata in entry["metadata"]:
+            if metadata["breadcrumb"] == []:
+                metadata["metadata"]["selected"] = entry["tap_stream_id"] in streams
+    return catalog
+
+
+def deselect(
+    catalog: dict[str, Any],
+    stream: str,
+    *breadcrumbs: tuple[str, ...],
+) -> dict[str, Any]:
+    """Deselect properties of a stream in a catalog."""
+    for entry in catalog["streams"]:
+        if entry["tap_stream_id"] == stream:
+            entry["metadata"].extend(
+                {"breadcrumb": list(breadcrumb), "metadata": {"selected": False}}
+                for breadcrumb in breadcrumbs
+            )
+    return catalog
+
+
+def final_state(messages: list[dict[str, Any]]) -> dict[str, Any]:
+    """Return the last state emitted by a sync."""
+    states = [message["value"] for message in messages if message["type"] == "STATE"]
+    return cast("dict[str, Any]", states[-1])
+
+
+def records(messages: list[dict[str, Any]], stream: str) -> list[dict[str, Any]]:
+    """Return the records emitted for a stream, in order."""
+    return [
+        message["record"]
+        for message in messages
+        if message["type"] == "RECORD" and message["stream"] == stream
+    ]
+
+
+def test_questions_prefetch_is_concurrent_and_ordered(fake_api: FakeJotform) -> None:
+    """Questions are requested concurrently and keep the record order."""
+    fake_api.forms = [make_form(i) for i in range(12)]
+    fake_api.questions = {form["id"]: make_questions(3) for form in fake_api.forms}
+    fake_api.latency = 0.05
+
+    sequential = records(run_sync(fake_api), "questions")
+    assert fake_api.peak_concurrency("/form/") == 1  # noqa: S101
+
+    fake_api.intervals.clear()
+    concurrent = records(run_sync(fake_api, max_concurrent_requests=6), "questions")
+    assert fake_api.peak_concurrency("/form/") > 1  # noqa: S101
+
+    assert len(sequential) == 3 * len(fake_api.forms)  # noqa: S101
+    assert concurrent == sequential  # noqa: S101
+    assert len(fake_api.paths("/form/")) == 2 * len(fake_api.forms)  # noqa: S101
+
+
+@pytest.mark.parametrize("bookmark", [None, "2024-01-20T00:00:00+00:00"])
+def test_concurrent_streams_overlap_and_keep_the_order(
+    fake_api: FakeJotform,
+    bookmark: str | None,
+) -> None:
+    """Top-level streams fetched in the background keep the Singer output."""
+    fake_api.forms = [make_form(i) for i in range(3)]
+    fake_api.questions = {form["id"]: make_questions(2) for form in fake_api.forms}
+    fake_api.submissions = [make_submission(i, answers=1) for i in range(450)]
+    fake_api.latency = 0.1
+    state = None
+    if bookmark:
+        state = {
+            "bookmarks": {
+                "submissions": {
+                    "replication_key": "updated_at",
+                    "replication_key_value": bookmark,
+                },
+            },
+        }
+
+    sequential = run_sync(fake_api, state=state, max_concurrent_requests=4)
+    assert not fake_api.overlap("/user/submissions")  # noqa: S101
+
+    fake_api.intervals.clear()
+    concurrent = run_sync(
+        fake_api,
+        state=state,
+        max_concurrent_requests=4,
+        concurrent_streams={"enabled": True, "max_buffered_records": 50},
+    )
+    # Submissions are fetched while other streams are synced
+    assert fake_api.overlap("/user/submissions")  # noqa: S101
+
+    # Page offsets of streams fetched in the background are not checkpointed
+    assert [  # noqa: S101
+        (m["type"], m.get("stream")) for m in concurrent if m["type"] != "STATE"
+    ] == [(m["type"], m.get("stream")) for m in sequential if m["type"] != "STATE"]
+    for stream in ("forms", "questions", "submissions"):
+        assert records(concurrent, stream) == records(sequential, stream)  # noqa: S101
+    assert final_state(concurrent) == final_state(sequential)  # noqa: S101
+    if bookmark:
+        assert 0 < len(records(concurrent, "submissions")) < len(fake_api.submissions)  # noqa: S101
+
+
+def test_stalled_requests_are_hedged(fake_api: FakeJotform) -> None:
+    """A stalled request is duplicated instead of holding up the sync."""
+    fake_api.forms = [make_form(i) for i in range(20)]
+    fake_api.questions = {form["id"]: make_questions(2) for form in fake_api.forms}
+    stalled = f"/form/{fake_api.forms[15]['id']}/questions"
+    stall_seconds = 5
+    fake_api.stalls[stalled] = stall_seconds
+
+    start = time.perf_counter()
+    messages = run_sync(fake_api, hedging={"enabled": True, "min_samples": 5})
+    assert time.perf_counter() - start < stall_seconds  # noqa: S101
+    assert len(records(messages, "questions")) == 2 * len(fake_api.forms)  # noqa: S101
+    assert fake_api.paths(stalled) == [stalled, stalled]  # noqa: S101
+
+
+def test_hedging_threads_are_shared_and_stopped(fake_api: FakeJotform) -> None:
+    """Streams hedge requests from one pool, whose threads stop after the sync."""
+    fake_api.forms = [make_form(i) for i in range(10)]
+    fake_api.questions = {form["id"]: make_questions(2) for form in fake_api.forms}
+    tap = make_tap(fake_api, hedging={"enabled": True, "min_samples": 1})
+    hedgers = [
+        cast("JotformStream", tap.streams[name]).hedger
+        for name in ("forms", "questions")
+    ]
+    assert all(hedgers)  # noqa: S101
+    assert len({id(hedger._pool) for hedger in hedgers if hedger}) == 1  # noqa: S101, SLF001
+
+    with redirect_stdout(io.StringIO()):
+        tap.sync_all()
+    hedging_threads = [
+        thread for thread in threading.enumerate() if thread.name.startswith("hedging")
+    ]
+    for thread in hedging_threads:
+        thread.join(timeout=5)
+    assert not any(thread.is_alive() for thread in hedging_threads)  # noqa: S101
+
+
+def test_streaming_parse_memory_is_bounded(fake_api: FakeJotform) -> None:
+    """Streaming a ~50 MB page keeps memory usage small."""
+    page_records = 7000  # ~50 MB
+    max_growth = 10_000  # ~10 MB, ru_maxrss is in kilobytes on Linux
+
+    def body(params: dict[str, str]) -> Iterator[bytes]:
+        offset = int(params.get("offset", 0))
+        submissions = (
+            make_submission(i, answers=50) for i in range(page_records) if not offset
+        )
+        return stream_page(submissions)
+
+    fake_api.streamed_bodies["/user/submissions"] = body
+    tap = make_tap(fake_api, streaming_parse=True)
+    stream = cast("JotformStream", tap.streams["submissions"])
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    count = sum(1 for _ in stream.get_records(None))
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    assert count == page_records  # noqa: S101
+    assert rss_after - rss_before < max_growth  # noqa: S101
+
+
+def test_backfill_windows_are_merged_without_duplicates(fake_api: FakeJotform) -> None:
+    """Concurrent backfill windows return every submission once."""
+    fake_api.submissions = [make_submission(i, answers=1) for i in range(500)]
+    tap = make_tap(
+        fake_api,
+        start_date="2024-01-01T00:00:00Z",
+        max_concurrent_requests=4,
+        backfill={"enabled": True, "window_days": 3},
+    )
+    stream = cast("JotformStream", tap.streams["submissions"])
+    submissions = list(stream.get_records(None))
+
+    ids = [submission["id"] for submission in submissions]
+    assert sorted(ids) == sorted(s["id"] for s in fake_api.submissions)  # noqa: S101
+    created = [submission["created_at"] for submission in submissions]
+    assert created[0] < created[-1]  # noqa: S101
+    # More requests than paginating over all submissions at once
+    pages = len(ids) // stream.page_size + 1
+    assert len(fake_api.paths("/user/submissions")) > pages  # noqa: S101
+
+
+def test_backfill_is_incremental_after_the_first_sync(fake_api: FakeJotform) -> None:
+    """Older submissions updated after the bookmark are synced with backfills on."""
+    fake_api.submissions = [make_submission(i, answers=1) for i in range(50)]
+    config: dict[str, Any] = {
+        "start_date": "2024-01-01T00:00:00Z",
+        "backfill": {"enabled": True, "window_days": 100},
+    }
+    catalog = select_only(make_tap(fake_api).catalog_dict, "submissions")
+    state = final_state(run_sync(fake_api, catalog=catalog, **config))
+
+    fake_api.submissions[0]["updated_at"] = "2024-02-01 00:00:00"
+    fake_api.submissions.append(make_submission(50, answers=1))
+    fake_api.submissions[-1]["created_at"] = "2024-02-02 00:00:00"
+    messages = run_sync(fake_api, state=state, catalog=catalog, **config)
+    assert [r["id"] for r in records(messages, "submissions")] == [  # noqa: S101
+        "5000050",
+        "5000000",
+    ]
+
+
+def test_per_form_submissions_skip_dormant_forms(fake_api: FakeJotform) -> None:
+    """Forms without new submissions are not requested again."""
+    fake_api.forms = [make_form(i) for i in range(3)]
+    fake_api.submissions = [
+        make_submission(i, form_id=form["id"], answers=1)
+        for i, form in enumerate(fake_api.forms * 2)
+    ]
+    for form in fake_api.forms:
+        form["count"] = "2"
+        form["last_submission"] = "2024-01-05 00:00:00"
+
+    catalog = incremental_catalog(fake_api, "submissions", submissions_per_form=True)
+    messages = run_sync(fake_api, catalog=catalog, submissions_per_form=True)
+    assert len(records(messages, "submissions")) == len(fake_api.submissions)  # noqa: S101
+    state = final_state(messages)
+
+    fake_api.forms[1]["count"] = "3"
+    fake_api.submissions.append(
+        {
+            **make_submission(99, form_id="1001", answers=1),
+            "created_at": "2024-02-01 00:00:00",
+        },
+    )
+    fake_api.requests.clear()
+    messages = run_sync(
+        fake_api,
+        state=state,
+        catalog=catalog,
+        submissions_per_form=True,
+    )
+    assert [r["id"] for r in records(messages, "submissions")] == ["5000099"]  # noqa: S101
+    synced_forms = {
+        path.split("/")[2] for path in fake_api.paths("/form/") if "submissions" in path
+    }
+    assert synced_forms == {"1001"}  # noqa: S101
+
+
+def test_per_form_submissions_prefetch_the_filtered_request(
+    fake_api: FakeJotform,
+) -> None:
+    """Incremental syncs send the same requests with or without prefetching."""
+    fake_api.forms = [make_form(i) for i in range(3)]
+    fake_api.submissions = [
+        make_submission(i, form_id=form["id"], answers=1)
+        for i, form in enumerate(fake_api.forms)
+    ]
+    for form in fake_api.forms:
+        form["count"] = "1"
+    catalog = incremental_catalog(fake_api, "submissions", submissions_per_form=True)
+    state = final_state(run_sync(fake_api, catalog=catalog, submissions_per_form=True))
+
+    for i, form in enumerate(fake_api.forms):
+        form["count"] = "2"
+        fake_api.submissions.append(
+            {
+                **make_submission(10 + i, form_id=form["id"], answers=1),
+                "created_at": "2024-02-01 00:00:00",
+            },
+        )
+    paths = {}
+    for max_concurrent_requests in (1, 4):
+        fake_api.requests.clear()
+        messages = run_sync(
+            fake_api,
+            state=copy.deepcopy(state),
+            catalog=catalog,
+            submissions_per_form=True,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+        assert len(records(messages, "submissions")) == len(fake_api.forms)  # noqa: S101
+        paths[max_concurrent_requests] = sorted(
+            path for path in fake_api.paths("/form/") if "submissions" in path
+        )
+    assert paths[1] == paths[4]  # noqa: S101
+    assert all("filter" in path for path in paths[4])  # noqa: S101
+
+
+def test_prefetched_incremental_submissions_are_used(fake_api: FakeJotform) -> None:
+    """The first replication pass of each form is prefetched and not sent again."""
+    fake_api.forms = [make_form(i) for i in range(4)]
+    fake_api.submissions = [
+        make_submission(i, form_id=form["id"], answers=1)
+        for i, form in enumerate(fake_api.forms)
+    ]
+    for form in fake_api.forms:
+        form["count"] = "1"
+    catalog = select_only(
+        make_tap(fake_api, submissions_per_form=True).catalog_dict,
+        "forms",
+        "submissions",
+    )
+    state = final_state(run_sync(fake_api, catalog=catalog, submissions_per_form=True))
+
+    for form in fake_api.forms:
+        form["count"] = "2"
+    fake_api.requests.clear()
+    fake_api.intervals.clear()
+    fake_api.latency = 0.05
+    run_sync(
+        fake_api,
+        state=state,
+        catalog=catalog,
+        submissions_per_form=True,
+        max_concurrent_requests=len(fake_api.forms),
+    )
+    submissions_requests = [
+        path for path in fake_api.paths("/form/") if "submissions" in path
+    ]
+    first_pass = [path for path in submissions_requests if "created_at%3Agt" in path]
+    assert fake_api.peak_concurrency("/form/") > 1  # noqa: S101
+    assert all("filter" in path for path in submissions_requests)  # noqa: S101
+    assert len(first_pass) == len(set(first_pass))  # noqa: S101
+    assert {path.split("/")[2] for path in first_pass} == {  # noqa: S101
+        form["id"] for form in fake_api.forms
+    }
+
+
+def test_questions_of_unchanged_forms_are_skipped(fake_api: FakeJotform) -> None:
+    """Questions are only requested again for forms updated since the last sync."""
+    fake_api.forms = [make_form(i) for i in range(3)]
+    fake_api.questions = {form["id"]: make_questions(2) for form in fake_api.forms}
+
+    messages = run_sync(fake_api, skip_unchanged_questions=True)
+    assert len(records(messages, "questions")) == 2 * len(fake_api.forms)  # noqa: S101
+    state = final_state(messages)
+
+    fake_api.forms[2]["updated_at"] = "2024-03-01 00:00:00"
+    fake_api.requests.clear()
+    messages = run_sync(fake_api, state=state, skip_unchanged_questions=True)
+    assert {r["form_id"] for r in records(messages, "questions")} == {"1002"}  # noqa: S101
+    assert fake_api.paths("/form/") == ["/form/1002/questions"]  # noqa: S101
+
+    fake_api.requests.clear()
+    run_sync(fake_api, state=state, max_concurrent_requests=4)
+    assert len(fake_api.paths("/form/")) == len(fake_api.forms)  # noqa: S101
+
+
+def test_inactive_forms_are_skipped(fake_api: FakeJotform) -> None:
+    """Children of deleted and archived forms are skipped if enabled."""
+    fake_api.forms = [make_form(i) for i in range(3)]
+    fake_api.forms[1]["status"] = "DELETED"
+    fake_api.forms[2]["archived"] = "1"
+    fake_api.questions = {form["id"]: make_questions(1) for form in fake_api.forms}
+
+    messages = run_sync(fake_api, form_index={"skip_inactive": True})
+    assert {r["form_id"] for r in records(messages, "questions")} == {"1000"}  # noqa: S101
+    assert fake_api.paths("/form/") == ["/form/1000/questions"]  # noqa: S101
+    assert len(records(messages, "forms")) == len(fake_api.forms)  # noqa: S101
+
+
+def test_children_of_recently_submitted_forms_first(fake_api: FakeJotform) -> None:
+    """Forms only synced for their children are ordered by last submission."""
+    fake_api.forms = [make_form(i) for i in range(3)]
+    fake_api.forms[1]["last_submission"] = "2024-03-01 00:00:00"
+    fake_api.forms[2]["last_submission"] = "2024-02-01 00:00:00"
+    fake_api.questions = {form["id"]: make_questions(1) for form in fake_api.forms}
+
+    catalog = select_only(make_tap(fake_api).catalog_dict, "questions")
+    messages = run_sync(fake_api, catalog=catalog, page_sizes={"forms": 1})
+    assert not records(messages, "forms")  # noqa: S101
+    # Offsets of the sorted forms are not checkpointed
+    assert not any(  # noqa: S101
+        "resume" in message["value"]["bookmarks"].get("forms", {})
+        for message in messages
+        if message["type"] == "STATE"
+    )
+    assert [r["form_id"] for r in records(messages, "questions")] == [  # noqa: S101
+        "1001",
+        "1002",
+        "1000",
+    ]
+
+
+def test_submissions_without_new_form_activity_are_skipped(
+    fake_api: FakeJotform,
+    tmp_path: Path,
+) -> None:
+    """No submissions are requested when no form has new submissions."""
+    fake_api.forms = [make_form(i) for i in range(2)]
+    fake_api.submissions = [make_submission(i, answers=1) for i in range(2)]
+    fake_api.forms[0]["count"] = "2"
+    catalog = select_only(make_tap(fake_api).catalog_dict, "submissions")
+    config: dict[str, Any] = {
+        "skip_unchanged_submissions": True,
+        "form_index": {"path": str(tmp_path / "forms.json"), "max_age_seconds": 0},
+    }
+
+    messages = run_sync(fake_api, catalog=catalog, **config)
+    assert len(records(messages, "submissions")) == len(fake_api.submissions)  # noqa: S101
+    assert fake_api.paths("/user/forms")  # noqa: S101
+    assert (tmp_path / "forms.json").exists()  # noqa: S101
+    state = final_state(messages)
+
+    fake_api.requests.clear()
+    messages = run_sync(fake_api, state=state, catalog=catalog, **config)
+    assert not records(messages, "submissions")  # noqa: S101
+    assert fake_api.paths("/user/submissions") == []  # noqa: S101
+
+    fake_api.forms[0]["count"] = "3"
+    fake_api.submissions.append(
+        {
+            **make_submission(2, answers=1),
+            "created_at": "2024-03-01 00:00:00",
+        },
+    )
+    messages = run_sync(fake_api, state=state, catalog=catalog, **config)
+    assert [r["id"] for r in records(messages, "submissions")] == ["5000002"]  # noqa: S101
+
+
+def test_forms_listed_in_the_background_keep_the_forms_checkpoints(
+    fake_api: FakeJotform,
+) -> None:
+    """Listing forms for submissions in the background leaves the forms STATE."""
+    fake_api.forms = [make_form(i) for i in range(20)]
+    fake_api.submissions = [make_submission(i, answers=1) for i in range(2)]
+    fake_api.latency = 0.02
+    catalog = select_only(make_tap(fake_api).catalog_dict, "forms", "submissions")
+
+    messages = run_sync(
+        fake_api,
+        catalog=catalog,
+        page_sizes={"forms": 1},
+        skip_unchanged_submissions=True,
+        concurrent_streams={"enabled": True},
+    )
+    # Forms were listed twice, by the forms stream and for submissions, each
+    # listing ending on an empty page
+    pages = len(fake_api.forms) + 1
+    assert len(fake_api.paths("/user/forms")) == 2 * pages  # noqa: S101
+    emitted = 0
+    offsets = []
+    for message in messages:
+        if message["type"] == "RECORD" and message["stream"] == "forms":
+            emitted += 1
+        elif message["type"] == "STATE":
+            forms_state = message["value"]["bookmarks"].get("forms", {})
+            if "resume" in forms_state:
+                offset = forms_state["resume"]["offset"]
+                assert offset <= emitted  # noqa: S101
+                offsets.append(offset)
+    assert offsets == sorted(offsets)  # noqa: S101
+    assert [r["id"] for r in records(messages, "forms")] == [  # noqa: S101
+        form["id"] for form in fake_api.forms
+    ]
+    assert "resume" not in final_state(messages)["bookmarks"]["forms"]  # noqa: S101
+
+
+def test_user_history_is_synced_incrementally(fake_api: FakeJotform) -> None:
+    """History is requested in concurrent windows from the bookmark."""
+    now = int(time.time())
+    day = 86400
+    fake_api.history = [
+        make_history_entry(timestamp)
+        for timestamp in (now - 40 * day, now - 20 * day, now - 7 * day, now - day)
+    ]
+    catalog = select_only(make_tap(fake_api).catalog_dict, "user_history")
+    start_date = dt.datetime.fromtimestamp(now - 30 * day, dt.UTC).isoformat()
+    config: dict[str, Any] = {
+        "start_date": start_date,
+        "history_window_days": 7,
+        "max_concurrent_requests": 4,
+    }
+
+    messages = run_sync(fake_api, catalog=catalog, **config)
+    timestamps = [r["timestamp"] for r in records(messages, "user_history")]
+    assert timestamps == [now - 20 * day, now - 7 * day, now - day]  # noqa: S101
+    # One request per week since the start date
+    weeks = range(now - 30 * day, now, 7 * day)
+    assert len(fake_api.paths("/user/history")) == len(weeks)  # noqa: S101
+    state = final_state(messages)
+    assert state["bookmarks"]["user_history"]["replication_key_value"] == now - day  # noqa: S101
+
+    fake_api.history.append(make_history_entry(now))
+    fake_api.requests.clear()
+    messages = run_sync(fake_api, state=state, catalog=catalog, **config)
+    timestamps = [r["timestamp"] for r in records(messages, "user_history")]
+    assert timestamps == [now - day, now]  # noqa: S101
+    assert len(fake_api.paths("/user/history")) == 1  # noqa: S101
+
+
+def test_root_folder_is_a_single_record(fake_api: FakeJotform) -> None:
+    """The root folder returned as an object is synced as one record."""
+    fake_api.folders = make_folder("root", [make_form(0)], [make_folder("a", [])])
+    catalog = select_only(
+        make_tap(fake_api, include_deprecated_streams=True).catalog_dict,
+        "folders",
+    )
+    messages = run_sync(fake_api, catalog=catalog, include_deprecated_streams=True)
+    folders = records(messages, "folders")
+    assert [folder["id"] for folder in folders] == ["root"]  # noqa: S101
+    assert folders[0]["forms"]["1000"]["count"] == 0  # noqa: S101
+    assert folders[0]["subfolders"][0]["id"] == "a"  # noqa: S101
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_folder_forms(fake_api: FakeJotform, *, compact: bool) -> None:
+    """Folder membership of forms is emitted for nested subfolders."""
+    forms = [make_form(i) for i in range(4)]
+    fake_api.folders = make_folder(
+        "root",
+        forms[:1],
+        [
+            make_folder("a", forms[1:2], [make_folder("a1", forms[2:4])]),
+            make_folder("b", []),
+        ],
+    )
+    catalog = select_only(
+        make_tap(fake_api, include_deprecated_streams=True).catalog_dict,
+        "folders",
+        "folder_forms",
+    )
+
+    messages = run_sync(
+        fake_api,
+        catalog=catalog,
+        include_deprecated_streams=True,
+        compact_folders=compact,
+    )
+    assert [  # noqa: S101
+        (r["folder_id"], r["form_id"]) for r in records(messages, "folder_forms")
+    ] == [
+        ("root", "1000"),
+        ("a", "1001"),
+        ("a1", "1002"),
+        ("a1", "1003"),
+    ]
+    folders = records(messages, "folders")
+    if compact:
+        assert [folder["id"] for folder in folders] == ["root", "a", "a1", "b"]  # noqa: S101
+        assert folders[0]["subfolders"] == [{"id": "a"}, {"id": "b"}]  # noqa: S101
+        assert all("forms" not in folder for folder in folders)  # noqa: S101
+    else:
+        assert [folder["id"] for folder in folders] == ["root"]  # noqa: S101
+        assert folders[0]["forms"]["1000"]["count"] == 0  # noqa: S101
+
+
+def test_connections_are_shared_across_streams(fake_api: FakeJotform) -> None:
+    """Streams reuse the connections kept alive by the tap."""
+    fake_api.forms = [make_form(i) for i in range(12)]
+    fake_api.questions = {form["id"]: make_questions(1) for form in fake_api.forms}
+
+    workers = 4
+    run_sync(fake_api, max_concurrent_requests=workers)
+    assert len(fake_api.requests) > len(fake_api.forms)  # noqa: S101
+    assert fake_api.connections <= workers  # noqa: S101
+
+
+def test_submission_answers(fake_api: FakeJotform) -> None:
+    """Answers are listed with their JSON-encoded deprecated ``answer`` string."""
+    submission = make_submission(0, answers=0)
+    submission["answers"] = {
+        "1": {"name": "name", "answer": {"first": "Ada", "last": "Lovelace"}},
+        "2": {"name": "city", "answer": "Zürich"},
+        "3": {"name": "empty"},
+    }
+    fake_api.submissions = [submission]
+
+    [record] = records(run_sync(fake_api), "submissions")
+    assert record["answers"] == [  # noqa: S101
+        {
+            "qid": "1",
+            "name": "name",
+            "answer": '{"first": "Ada", "last": "Lovelace"}',
+            "answer_object": {"first": "Ada", "last": "Lovelace"},
+        },
+        {
+            "qid": "2",
+            "name": "city",
+            "answer": '"Z\\u00fcrich"',
+            "answer_object": "Zürich",
+        },
+        {"qid": "3", "name": "empty", "answer": None, "answer_object": None},
+    ]
+
+
+def test_deselected_deprecated_answer_is_not_serialized(
+    fake_api: FakeJotform,
+) -> None:
+    """The deprecated ``answer`` string is left out when it is deselected."""
+    fake_api.submissions = [make_submission(0, answers=2)]
+    catalog = deselect(
+        make_tap(fake_api).catalog_dict,
+        "submissions",
+        ("properties", "answers", "items", "properties", "answer"),
+    )
+
+    [record] = records(run_sync(fake_api, catalog=catalog), "submissions")
+    assert len(record["answers"]) == len(fake_api.submissions[0]["answers"])  # noqa: S101
+    for answer in record["answers"]:
+        assert "answer" not in answer  # noqa: S101
+        assert "answer_object" in answer  # noqa: S101
+
+
+def test_deselected_properties_are_not_built(fake_api: FakeJotform) -> None:
+    """Deselected properties are neither transformed nor emitted."""
+    fake_api.submissions = [make_submission(0, answers=2)]
+    catalog = deselect(
+        make_tap(fake_api).catalog_dict,
+        "submissions",
+        ("properties", "answers"),
+        ("properties", "flag"),
+    )
+    tap = make_tap(fake_api, catalog=catalog)
+    stream = cast("JotformStream", tap.streams["submissions"])
+    assert stream.selected_integer_fields == ("new",)  # noqa: S101
+
+    [row] = stream.get_records(None)
+    row = stream.post_process(row) or {}
+    assert "answers" not in row  # noqa: S101
+    assert isinstance(row["flag"], str)  # noqa: S101
+    assert isinstance(row["new"], int)  # noqa: S101
+
+    [record] = records(run_sync(fake_api, catalog=catalog), "submissions")
+    assert "answers" not in record  # noqa: S101
+    assert "flag" not in record  # noqa: S101
+    assert record["new"] == int(fake_api.submissions[0]["new"])  # noqa: S101
+
+
+def test_submission_answers_stream(fake_api: FakeJotform) -> None:
+    """Answers are emitted one per row, without extra requests."""
+    submission = make_submission(0, answers=0)
+    submission["answers"] = {
+        "1": {"name": "name", "order": "1", "answer": {"first": "Ada"}},
+        "2": {"name": "city", "order": "2", "answer": "Zürich"},
+        "3": {"name": "colors", "order": "3", "answer": ["red", "blue"]},
+        "4": {"name": "age", "order": "4", "answer": 36},
+        "5": {"name": "header", "order": "5", "text": "About you"},
+    }
+    fake_api.submissions = [submission, make_submission(1, answers=3)]
+    catalog = select(make_tap(fake_api).catalog_dict, "submission_answers")
+    deselect(catalog, "submissions", ("properties", "answers"))
+
+    messages = run_sync(fake_api, catalog=catalog)
+    assert "answers" not in records(messages, "submissions")[0]  # noqa: S101
+    rows = records(messages, "submission_answers")
+    assert len(rows) == sum(len(s["answers"]) for s in fake_api.submissions)  # noqa: S101
+    assert [(row["submission_id"], row["qid"]) for row in rows[:5]] == [  # noqa: S101
+        ("5000000", qid) for qid in "12345"
+    ]
+    assert rows[0]["answer_json"] == '{"first": "Ada"}'  # noqa: S101
+    assert rows[1]["answer_text"] == "Zürich"  # noqa: S101
+    assert rows[2]["answer_items"] == ["red", "blue"]  # noqa: S101
+    assert rows[3]["answer_number"] == submission["answers"]["4"]["answer"]  # noqa: S101
+    assert rows[4]["text"] == "About you"  # noqa: S101
+    assert rows[4]["answer_text"] is None  # noqa: S101
+    assert rows[4]["order"] == int(submission["answers"]["5"]["order"])  # noqa: S101
+    assert rows[4]["created_at"] == submission["created_at"]  # noqa: S101
+
+    schemas = [
+        m
+        for m in messages
+        if m["type"] == "SCHEMA" and m["stream"] == "submission_answers"
+    ]
+    assert len(schemas) == 1  # noqa: S101
+    answers_requests = len(fake_api.requests)
+    fake_api.requests.clear()
+    run_sync(fake_api)
+    assert len(fake_api.requests) == answers_requests  # noqa: S101
+
+
+def test_incremental_submissions_by_default(fake_api: FakeJotform) -> None:
+    """New and updated submissions are both synced after the bookmark."""
+    fake_api.submissions = [make_submission(i, answers=1) for i in range(5)]
+    messages = run_sync(fake_api)
+    assert len(records(messages, "submissions")) == len(fake_api.submissions)  # noqa: S101
+    state = final_state(messages)
+    bookmark = state["bookmarks"]["submissions"]["replication_key_value"]
+    assert bookmark == fake_api.submissions[-1]["created_at"]  # noqa: S101
+
+    fake_api.submissions[0]["updated_at"] = "2024-03-01 00:00:00"
+    fake_api.submissions.append(
+        {
+            **make_submission(5, answers=1),
+            "created_at": "2024-03-02 00:00:00",
+        },
+    )
+    fake_api.requests.clear()
+    messages = run_sync(fake_api, state=state)
+    assert [r["id"] for r in records(messages, "submissions")] == [  # noqa: S101
+        "5000005",
+        "5000000",
+    ]
+    filters = {
+        parse_qs(urlsplit(path).query)["filter"][0]
+        for path in fake_api.paths("/user/submissions")
+    }
+    assert sorted(map(json.loads, filters), key=str) == [  # noqa: S101
+        {"created_at:gt": bookmark},
+        {"updated_at:gt": bookmark},
+    ]
+
+    fake_api.requests.clear()
+    messages = run_sync(fake_api, state=state, lookback_window_seconds=86400)
+    assert sorted(r["id"] for r in records(messages, "submissions")) == [  # noqa: S101
+        "5000000",
+        "5000004",
+        "5000005",
+    ]
+
+
+def test_interrupted_sync_resumes_from_checkpoint(fake_api: FakeJotform) -> None:
+    """A failed sync is resumed from the page it was reading."""
+    fake_api.submissions = [make_submission(i, answers=1) for i in range(35)]
+    catalog = select(make_tap(fake_api).catalog_dict, "submissions")
+    fake_api.fail_at_offset = 20
+    tap = make_tap(fake_api, catalog=catalog, page_sizes={"submissions": 10})
+    output = io.StringIO()
+    with redirect_stdout(output), pytest.raises(FatalAPIError):
+        tap.sync_all()
+    messages = [json.loads(line) for line in output.getvalue().splitlines()]
+    synced = [record["id"] for record in records(messages, "submissions")]
+    assert len(synced) == fake_api.fail_at_offset  # noqa: S101
+    state = final_state(messages)
+    assert state["bookmarks"]["submissions"]["resume"] == {  # noqa: S101
+        "filter": None,
+        "offset": 20,
+    }
+
+    fake_api.fail_at_offset = None
+    fake_api.requests.clear()
+    messages = run_sync(
+        fake_api, state=state, catalog=catalog, page_sizes={"submissions": 10}
+    )
+    offsets = [
+        parse_qs(urlsplit(path).query)["offset"][0]
+        for path in fake_api.paths("/user/submissions")
+    ]
+    assert offsets[0] == "20"  # noqa: S101
+    synced += [record["id"] for record in records(messages, "submissions")]
+    assert sorted(synced) == [submission["id"] for submission in fake_api.submissions]  # noqa: S101
+    assert "resume" not in final_state(messages)["bookmarks"]["submissions"]  # noqa: S101
+
+
+def test_adaptive_pages_are_checkpointed_after_their_children(
+    fake_api: FakeJotform,
+) -> None:
+    """Checkpoints never pass parent records still buffered for child prefetches."""
+    fake_api.forms = [make_form(i) for i in range(65)]
+    fake_api.questions = {form["id"]: make_questions(1) for form in fake_api.forms}
+    messages = run_sync(
+        fake_api,
+        page_sizes={"forms": 40},
+        adaptive_page_size={"enabled": True, "target_bytes": 1, "min_page_size": 10},
+        max_concurrent_requests=4,
+    )
+    limits = {
+        parse_qs(urlsplit(path).query)["limit"][0]
+        for path in fake_api.paths("/user/forms")
+    }
+    assert len(limits) > 1  # noqa: S101
+
+    emitted = 0
+    offsets = []
+    for message in messages:
+        if message["type"] == "RECORD" and message["stream"] == "forms":
+            emitted += 1
+        elif message["type"] == "STATE":
+            forms_state = message["value"]["bookmarks"].get("forms", {})
+            if "resume" in forms_state:
+                offsets.append(forms_state["resume"]["offset"])
+                assert offsets[-1] <= emitted  # noqa: S101
+    assert any(offsets)  # noqa: S101
+    assert len(records(messages, "questions")) == len(fake_api.forms)  # noqa: S101
+
+
+def test_fixtures_are_served(tmp_path: Path) -> None:
+    """Records of a fixture file are served by the fake API."""
+    dataset = make_dataset(3, submissions_per_form=4, questions_per_form=2)
+    fixtures = tmp_path / "fixtures.json"
+    fixtures.write_text(json.dumps(dataset))
+
+    api = FakeJotform(fixtures=fixtures)
+    api.start()
+    try:
+        messages = run_sync(api)
+    finally:
+        api.stop()
+    assert len(records(messages, "forms")) == len(dataset["forms"])  # noqa: S101
+    assert len(records(messages, "questions")) == 2 * len(dataset["forms"])  # noqa: S101
+    assert len(records(messages, "submissions")) == len(dataset["submissions"])  # noqa: S101
+    assert api.bytes_sent > 0  # noqa: S101
+
+
+def test_fast_output_writes_the_same_records(fake_api: FakeJotform) -> None:
+    """The fast output mode writes the same records as the SDK."""
+    fake_api.forms = [make_form(i) for i in range(3)]
+    fake_api.questions = {form["id"]: make_questions(2) for form in fake_api.forms}
+    fake_api.submissions = [
+        {**make_submission(i, answers=3), "unknown": "x"} for i in range(30)
+    ]
+    catalog = deselect(
+        select(make_tap(fake_api).catalog_dict, "submission_answers"),
+        "submissions",
+        ("properties", "ip"),
+    )
+
+    expected = run_sync(fake_api, catalog=catalog)
+    actual = run_sync(
+        fake_api,
+        catalog=catalog,
+        fast_output={"enabled": True, "buffer_size": 4096},
+    )
+    assert [message["type"] for message in actual] == [  # noqa: S101
+        message["type"] for message in expected
+    ]
+    for stream in ("forms", "questions", "submissions", "submission_answers"):
+        assert records(actual, stream) == records(expected, stream)  # noqa: S101
+    assert "ip" not in records(actual, "submissions")[0]  # noqa: S101
+    assert "unknown" not in records(actual, "submissions")[0]  # noqa: S101
+
+
+def batched_records(messages: list[dict[str, Any]], stream: str) -> list[Any]:
+    """Return the records in the batch files of a stream, in order."""
+    output: list[Any] = []
+    for message in messages:
+        if message["type"] == "BATCH" and message["stream"] == stream:
+            assert message["encoding"] == {"format": "jsonl", "compression": "gzip"}  # noqa: S101
+            for url in message["manifest"]:
+                with gzip.open(urlsplit(url).path) as file:
+                    output.extend(json.loads(line) for line in file)
+    return output
+
+
+def test_batch_streams_are_written_to_files(
+    fake_api: FakeJotform,
+    tmp_path: Path,
+) -> None:
+    """Streams in `batch_streams` write records to gzip-compressed JSONL files."""
+    fake_api.forms = [make_form(i) for i in range(3)]
+    fake_api.questions = {form["id"]: make_questions(2) for form in fake_api.forms}
+    fake_api.submissions = [make_submission(i, answers=3) for i in range(25)]
+    catalog = deselect(
+        make_tap(fake_api).catalog_dict,
+        "submissions",
+        ("properties", "ip"),
+    )
+    batch_size = 10
+
+    expected = run_sync(fake_api, catalog=catalog)
+    actual = run_sync(
+        fake_api,
+        catalog=catalog,
+        batch_config={
+            "encoding": {"format": "jsonl", "compression": "gzip"},
+            "storage": {"root": tmp_path.as_uri(), "prefix": "batch-"},
+            "batch_size": batch_size,
+        },
+        batch_streams=["submissions", "questions"],
+    )
+    for stream in ("questions", "submissions"):
+        assert not records(actual, stream)  # noqa: S101
+        assert batched_records(actual, stream) == records(expected, stream)  # noqa: S101
+    assert records(actual, "forms") == records(expected, "forms")  # noqa: S101
+    submission_batches = [
+        message
+        for message in actual
+        if message["type"] == "BATCH" and message["stream"] == "submissions"
+    ]
+    assert len(submission_batches) == len(fake_api.submissions) // batch_size + 1  # noqa: S101
+    assert final_state(actual) == final_state(expected)  # noqa: S101
+
+
+def test_emitted_versions_are_skipped(fake_api: FakeJotform, tmp_path: Path) -> None:
+    """Versions emitted by the previous sync are skipped when there is a bookmark."""
+    fake_api.submissions = [make_submission(i, answers=1) for i in range(5)]
+    deduplication = {"enabled": True, "index_dir": str(tmp_path)}
+    messages = run_sync(fake_api, deduplication=deduplication)
+    assert len(records(messages, "submissions")) == len(fake_api.submissions)  # noqa: S101
+    assert (tmp_path / "submissions.idx").exists()  # noqa: S101
+    state = final_state(messages)
+
+    fake_api.submissions[0]["updated_at"] = "2024-03-01 00:00:00"
+    messages = run_sync(
+        fake_api,
+        state=state,
+        deduplication=deduplication,
+        lookback_window_seconds=86400,
+    )
+    assert [r["id"] for r in records(messages, "submissions")] == ["5000000"]  # noqa: S101
+
+    messages = run_sync(fake_api, deduplication=deduplication)
+    assert len(records(messages, "submissions")) == len(fake_api.submissions)  # noqa: S101
@@ -0,0 +1,88 @@
+"""Tests for the HTTP transport adapters."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, override
+
+import pytest
+import requests
+
+from tap_jotform.transport import HTTP2Adapter
+from tests.fake_jotform import make_form
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from tests.fake_jotform import FakeJotform
+
+pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+
+class RecordingAdapter(HTTP2Adapter):
+    """An HTTP/2 adapter that keeps the last ``httpx`` response."""
+
+    incoming: Any = None
+
+    @override
+    def build_response(
+        self,
+        request: requests.PreparedRequest,
+        incoming: Any,
+    ) -> requests.Response:
+        self.incoming = incoming
+        return super().build_response(request, incoming)
+
+
+@pytest.fixture
+def adapter() -> Generator[RecordingAdapter, None, None]:
+    """Return an HTTP/2 adapter, closed after the test."""
+    adapter = RecordingAdapter(pool_size=2)
+    yield adapter
+    adapter.close()
+
+
+@pytest.fixture
+def session(adapter: RecordingAdapter) -> requests.Session:
+    """Return a session that sends requests through the HTTP/2 adapter."""
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def test_http2_responses(
+    fake_api: FakeJotform,
+    adapter: RecordingAdapter,
+    session: requests.Session,
+) -> None:
+    """Responses are read through the adapter and close the ``httpx`` response."""
+    fake_api.forms = [make_form(0)]
+    response = session.get(f"{fake_api.url}/user/forms")
+    assert response.json()["content"][0]["id"] == "1000"  # noqa: S101
+    assert adapter.incoming.is_closed  # noqa: S101
+
+    response = session.get(f"{fake_api.url}/user/forms", stream=True)
+    assert not adapter.incoming.is_closed  # noqa: S101
+    response.close()
+    assert adapter.incoming.is_closed  # noqa: S101
+
+
+def test_http2_proxies_are_used(
+    fake_api: FakeJotform,
+    session: requests.Session,
+) -> None:
+    """Requests go through the proxy of the session."""
+    unreachable = "http://127.0.0.1:9"
+    with pytest.raises(requests.ConnectionError):
+        session.get(f"{fake_api.url}/user/forms", proxies={"http": unreachable})
+    assert fake_api.requests == []  # noqa: S101
+
+
+def test_http2_verify_is_used(
+    fake_api: FakeJotform,
+    session: requests.Session,
+) -> None:
+    """The CA bundle of the session is loaded for the request."""
+    with pytest.raises(requests.exceptions.SSLError):
+        session.get(f"{fake_api.url}/user/forms", verify="/nonexistent/ca.pem")